@@ -0,0 +1,72 @@
+import json
+import random
+import timeit
+
+from pymfl.util import JSONDecoder
+
+# Compares decoding a large export response the way requests' Response.json() does
+# (bytes -> str -> stdlib json) against decoding the raw bytes with each available JSONDecoder backend.
+# Run from the repository root: python -m benchmark.json_decoder_benchmark
+
+NUMBER_OF_PLAYERS = 2_500
+NUMBER_OF_WEEKS = 18
+REPEATS = 20
+
+POSITIONS = ["QB", "RB", "WR", "TE", "PK", "Def"]
+TEAMS = ["ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GBP", "HOU", "IND", "JAC", "KCC"]
+
+
+def build_players_content() -> bytes:
+    """
+    Roughly the shape and size of get_players(details=1).
+    """
+    players = [{"id": str(10000 + i),
+                "name": f"Lastname{i}, Firstname{i}",
+                "position": random.choice(POSITIONS),
+                "team": random.choice(TEAMS),
+                "status": "R",
+                "birthdate": str(random.randint(600000000, 900000000)),
+                "college": f"College {i % 120}",
+                "height": str(random.randint(66, 80)),
+                "weight": str(random.randint(170, 330)),
+                "draft_year": str(random.randint(2005, 2022)),
+                "draft_round": str(random.randint(1, 7)),
+                "jersey": str(random.randint(1, 99))} for i in range(NUMBER_OF_PLAYERS)]
+    return json.dumps({"players": {"timestamp": "1660000000", "player": players}, "version": "1.0"}).encode()
+
+
+def build_player_scores_content() -> bytes:
+    """
+    Roughly the shape and size of get_player_scores(week="YTD").
+    """
+    player_scores = [{"id": str(10000 + i), "score": f"{random.uniform(0, 400):.2f}", "isAvailable": "0"}
+                     for i in range(NUMBER_OF_PLAYERS * NUMBER_OF_WEEKS // 4)]
+    return json.dumps({"playerScores": {"week": "YTD", "playerScore": player_scores}, "version": "1.0"}).encode()
+
+
+def response_json(content: bytes):
+    """
+    What requests' Response.json() does for a known utf-8 encoding.
+    """
+    return json.loads(content.decode("utf-8"))
+
+
+def main():
+    backends = {"requests Response.json()": response_json}
+    for loads in dict.fromkeys([json.loads, JSONDecoder.get_fastest_loads()]):
+        json_decoder = JSONDecoder(loads)
+        backends[f"JSONDecoder ({json_decoder.name})"] = json_decoder.decode
+
+    for payload_name, content in (("players (details)", build_players_content()),
+                                  ("playerScores (YTD)", build_player_scores_content())):
+        print(f"{payload_name}: {len(content) / 1024:,.0f} KiB")
+        baseline_seconds = None
+        for backend_name, decode in backends.items():
+            seconds = min(timeit.repeat(lambda: decode(content), number=1, repeat=REPEATS))
+            if baseline_seconds is None:
+                baseline_seconds = seconds
+            print(f"  {backend_name:<28} {seconds * 1000:8.2f} ms  ({baseline_seconds / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import asyncio
+
+from pymfl.api.aio import AsyncConnectionPool, AsyncScoringAndResultsAPIClient, AsyncCommonLeagueInfoAPIClient
+
+# The async API Clients mirror the blocking API Clients, but every method must be awaited.
+# They require aiohttp: pip install pymfl[async]
+# The api config is set up the same way as for the blocking API Clients (see the authentication example for more info).
+
+YEAR = 2020
+LEAGUE_IDS = ["123456", "234567", "345678"]
+
+
+async def main():
+    # At most 50 requests will be in flight at once, no matter how many calls are scheduled.
+    AsyncCommonLeagueInfoAPIClient.set_async_connection_pool(AsyncConnectionPool(max_concurrency=50))
+
+    live_scoring_responses: list[dict] = await asyncio.gather(
+        *(AsyncScoringAndResultsAPIClient.get_live_scoring(year=YEAR, league_id=league_id) for league_id in LEAGUE_IDS))
+    for league_id, live_scoring_response in zip(LEAGUE_IDS, live_scoring_responses):
+        print(league_id, live_scoring_response)
+
+    league_response: dict = await AsyncCommonLeagueInfoAPIClient.get_league(year=YEAR, league_id=LEAGUE_IDS[0])
+    print(league_response)
+
+    # Close the pooled connections when you are done.
+    await AsyncCommonLeagueInfoAPIClient.get_async_connection_pool().close()
+
+
+asyncio.run(main())
@@ -1,3 +1,5 @@
+from typing import Iterator, Iterable
+
 from pymfl.api.MFLAPIClient import MFLAPIClient
 
 
@@ -11,33 +13,54 @@ class FantasyContentAPIClient(MFLAPIClient):
         you'll need this data type for translating player IDs to player names.
         Our player database is updated at most once per day, and it contains more than 2,000 players.
         In other words, you're strongly encouraged to read this data type no more than once per day and store it locally as needed to optimize your system performance.
+        Long lists of players are fetched in chunks, in parallel, and merged into one response.
+        """
+        # responses are cached for a day (see ResponseCache.DEFAULT_TTL_SECONDS_BY_TYPE)
+        urls = [cls.__build_players_url(year=year, as_json=True, players=players, **kwargs)
+                for players in cls._chunk_ids(kwargs.pop("players", None))]
+        return cls._get_chunked_for_year_and_league_id(urls=urls, year=year, league_id=league_id)
+
+    @classmethod
+    def iter_players(cls, *, year: int, league_id: str, **kwargs) -> Iterator[dict[str, str]]:
         """
-        # TODO: caching for this method
-        filters = [("TYPE", "players"), ("JSON", 1)]
+        Streams the same players as get_players, yielding each player as soon as it has been read,
+        so memory stays flat even with complete player details.
+        Takes the same parameters as get_players.
+        """
+        url = cls.__build_players_url(year=year, as_json=False, **kwargs)
+        return cls._iter_for_year_and_league_id(url=url, year=year, league_id=league_id, tag="player")
+
+    @classmethod
+    def __build_players_url(cls, *, year: int, as_json: bool, **kwargs) -> str:
+        filters = [("TYPE", "players")]
+        if as_json:
+            filters.append(("JSON", 1))
         # Set this value to 1 to return complete player details, including player IDs from other sources.
         details: int = kwargs.pop("details", None)
         # Pass a unix timestamp via this parameter to receive only changes to the player database since that time.
         since: str = kwargs.pop("since", None)
-        # Pass a list of player ids separated by commas (or just a single player id) to receive back just the info on those players.
-        players: str = kwargs.pop("players", None)
+        # Pass a list of player ids separated by commas, a collection of player ids (or just a single player id) to receive back just the info on those players.
+        players: str | Iterable[str] = cls._join_ids(kwargs.pop("players", None))
         cls._add_filter_if_given("DETAILS", details, filters)
         cls._add_filter_if_given("SINCE", since, filters)
         cls._add_filter_if_given("PLAYERS", players, filters)
         url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
-        url = cls._add_filters(url, *filters)
-        return cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+        return cls._add_filters(url, *filters)
 
     @classmethod
-    def get_player_profile(cls, *, year: int, league_id: str, player_id_or_ids: str) -> dict:
+    def get_player_profile(cls, *, year: int, league_id: str, player_id_or_ids: str | Iterable[str]) -> dict:
         """
         Returns a summary of information regarding a player, including DOB, ADP ranking, height/weight.
+        Long lists of players are fetched in chunks, in parallel, and merged into one response.
 
-        player_id_or_ids: Player id or list of player ids separated by commas
+        player_id_or_ids: Player id, list of player ids separated by commas or a collection of player ids
         """
-        filters = [("TYPE", "playerProfile"), ("P", player_id_or_ids), ("JSON", 1)]
-        url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
-        url = cls._add_filters(url, *filters)
-        return cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+        urls = list()
+        for player_ids in cls._chunk_ids(player_id_or_ids):
+            filters = [("TYPE", "playerProfile"), ("P", player_ids), ("JSON", 1)]
+            url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
+            urls.append(cls._add_filters(url, *filters))
+        return cls._get_chunked_for_year_and_league_id(urls=urls, year=year, league_id=league_id)
 
     @classmethod
     def get_all_rules(cls, *, year: int, league_id: str) -> dict:
@@ -1,10 +1,13 @@
+from typing import Iterable
+
 from pymfl.api.MFLAPIClient import MFLAPIClient
 
 
 class LeaguePlayersAPIClient(MFLAPIClient):
 
     @classmethod
-    def get_player_roster_status(cls, *, year: int, league_id: str, player_id_or_ids: str, **kwargs) -> dict:
+    def get_player_roster_status(cls, *, year: int, league_id: str, player_id_or_ids: str | Iterable[str],
+                                 **kwargs) -> dict:
         """
         Get the player's current roster status.
         The franchise(s) the player is on are listed in the sub-element.
@@ -14,10 +17,10 @@ class LeaguePlayersAPIClient(MFLAPIClient):
         The R value is only provided when there's no lineup submitted or the caller has no visibility into the lineup.
         If the player is a free agent, there will be a 'is_fa' attribute on the parent element.
         In those cases the elements 'cant_add' and 'locked' attributes may be set indicating whether a player can't be added or is locked.
+        Long lists of players are fetched in chunks, in parallel, and merged into one response.
 
-        player_id_or_ids: Player id or list of player ids separated by commas
+        player_id_or_ids: Player id, list of player ids separated by commas or a collection of player ids
         """
-        filters = [("TYPE", "playerRosterStatus"), ("L", league_id), ("P", player_id_or_ids), ("JSON", 1)]
         # Week. If a week is specified, it returns the player status for that week.
         # The default is the current Live Scoring week.
         week: int = kwargs.pop("week", None)
@@ -26,11 +29,14 @@ class LeaguePlayersAPIClient(MFLAPIClient):
         # If not present it uses the user's franchise id.
         # Only matters on deluxe leagues.
         franchise_id: str = kwargs.pop("franchise_id", None)
-        cls._add_filter_if_given("W", week, filters)
-        cls._add_filter_if_given("F", franchise_id, filters)
-        url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
-        url = cls._add_filters(url, *filters)
-        return cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+        urls = list()
+        for player_ids in cls._chunk_ids(player_id_or_ids):
+            filters = [("TYPE", "playerRosterStatus"), ("L", league_id), ("P", player_ids), ("JSON", 1)]
+            cls._add_filter_if_given("W", week, filters)
+            cls._add_filter_if_given("F", franchise_id, filters)
+            url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
+            urls.append(cls._add_filters(url, *filters))
+        return cls._get_chunked_for_year_and_league_id(urls=urls, year=year, league_id=league_id)
 
     @classmethod
     def get_contest_players(cls, *, year: int, league_id: str, **kwargs) -> dict:
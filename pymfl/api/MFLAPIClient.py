@@ -1,14 +1,22 @@
+import contextvars
+import math
+import time
 import xml.etree.ElementTree as ET
 from abc import ABC
-from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Any, Iterator, Iterable
+from urllib.parse import urlparse
 
-import requests
-from requests import Response
+from requests import Response, HTTPError
 
-from pymfl.api.config import APIConfig
-from pymfl.enum import APIResponseType
+from pymfl.api.cache import ResponseCache, HistoricalResponseStore, ValidatorCache, ValidatedResponse
+from pymfl.api.config import APIConfig, YearAPIConfig
+from pymfl.api.transport import ConnectionPool, SingleFlight, RateLimiter, RetryPolicy, CircuitBreaker, HostResolver, \
+    RequestTimeout, Deadline
+from pymfl.enum import APIResponseType, AuthMode
 from pymfl.exception import MFLAPIClientException
-from pymfl.util import ConfigReader
+from pymfl.util import ConfigReader, JSONDecoder, XMLRecordParser, ResponseView, RecordConverter
 
 
 class MFLAPIClient(ABC):
@@ -16,12 +24,202 @@ class MFLAPIClient(ABC):
     Should be inherited by all API Clients.
     Sleeper API Documentation: https://api.myfantasyleague.com/2022/api_info
     """
-    __API_CONFIG = APIConfig
+    _API_CONFIG: type[APIConfig] = APIConfig
+    _CONNECTION_POOL = ConnectionPool()
+    _RESPONSE_CACHE: Optional[ResponseCache] = None
+    _HISTORICAL_RESPONSE_STORE: Optional[HistoricalResponseStore] = None
+    _VALIDATOR_CACHE: Optional[ValidatorCache] = None
+    _SINGLE_FLIGHT = SingleFlight()
+    _RATE_LIMITER = RateLimiter()
+    _RETRY_POLICY = RetryPolicy()
+    _CIRCUIT_BREAKER = CircuitBreaker()
+    _HOST_RESOLVER = HostResolver()
+    _JSON_DECODER = JSONDecoder()
     _MFL_APP_BASE_URL = ConfigReader.get("api", "mfl_app_base_url")
+    _STREAM_CHUNK_SIZE = 64 * 1024
+    # MFL error payloads are small, so only lazy responses up to this size are decoded up front to check for errors
+    _LAZY_ERROR_CHECK_MAX_BYTES = 4096
+    _LAZY_RESPONSES = contextvars.ContextVar("lazy_responses", default=False)
+    _BYPASS_RESPONSE_CACHE = contextvars.ContextVar("bypass_response_cache", default=False)
+    _REQUEST_TIMEOUT = RequestTimeout()
+    _REQUEST_TIMEOUT_OVERRIDE = contextvars.ContextVar("request_timeout", default=None)
+    # player ids are at most 5 digits, so a chunk keeps export urls well under the ~2,000 characters servers accept
+    _ID_CHUNK_SIZE = 100
+    _MAX_CHUNK_CONCURRENCY = 4
+    # MFL error messages for exports that require a logged in user
+    _AUTH_ERROR_MARKERS = ("logged in", "login", "not authorized")
+
+    # set on API Clients bound to an MFLClient (see MFLClient.bind)
+    _MFL_CLIENT = None
 
     # ROUTES
     _EXPORT_ROUTE = ConfigReader.get("api", "export_route")
 
+    @classmethod
+    def _set_state(cls, name: str, value: Any, *, owner: Optional[type["MFLAPIClient"]] = None):
+        """
+        Sets the given class attribute (i.e. "_RESPONSE_CACHE") on owner (defaults to MFLAPIClient), for all API Clients,
+        or, for an API Client bound to an MFLClient, on that client's API Clients only.
+        """
+        if cls._MFL_CLIENT is not None:
+            cls._MFL_CLIENT._set_state(name, value)
+        else:
+            setattr(owner if owner is not None else MFLAPIClient, name, value)
+
+    @classmethod
+    def get_connection_pool(cls) -> ConnectionPool:
+        return cls._CONNECTION_POOL
+
+    @classmethod
+    def set_connection_pool(cls, connection_pool: ConnectionPool):
+        """
+        Replaces the ConnectionPool used by all API Clients.
+        The previous pool is not closed, as it may be shared elsewhere.
+        """
+        cls._set_state("_CONNECTION_POOL", connection_pool)
+
+    @classmethod
+    def get_response_cache(cls) -> Optional[ResponseCache]:
+        return cls._RESPONSE_CACHE
+
+    @classmethod
+    def set_response_cache(cls, response_cache: Optional[ResponseCache]):
+        """
+        Sets the ResponseCache used by all API Clients.
+        There is none by default, as its responses are shared between callers; pass None to stop using one.
+        """
+        cls._set_state("_RESPONSE_CACHE", response_cache)
+
+    @classmethod
+    def get_historical_response_store(cls) -> Optional[HistoricalResponseStore]:
+        return cls._HISTORICAL_RESPONSE_STORE
+
+    @classmethod
+    def set_historical_response_store(cls, historical_response_store: Optional[HistoricalResponseStore]):
+        """
+        Sets the HistoricalResponseStore used by all API Clients to persist responses of completed seasons.
+        There is none by default, pass None to stop using one.
+        """
+        cls._set_state("_HISTORICAL_RESPONSE_STORE", historical_response_store)
+
+    @classmethod
+    def get_validator_cache(cls) -> Optional[ValidatorCache]:
+        return cls._VALIDATOR_CACHE
+
+    @classmethod
+    def set_validator_cache(cls, validator_cache: Optional[ValidatorCache]):
+        """
+        Sets the ValidatorCache used by all API Clients for conditional requests.
+        There is none by default, as its results are shared between callers; pass None to stop using one.
+        """
+        cls._set_state("_VALIDATOR_CACHE", validator_cache)
+
+    @classmethod
+    def get_rate_limiter(cls) -> RateLimiter:
+        return cls._RATE_LIMITER
+
+    @classmethod
+    def set_rate_limiter(cls, rate_limiter: RateLimiter):
+        """
+        Replaces the RateLimiter shared by all API Clients.
+        """
+        cls._set_state("_RATE_LIMITER", rate_limiter)
+
+    @classmethod
+    def get_retry_policy(cls) -> RetryPolicy:
+        return cls._RETRY_POLICY
+
+    @classmethod
+    def set_retry_policy(cls, retry_policy: RetryPolicy):
+        """
+        Replaces the RetryPolicy used by all API Clients for export requests.
+        """
+        cls._set_state("_RETRY_POLICY", retry_policy)
+
+    @classmethod
+    def get_circuit_breaker(cls) -> CircuitBreaker:
+        return cls._CIRCUIT_BREAKER
+
+    @classmethod
+    def set_circuit_breaker(cls, circuit_breaker: CircuitBreaker):
+        """
+        Replaces the CircuitBreaker shared by all API Clients.
+        """
+        cls._set_state("_CIRCUIT_BREAKER", circuit_breaker)
+
+    @classmethod
+    def get_host_resolver(cls) -> HostResolver:
+        return cls._HOST_RESOLVER
+
+    @classmethod
+    def set_host_resolver(cls, host_resolver: HostResolver):
+        """
+        Replaces the HostResolver used by all API Clients to send league requests straight to the league's home host.
+        """
+        cls._set_state("_HOST_RESOLVER", host_resolver)
+
+    @classmethod
+    def get_json_decoder(cls) -> JSONDecoder:
+        return cls._JSON_DECODER
+
+    @classmethod
+    def set_json_decoder(cls, json_decoder: JSONDecoder):
+        """
+        Replaces the JSONDecoder used by all API Clients to decode JSON responses.
+        """
+        cls._set_state("_JSON_DECODER", json_decoder)
+
+    @classmethod
+    def get_request_timeout(cls) -> RequestTimeout:
+        return cls._REQUEST_TIMEOUT
+
+    @classmethod
+    def set_request_timeout(cls, request_timeout: RequestTimeout):
+        """
+        Replaces the default RequestTimeout of every request made by all API Clients.
+        """
+        cls._set_state("_REQUEST_TIMEOUT", request_timeout)
+
+    @classmethod
+    @contextmanager
+    def request_timeout(cls, request_timeout: RequestTimeout):
+        """
+        Within this context, requests use the given RequestTimeout instead of the default one.
+        The setting is per thread / async task.
+        """
+        token = MFLAPIClient._REQUEST_TIMEOUT_OVERRIDE.set(request_timeout)
+        try:
+            yield
+        finally:
+            MFLAPIClient._REQUEST_TIMEOUT_OVERRIDE.reset(token)
+
+    @classmethod
+    @contextmanager
+    def lazy_responses(cls, enabled: bool = True):
+        """
+        Within this context, API Clients return a lazily decoded ResponseView instead of a dict for JSON responses.
+        The setting is per thread / async task.
+        """
+        token = MFLAPIClient._LAZY_RESPONSES.set(enabled)
+        try:
+            yield
+        finally:
+            MFLAPIClient._LAZY_RESPONSES.reset(token)
+
+    @classmethod
+    @contextmanager
+    def bypass_response_cache(cls, enabled: bool = True):
+        """
+        Within this context, API Clients neither read responses from nor store responses in the ResponseCache,
+        i.e. for syncs that must see the current data.
+        The setting is per thread / async task.
+        """
+        token = MFLAPIClient._BYPASS_RESPONSE_CACHE.set(enabled)
+        try:
+            yield
+        finally:
+            MFLAPIClient._BYPASS_RESPONSE_CACHE.reset(token)
+
     @classmethod
     def _build_route(cls, base_url: str, *args) -> str:
         args = (str(arg).replace("/", "") for arg in args)
@@ -51,33 +249,370 @@ class MFLAPIClient(ABC):
     @classmethod
     def _get_for_year_and_league_id(cls, *, url: str, year: int, league_id: str,
                                     api_response_type: APIResponseType = APIResponseType.JSON) -> dict | bytes:
-        response = cls.__get_response_for_year_and_league_id(url=url, year=year, league_id=league_id)
+        try:
+            return cls.__get_for_year_and_league_id(url=url, year=year, league_id=league_id,
+                                                    api_response_type=api_response_type)
+        except Exception as e:
+            if not cls._is_auth_error(e) or not cls._refresh_api_config(year=year, league_id=league_id):
+                raise
+        # MFL no longer accepted the MFL_USER_ID, so the request is sent once more after logging in again
+        return cls.__get_for_year_and_league_id(url=url, year=year, league_id=league_id,
+                                                api_response_type=api_response_type)
+
+    @classmethod
+    def __get_for_year_and_league_id(cls, *, url: str, year: int, league_id: str,
+                                     api_response_type: APIResponseType) -> dict | bytes:
+        api_response_type = cls._resolve_api_response_type(api_response_type)
+        stored_response = cls._get_stored_response(url=url, year=year, league_id=league_id,
+                                                   api_response_type=api_response_type)
+        if stored_response is not None:
+            return stored_response
+        # identical requests (same url, user and response type) already in flight on other threads are shared
+        api_config = cls._get_api_config(year=year, league_id=league_id)
+        single_flight_key = (ResponseCache.canonicalize(url), api_config.user_context, api_response_type)
+        return cls._SINGLE_FLIGHT.do(single_flight_key,
+                                     lambda: cls.__fetch_for_year_and_league_id(url=url,
+                                                                                year=year,
+                                                                                league_id=league_id,
+                                                                                api_response_type=api_response_type))
+
+    @classmethod
+    def __fetch_for_year_and_league_id(cls, *, url: str, year: int, league_id: str,
+                                       api_response_type: APIResponseType) -> dict | bytes:
+        api_config = cls._get_api_config(year=year, league_id=league_id)
+        validator_context = (api_config.user_context, api_response_type)
+        validated_response = None
+        if cls._VALIDATOR_CACHE is not None:
+            validated_response = cls._VALIDATOR_CACHE.get(url, context=validator_context)
+        # caches are keyed by the given url, only the request itself goes to the league's home host
+        request_url = cls._build_request_url(url, year=year, league_id=league_id)
+        response = cls.__get_response_for_year_and_league_id(
+            url=request_url, year=year, league_id=league_id,
+            headers=ValidatorCache.get_conditional_headers(validated_response))
+        cls._HOST_RESOLVER.learn_from_response(response, url=request_url, year=year, league_id=league_id)
+        if response.status_code == 304 and validated_response is not None:
+            # the previous content is not re-sent, so there is nothing new to store on disk
+            cls._VALIDATOR_CACHE.record_reused_result()
+            cls._store_response(url=url, year=year, league_id=league_id, api_response_type=api_response_type,
+                                content=None, result=validated_response.result)
+            return validated_response.result
+        content_hash = ValidatorCache.hash_content(response.content)
+        if validated_response is not None and validated_response.content_hash == content_hash:
+            cls._VALIDATOR_CACHE.record_reused_result()
+            result = validated_response.result
+        else:
+            result = cls._decode_content(response.content, api_response_type)
+        cls._learn_home_host(url=url, year=year, league_id=league_id, result=result)
+        if cls._VALIDATOR_CACHE is not None:
+            cls._VALIDATOR_CACHE.put(url,
+                                     ValidatedResponse(etag=response.headers.get("ETag"),
+                                                       last_modified=response.headers.get("Last-Modified"),
+                                                       content_hash=content_hash,
+                                                       result=result,
+                                                       size_bytes=len(response.content)),
+                                     context=validator_context)
+        cls._store_response(url=url, year=year, league_id=league_id, api_response_type=api_response_type,
+                            content=response.content, result=result)
+        return result
+
+    @classmethod
+    def _get_chunked_for_year_and_league_id(cls, *, urls: list[str], year: int,
+                                            league_id: str) -> dict | ResponseView:
+        """
+        Fetches the given urls, each for one chunk of a list of ids (see _chunk_ids), in parallel
+        and merges their responses into one response of the same shape.
+        """
+        if len(urls) == 1:
+            return cls._get_for_year_and_league_id(url=urls[0], year=year, league_id=league_id)
+        with ThreadPoolExecutor(max_workers=min(len(urls), cls._MAX_CHUNK_CONCURRENCY)) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, cls._get_for_year_and_league_id,
+                                       url=url, year=year, league_id=league_id) for url in urls]
+            return cls._merge_chunked_responses([future.result() for future in futures])
+
+    @staticmethod
+    def _join_ids(ids: Optional[str | Iterable[str]]) -> Optional[str]:
+        """
+        Returns the given ids separated by commas, as MFL expects them.
+        """
+        if ids is None or isinstance(ids, str):
+            return ids
+        return ",".join(str(id_) for id_ in ids)
+
+    @classmethod
+    def _chunk_ids(cls, ids: Optional[str | Iterable[str]], *, count: Optional[int] = None) -> list[Optional[str]]:
+        """
+        Splits the given ids (separated by commas or as a collection) into evenly sized chunks
+        of at most _ID_CHUNK_SIZE ids, each separated by commas.
+        Returns a single chunk (or None if no ids are given) when there are no more ids than that.
+
+        count: The COUNT filter of the request. MFL would apply it to each chunk rather than to the merged response,
+               so a ValueError is raised if it is given with more than one chunk.
+        """
+        if ids is None:
+            return [None]
+        split_ids = ids.split(",") if isinstance(ids, str) else [str(id_) for id_ in ids]
+        split_ids = list(dict.fromkeys(id_.strip() for id_ in split_ids if id_.strip()))
+        if len(split_ids) <= cls._ID_CHUNK_SIZE:
+            return [cls._join_ids(ids)]
+        if count is not None:
+            raise ValueError(f"count cannot be given with more than {cls._ID_CHUNK_SIZE} ids.")
+        chunk_count = math.ceil(len(split_ids) / cls._ID_CHUNK_SIZE)
+        chunk_size = math.ceil(len(split_ids) / chunk_count)
+        return [",".join(split_ids[i:i + chunk_size]) for i in range(0, len(split_ids), chunk_size)]
+
+    @staticmethod
+    def _merge_chunked_responses(responses: list[dict | ResponseView]) -> dict | ResponseView:
+        """
+        Merges responses for chunks of the same request.
+        Records (objects or lists of objects) within each top-level element are concatenated,
+        anything else is taken from the first response.
+        Lazy responses are merged into a ResponseView, so the type does not depend on the number of chunks.
+        """
+        if any(isinstance(response, ResponseView) for response in responses):
+            return ResponseView(data=MFLAPIClient._merge_chunked_responses(
+                [response.to_dict() if isinstance(response, ResponseView) else response for response in responses]))
+        merged_response = dict(responses[0])
+        for key, value in responses[0].items():
+            if not isinstance(value, dict):
+                continue
+            merged_element = dict(value)
+            record_keys = {record_key for response in responses
+                           for record_key, records in response.get(key, dict()).items()
+                           if isinstance(records, (dict, list))}
+            for record_key in record_keys:
+                records = list()
+                for response in responses:
+                    records.extend(RecordConverter.as_list(response.get(key, dict()).get(record_key)))
+                merged_element[record_key] = records[0] if len(records) == 1 else records
+            merged_response[key] = merged_element
+        return merged_response
+
+    @classmethod
+    def _iter_for_year_and_league_id(cls, *, url: str, year: int, league_id: str, tag: str) -> Iterator[dict[str, str]]:
+        """
+        Streams the given XML export url, yielding the attributes of each record element with the given tag
+        as soon as it has been read, instead of buffering and decoding the whole response.
+        The request is sent once iteration starts. Streamed responses are not cached.
+        Within a Deadline, reading stops with a DeadlineExceededException once it has passed.
+        """
+        request_url = cls._build_request_url(url, year=year, league_id=league_id)
+        response = cls.__get_response_for_year_and_league_id(url=request_url, year=year, league_id=league_id,
+                                                              stream=True)
+        try:
+            cls._HOST_RESOLVER.learn_from_response(response, url=request_url, year=year, league_id=league_id)
+            parser = XMLRecordParser(tag)
+            for chunk in response.iter_content(chunk_size=cls._STREAM_CHUNK_SIZE):
+                # the read timeout only bounds each read, so a slowly sent body is bounded here
+                Deadline.check_current()
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        finally:
+            response.close()
+
+    @classmethod
+    def _get_stored_response(cls, *, url: str, year: int, league_id: str,
+                             api_response_type: APIResponseType) -> Optional[dict | bytes]:
+        """
+        Returns the response for the given url from the ResponseCache or the HistoricalResponseStore,
+        or None if it has to be fetched.
+        """
+        api_config = cls._get_api_config(year=year, league_id=league_id)
+        cache_context = (api_config.user_context, api_response_type)
+        if cls._BYPASS_RESPONSE_CACHE.get():
+            return None
+        response_cache = cls._RESPONSE_CACHE
+        if response_cache is not None:
+            cached_response = response_cache.get(url, context=cache_context)
+            if cached_response is not None:
+                return cached_response
+        if cls._HISTORICAL_RESPONSE_STORE is not None and cls._HISTORICAL_RESPONSE_STORE.is_completed_season(year):
+            content = cls._HISTORICAL_RESPONSE_STORE.get(url, context=api_config.user_context)
+            if content is not None:
+                result = cls._decode_content(content, api_response_type)
+                if response_cache is not None:
+                    response_cache.put(url, result, context=cache_context)
+                return result
+        return None
+
+    @classmethod
+    def _store_response(cls, *, url: str, year: int, league_id: str, api_response_type: APIResponseType,
+                        content: Optional[bytes], result: dict | bytes):
+        """
+        Stores a successful response in the ResponseCache and, for completed seasons, the HistoricalResponseStore.
+        """
+        api_config = cls._get_api_config(year=year, league_id=league_id)
+        if cls._RESPONSE_CACHE is not None and not cls._BYPASS_RESPONSE_CACHE.get():
+            cls._RESPONSE_CACHE.put(url, result, context=(api_config.user_context, api_response_type))
+        if cls._HISTORICAL_RESPONSE_STORE is not None and content is not None:
+            cls._HISTORICAL_RESPONSE_STORE.put(url, content, year=year, context=api_config.user_context)
+
+    @classmethod
+    def _resolve_api_response_type(cls, api_response_type: APIResponseType) -> APIResponseType:
+        if api_response_type == APIResponseType.JSON and cls._LAZY_RESPONSES.get():
+            return APIResponseType.LAZY
+        return api_response_type
+
+    @classmethod
+    def _decode_content(cls, content: bytes, api_response_type: APIResponseType) -> dict | bytes | ResponseView:
         if api_response_type == APIResponseType.JSON:
-            json_response = response.json()
-            if "error" in json_response:
-                raise MFLAPIClientException(json_response["error"])
-            return json_response
-        elif api_response_type == APIResponseType.CONTENT:
-            return response.content
-
-    @classmethod
-    def __get_response_for_year_and_league_id(cls, *, url: str, year: int, league_id: str) -> Response:
-        api_config = cls.__API_CONFIG.get_config_by_year_and_league_id(year=year, league_id=league_id)
-        cookies = {"MFL_LAST_LEAGUE_ID": api_config.league_id, "MFL_USER_ID": api_config.mfl_user_id}
-        response = requests.get(url, cookies=cookies)
+            return cls._check_json_response(cls._JSON_DECODER.decode(content))
+        if api_response_type == APIResponseType.LAZY:
+            response_view = ResponseView(content, json_decoder=cls._JSON_DECODER)
+            if len(content) <= cls._LAZY_ERROR_CHECK_MAX_BYTES:
+                cls._check_json_response(response_view)
+            return response_view
+        return content
+
+    @classmethod
+    def _learn_home_host(cls, *, url: str, year: int, league_id: str, result: dict | bytes):
+        """
+        Remembers the league's home host if the given result is a league export.
+        """
+        if isinstance(result, (dict, ResponseView)) and ResponseCache.get_type(url) == "league":
+            cls._HOST_RESOLVER.learn_from_league(result, year=year, league_id=league_id)
+
+    @staticmethod
+    def _check_json_response(json_response: dict | ResponseView) -> dict | ResponseView:
+        """
+        Raises an MFLAPIClientException if the given JSON response is an MFL error payload.
+        """
+        if "error" in json_response:
+            raise MFLAPIClientException(json_response["error"])
+        return json_response
+
+    @staticmethod
+    def _check_xml_response(xml_response: ET.Element) -> ET.Element:
+        """
+        Raises an MFLAPIClientException if the given XML response is an MFL error payload.
+        """
+        if xml_response.tag == "error":
+            raise MFLAPIClientException(xml_response.text)
+        return xml_response
+
+    @classmethod
+    def _get_request_timeout(cls) -> RequestTimeout:
+        """
+        Returns the RequestTimeout for a request about to be sent, bounded by the current Deadline.
+        Raises a DeadlineExceededException if that deadline has passed.
+        """
+        Deadline.check_current()
+        request_timeout = cls._REQUEST_TIMEOUT_OVERRIDE.get() or cls._REQUEST_TIMEOUT
+        return request_timeout.bounded_by(Deadline.get_current())
+
+    @classmethod
+    def _get_api_config(cls, *, year: int, league_id: str) -> YearAPIConfig:
+        return cls._API_CONFIG.get_config_by_year_and_league_id(year=year, league_id=league_id)
+
+    @classmethod
+    def _refresh_api_config(cls, *, year: int, league_id: str) -> bool:
+        """
+        Logs in again for the given year and league.
+        Returns False if that is not possible.
+        """
+        return cls._API_CONFIG.refresh_config_for_year_and_league_id(year=year, league_id=league_id)
+
+    @classmethod
+    def _is_auth_error(cls, exception: Exception) -> bool:
+        """
+        Whether the given exception means MFL did not accept the MFL_USER_ID (i.e. because the login expired).
+        """
+        if isinstance(exception, MFLAPIClientException):
+            return any(marker in str(exception).lower() for marker in cls._AUTH_ERROR_MARKERS)
+        if isinstance(exception, HTTPError):
+            return exception.response is not None and exception.response.status_code in (401, 403)
+        # aiohttp.ClientResponseError
+        return getattr(exception, "status", None) in (401, 403)
+
+    @classmethod
+    def _build_request_url(cls, url: str, *, year: int, league_id: str) -> str:
+        """
+        Returns the url to actually request for the given export url:
+        on the league's home host and, for APIKEY configs, with the APIKEY.
+        """
+        request_url = cls._HOST_RESOLVER.resolve_url(url, year=year, league_id=league_id)
+        api_config = cls._get_api_config(year=year, league_id=league_id)
+        if api_config.auth_mode == AuthMode.API_KEY:
+            symbol = "&" if "?" in request_url else "?"
+            request_url = f"{request_url}{symbol}APIKEY={api_config.api_key}"
+        return request_url
+
+    @classmethod
+    def _get_cookies_for_year_and_league_id(cls, *, year: int, league_id: str) -> dict[str, str]:
+        api_config = cls._get_api_config(year=year, league_id=league_id)
+        cookies = {"MFL_LAST_LEAGUE_ID": api_config.league_id}
+        if api_config.auth_mode == AuthMode.LOGIN:
+            cookies["MFL_USER_ID"] = api_config.mfl_user_id
+        return cookies
+
+    @classmethod
+    def _get_headers_for_year_and_league_id(cls, *, year: int, league_id: str) -> dict[str, str]:
+        api_config = cls._get_api_config(year=year, league_id=league_id)
+        return {"User-Agent": api_config.user_agent_name}
+
+    @classmethod
+    def __get_response_for_year_and_league_id(cls, *, url: str, year: int, league_id: str,
+                                              headers: Optional[dict[str, str]] = None,
+                                              stream: bool = False) -> Response:
+        cookies = cls._get_cookies_for_year_and_league_id(year=year, league_id=league_id)
+        headers = {**cls._get_headers_for_year_and_league_id(year=year, league_id=league_id), **(headers or dict())}
+        user = cls._get_api_config(year=year, league_id=league_id).user_context
+        host = urlparse(url).netloc
+        # exports are idempotent GETs, so server errors and dropped connections are retried with backoff
+        for attempt in range(cls._RETRY_POLICY.max_retries + 1):
+            cls._CIRCUIT_BREAKER.before_request(host)
+            try:
+                response = cls.__get_rate_limited_response(url=url, host=host, user=user, cookies=cookies,
+                                                           headers=headers, stream=stream)
+            except BaseException as e:
+                if not isinstance(e, Exception) or not cls._RETRY_POLICY.is_retryable_exception(e):
+                    # i.e. the deadline passed before sending, so a half-open trial says nothing about the host
+                    cls._CIRCUIT_BREAKER.release(host)
+                    raise
+                cls._CIRCUIT_BREAKER.on_failure(host)
+                if attempt == cls._RETRY_POLICY.max_retries:
+                    raise
+            else:
+                if not cls._RETRY_POLICY.is_retryable_response(response):
+                    cls._CIRCUIT_BREAKER.on_success(host)
+                    break
+                cls._CIRCUIT_BREAKER.on_failure(host)
+                if attempt == cls._RETRY_POLICY.max_retries:
+                    break
+                response.close()
+            delay_seconds = cls._RETRY_POLICY.get_delay_seconds(attempt)
+            Deadline.check_current_allows_wait(delay_seconds,
+                                               "The deadline would pass before the request could be retried.")
+            time.sleep(delay_seconds)
         response.raise_for_status()
         return response
 
-    @staticmethod
-    def _post(url: str, body: dict = None, **kwargs) -> dict | ET.Element:
+    @classmethod
+    def __get_rate_limited_response(cls, *, url: str, host: str, user: str, cookies: dict[str, str],
+                                    headers: dict[str, str], stream: bool) -> Response:
+        # throttled requests are queued behind the rate limiter and retried rather than failing
+        for attempt in range(cls._RATE_LIMITER.max_throttle_retries + 1):
+            cls._RATE_LIMITER.acquire(host, user)
+            response = cls._CONNECTION_POOL.get(url, cookies=cookies, headers=headers, stream=stream,
+                                                timeout=cls._get_request_timeout().as_tuple())
+            retry_after_seconds = RateLimiter.get_retry_after_seconds(response)
+            if retry_after_seconds is None:
+                cls._RATE_LIMITER.on_success(host, user)
+                break
+            cls._RATE_LIMITER.on_throttled(host, user, retry_after_seconds)
+            if attempt < cls._RATE_LIMITER.max_throttle_retries:
+                response.close()
+        return response
+
+    @classmethod
+    def _post(cls, url: str, body: dict = None, **kwargs) -> dict | ET.Element:
         if body is None:
             body = dict()
         as_xml = kwargs.pop("as_xml")
-        response = requests.post(url, data=body)
+        user_agent_name = kwargs.pop("user_agent_name", None)
+        headers = {"User-Agent": user_agent_name} if user_agent_name is not None else None
+        response = cls._CONNECTION_POOL.post(url, data=body, headers=headers,
+                                             timeout=cls._get_request_timeout().as_tuple())
         response.raise_for_status()
         if as_xml:
-            xml_response = ET.fromstring(response.content)
-            if xml_response.tag == "error":
-                raise MFLAPIClientException(xml_response.text)
-            return xml_response
-        return response.json()
+            return cls._check_xml_response(ET.fromstring(response.content))
+        return cls._JSON_DECODER.decode(response.content)
@@ -0,0 +1,143 @@
+import threading
+from typing import Optional, TypeVar, Any
+
+from pymfl.api.CommonLeagueInfoAPIClient import CommonLeagueInfoAPIClient
+from pymfl.api.CommunicationsAPIClient import CommunicationsAPIClient
+from pymfl.api.DraftAndAuctionAPIClient import DraftAndAuctionAPIClient
+from pymfl.api.FantasyContentAPIClient import FantasyContentAPIClient
+from pymfl.api.LeaguePlayersAPIClient import LeaguePlayersAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.NFLContentAPIClient import NFLContentAPIClient
+from pymfl.api.OtherLeagueInfoAPIClient import OtherLeagueInfoAPIClient
+from pymfl.api.ScoringAndResultsAPIClient import ScoringAndResultsAPIClient
+from pymfl.api.SessionAPIClient import SessionAPIClient
+from pymfl.api.TransactionsAPIClient import TransactionsAPIClient
+from pymfl.api.UserFunctionsAPIClient import UserFunctionsAPIClient
+from pymfl.api.cache import ResponseCache, HistoricalResponseStore, ValidatorCache
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import ConnectionPool, SingleFlight, RateLimiter, RetryPolicy, CircuitBreaker, HostResolver, \
+    RequestTimeout
+from pymfl.util import JSONDecoder
+
+T = TypeVar("T", bound=type[MFLAPIClient])
+
+
+class MFLClient:
+    """
+    A client with its own configs, connection pool, caches and transport policies, so differently configured clients
+    (i.e. one per tenant or worker thread) can run side by side in one process without sharing any state.
+
+    Every endpoint group is exposed as an API Client bound to this client, with the same methods as the
+    API Client it mirrors, i.e. MFLClient().scoring_and_results.get_live_scoring(year=..., league_id=...).
+    The API Client classmethods remain a facade over the default, process-wide state.
+
+    Any connection pool, cache or transport policy not given defaults to a new one for this client alone
+    (no ResponseCache, HistoricalResponseStore or ValidatorCache is used unless one is given).
+    The set_ methods of bound API Clients replace this client's state only.
+
+    api_config: The APIConfig to look configs up in, defaults to APIConfig.new_isolated(),
+                which logs in through this client (its base url, connection pool and request timeout).
+                Pass APIConfig itself to share the default configs.
+    base_url: The MFL base url, defaults to the one of the default client.
+    """
+
+    def __init__(self, *, api_config: Optional[type[APIConfig]] = None,
+                 connection_pool: Optional[ConnectionPool] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 historical_response_store: Optional[HistoricalResponseStore] = None,
+                 validator_cache: Optional[ValidatorCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 host_resolver: Optional[HostResolver] = None,
+                 json_decoder: Optional[JSONDecoder] = None,
+                 request_timeout: Optional[RequestTimeout] = None,
+                 async_connection_pool: Optional[Any] = None,
+                 base_url: Optional[str] = None):
+        self.__api_config = api_config if api_config is not None else APIConfig.new_isolated()
+        self.__overrides = {
+            "_API_CONFIG": self.__api_config,
+            "_CONNECTION_POOL": connection_pool if connection_pool is not None else ConnectionPool(),
+            "_RESPONSE_CACHE": response_cache,
+            "_HISTORICAL_RESPONSE_STORE": historical_response_store,
+            "_VALIDATOR_CACHE": validator_cache,
+            "_SINGLE_FLIGHT": SingleFlight(),
+            "_RATE_LIMITER": rate_limiter if rate_limiter is not None else RateLimiter(),
+            "_RETRY_POLICY": retry_policy if retry_policy is not None else RetryPolicy(),
+            "_CIRCUIT_BREAKER": circuit_breaker if circuit_breaker is not None else CircuitBreaker(),
+            "_HOST_RESOLVER": host_resolver if host_resolver is not None else HostResolver(),
+            "_JSON_DECODER": json_decoder if json_decoder is not None else MFLAPIClient.get_json_decoder(),
+            "_REQUEST_TIMEOUT": request_timeout if request_timeout is not None else RequestTimeout(),
+            "_MFL_APP_BASE_URL": base_url if base_url is not None else MFLAPIClient._MFL_APP_BASE_URL
+        }
+        self.__async_connection_pool = async_connection_pool
+        self.__lock = threading.Lock()
+        self.__bound_api_client_by_api_client: dict[type[MFLAPIClient], type[MFLAPIClient]] = dict()
+
+        self.common_league_info = self.bind(CommonLeagueInfoAPIClient)
+        self.communications = self.bind(CommunicationsAPIClient)
+        self.draft_and_auction = self.bind(DraftAndAuctionAPIClient)
+        self.fantasy_content = self.bind(FantasyContentAPIClient)
+        self.league_players = self.bind(LeaguePlayersAPIClient)
+        self.nfl_content = self.bind(NFLContentAPIClient)
+        self.other_league_info = self.bind(OtherLeagueInfoAPIClient)
+        self.scoring_and_results = self.bind(ScoringAndResultsAPIClient)
+        self.session = self.bind(SessionAPIClient)
+        self.transactions = self.bind(TransactionsAPIClient)
+        self.user_functions = self.bind(UserFunctionsAPIClient)
+        if api_config is None:
+            self.__api_config.set_session_api_client(self.session)
+
+    @property
+    def api_config(self) -> type[APIConfig]:
+        """
+        The APIConfig to add this client's configs to.
+        """
+        return self.__api_config
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        return self.__overrides["_CONNECTION_POOL"]
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self.__overrides["_RESPONSE_CACHE"]
+
+    def bind(self, api_client: T) -> T:
+        """
+        Returns the given API Client (blocking or async) bound to this client's state.
+        """
+        with self.__lock:
+            bound_api_client = self.__bound_api_client_by_api_client.get(api_client)
+            if bound_api_client is None:
+                overrides = dict(self.__overrides)
+                if hasattr(api_client, "_ASYNC_CONNECTION_POOL"):
+                    if self.__async_connection_pool is None:
+                        from pymfl.api.aio.AsyncConnectionPool import AsyncConnectionPool
+                        self.__async_connection_pool = AsyncConnectionPool()
+                    overrides["_ASYNC_CONNECTION_POOL"] = self.__async_connection_pool
+                # class attributes of the subclass shadow the process-wide state of the API Client it mirrors
+                bound_api_client = type(api_client.__name__, (api_client,),
+                                        {**overrides, "_MFL_CLIENT": self, "__module__": api_client.__module__})
+                self.__bound_api_client_by_api_client[api_client] = bound_api_client
+            return bound_api_client
+
+    def _set_state(self, name: str, value: Any):
+        """
+        Replaces the given piece of state (i.e. "_RESPONSE_CACHE") of every API Client bound to this client.
+        Used by the set_ methods of bound API Clients.
+        """
+        with self.__lock:
+            if name == "_ASYNC_CONNECTION_POOL":
+                self.__async_connection_pool = value
+            else:
+                self.__overrides[name] = value
+            for bound_api_client in self.__bound_api_client_by_api_client.values():
+                if name in self.__overrides or hasattr(bound_api_client, name):
+                    setattr(bound_api_client, name, value)
+
+    def close(self):
+        """
+        Closes this client's connection pool.
+        """
+        self.connection_pool.close()
@@ -1,3 +1,5 @@
+from typing import Iterator, Iterable
+
 from pymfl.api.MFLAPIClient import MFLAPIClient
 
 
@@ -59,15 +61,33 @@ class ScoringAndResultsAPIClient(MFLAPIClient):
         """
         All player scores for a given league/week, including all rostered players as well as all free agents.
         Private league access restricted to league owners.
+        Long lists of players are fetched in chunks, in parallel, and merged into one response
+        (count cannot be given with such lists).
+        """
+        urls = [cls.__build_player_scores_url(year=year, league_id=league_id, as_json=True, players=players, **kwargs)
+                for players in cls._chunk_ids(kwargs.pop("players", None), count=kwargs.get("count"))]
+        return cls._get_chunked_for_year_and_league_id(urls=urls, year=year, league_id=league_id)
+
+    @classmethod
+    def iter_player_scores(cls, *, year: int, league_id: str, **kwargs) -> Iterator[dict[str, str]]:
+        """
+        Streams the same player scores as get_player_scores, yielding each player score as soon as it has been read,
+        so memory stays flat for large (i.e. year-to-date) sets.
+        Takes the same parameters as get_player_scores.
         """
+        url = cls.__build_player_scores_url(year=year, league_id=league_id, as_json=False, **kwargs)
+        return cls._iter_for_year_and_league_id(url=url, year=year, league_id=league_id, tag="playerScore")
+
+    @classmethod
+    def __build_player_scores_url(cls, *, year: int, league_id: str, as_json: bool, **kwargs) -> str:
         # If the week is specified, it returns the data for that week, otherwise the current week data is returned.
         # If the value is 'YTD', then it returns year-to-date data.
         # If the value is 'AVG', then it returns a weekly average.
         week: int | str = kwargs.pop("week", None)
         # The year for the data to be returned.
         for_year: int = kwargs.pop("for_year", None)
-        # Pass a list of player ids separated by commas (or just a single player id) to receive back just the info on those players.
-        players: str = kwargs.pop("players", None)
+        # Pass a list of player ids separated by commas, a collection of player ids (or just a single player id) to receive back just the info on those players.
+        players: str | Iterable[str] = cls._join_ids(kwargs.pop("players", None))
         # Return only players from this position.
         position: str = kwargs.pop("position", None)
         # If set to 'freeagent', returns only players that are fantasy league free agents.
@@ -77,7 +97,9 @@ class ScoringAndResultsAPIClient(MFLAPIClient):
         rules: str = kwargs.pop("rules", None)
         # Limit the result to this many players.
         count: int = kwargs.pop("count", None)
-        filters = [("TYPE", "playerScores"), ("L", league_id), ("JSON", 1)]
+        filters = [("TYPE", "playerScores"), ("L", league_id)]
+        if as_json:
+            filters.append(("JSON", 1))
         cls._add_filter_if_given("W", week, filters)
         cls._add_filter_if_given("YEAR", for_year, filters)
         cls._add_filter_if_given("PLAYERS", players, filters)
@@ -86,8 +108,7 @@ class ScoringAndResultsAPIClient(MFLAPIClient):
         cls._add_filter_if_given("RULES", rules, filters)
         cls._add_filter_if_given("COUNT", count, filters)
         url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
-        url = cls._add_filters(url, *filters)
-        return cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+        return cls._add_filters(url, *filters)
 
     @classmethod
     def get_projected_scores(cls, *, year: int, league_id: str, **kwargs) -> dict:
@@ -95,23 +116,27 @@ class ScoringAndResultsAPIClient(MFLAPIClient):
         Given a player ID, calculate the expected fantasy points, using that league's scoring system.
         The system will use the raw stats that fantasysharks.com projects.
         Private league access restricted to league owners.
+        Long lists of players are fetched in chunks, in parallel, and merged into one response
+        (count cannot be given with such lists).
         """
         # If the week is specified, it returns the projected scores for that week, otherwise the upcoming week is used.
         week: int = kwargs.pop("week", None)
-        # Pass a list of player ids separated by commas (or just a single player id) to receive back just the info on those players.
-        players: str = kwargs.pop("players", None)
+        # Pass a list of player ids separated by commas, a collection of player ids (or just a single player id) to receive back just the info on those players.
+        players: str | Iterable[str] = kwargs.pop("players", None)
         # Return only players from this position.
         position: str = kwargs.pop("position", None)
         # If set to 'freeagent', returns only players that are fantasy league free agents (note that this refers to players that current free agents, not that were free agents during the specified week).
         status: str = kwargs.pop("status", None)
         # Limit the result to this many players.
         count: int = kwargs.pop("count", None)
-        filters = [("TYPE", "projectedScores"), ("L", league_id), ("JSON", 1)]
-        cls._add_filter_if_given("W", week, filters)
-        cls._add_filter_if_given("PLAYERS", players, filters)
-        cls._add_filter_if_given("POSITION", position, filters)
-        cls._add_filter_if_given("STATUS", status, filters)
-        cls._add_filter_if_given("COUNT", count, filters)
-        url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
-        url = cls._add_filters(url, *filters)
-        return cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+        urls = list()
+        for player_ids in cls._chunk_ids(players, count=count):
+            filters = [("TYPE", "projectedScores"), ("L", league_id), ("JSON", 1)]
+            cls._add_filter_if_given("W", week, filters)
+            cls._add_filter_if_given("PLAYERS", player_ids, filters)
+            cls._add_filter_if_given("POSITION", position, filters)
+            cls._add_filter_if_given("STATUS", status, filters)
+            cls._add_filter_if_given("COUNT", count, filters)
+            url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
+            urls.append(cls._add_filters(url, *filters))
+        return cls._get_chunked_for_year_and_league_id(urls=urls, year=year, league_id=league_id)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pymfl.api.MFLAPIClient import MFLAPIClient
 from pymfl.util import ConfigReader
 
@@ -6,8 +8,9 @@ class SessionAPIClient(MFLAPIClient):
     __LOGIN_ROUTE = ConfigReader.get("api", "login_route")
 
     @classmethod
-    def get_mfl_user_id(cls, *, year: int, username: str, password: str) -> str:
+    def get_mfl_user_id(cls, *, year: int, username: str, password: str,
+                        user_agent_name: Optional[str] = None) -> str:
         url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls.__LOGIN_ROUTE)
         url = cls._add_filters(url, ("USERNAME", username), ("PASSWORD", password), ("XML", 1))
-        response = cls._post(url, as_xml=True)
+        response = cls._post(url, as_xml=True, user_agent_name=user_agent_name)
         return response.attrib["MFL_USER_ID"]  # TODO: do some error handling here
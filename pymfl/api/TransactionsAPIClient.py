@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from pymfl.api.MFLAPIClient import MFLAPIClient
 
 
@@ -12,6 +14,21 @@ class TransactionsAPIClient(MFLAPIClient):
         If it comes from the commissioner, it will return all pending transactions.
         Private league access restricted to league owners.
         """
+        url = cls.__build_transactions_url(year=year, league_id=league_id, as_json=True, **kwargs)
+        return cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+
+    @classmethod
+    def iter_transactions(cls, *, year: int, league_id: str, **kwargs) -> Iterator[dict[str, str]]:
+        """
+        Streams the same transactions as get_transactions, yielding each transaction as soon as it has been read,
+        so memory stays flat no matter how large the set is.
+        Takes the same parameters as get_transactions.
+        """
+        url = cls.__build_transactions_url(year=year, league_id=league_id, as_json=False, **kwargs)
+        return cls._iter_for_year_and_league_id(url=url, year=year, league_id=league_id, tag="transaction")
+
+    @classmethod
+    def __build_transactions_url(cls, *, year: int, league_id: str, as_json: bool, **kwargs) -> str:
         # If the week is specified, it returns the transactions for that week.
         week: int = kwargs.pop("week", None)
         # Returns only transactions of the specified type.
@@ -26,15 +43,16 @@ class TransactionsAPIClient(MFLAPIClient):
         # Restricts the results to just this many entries.
         # Note than when this field is specified, only transactions from the most common types are returned.
         count: int = kwargs.pop("count", None)
-        filters = [("TYPE", "transactions"), ("L", league_id), ("JSON", 1)]
+        filters = [("TYPE", "transactions"), ("L", league_id)]
+        if as_json:
+            filters.append(("JSON", 1))
         cls._add_filter_if_given("W", week, filters)
         cls._add_filter_if_given("TRANS_TYPE", trans_type, filters)
         cls._add_filter_if_given("FRANCHISE", franchise, filters)
         cls._add_filter_if_given("DAYS", days, filters)
         cls._add_filter_if_given("COUNT", count, filters)
         url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
-        url = cls._add_filters(url, *filters)
-        return cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+        return cls._add_filters(url, *filters)
 
     @classmethod
     def get_pending_waivers(cls, *, year: int, league_id: str, **kwargs) -> dict:
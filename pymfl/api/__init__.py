@@ -3,6 +3,7 @@ from .CommunicationsAPIClient import CommunicationsAPIClient
 from .DraftAndAuctionAPIClient import DraftAndAuctionAPIClient
 from .FantasyContentAPIClient import FantasyContentAPIClient
 from .LeaguePlayersAPIClient import LeaguePlayersAPIClient
+from .MFLClient import MFLClient
 from .NFLContentAPIClient import NFLContentAPIClient
 from .OtherLeagueInfoAPIClient import OtherLeagueInfoAPIClient
 from .ScoringAndResultsAPIClient import ScoringAndResultsAPIClient
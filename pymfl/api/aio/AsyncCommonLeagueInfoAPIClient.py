@@ -0,0 +1,9 @@
+from pymfl.api.CommonLeagueInfoAPIClient import CommonLeagueInfoAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncCommonLeagueInfoAPIClient(AsyncMFLAPIClient, CommonLeagueInfoAPIClient):
+    """
+    Async variant of CommonLeagueInfoAPIClient.
+    """
+    ...
@@ -0,0 +1,9 @@
+from pymfl.api.CommunicationsAPIClient import CommunicationsAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncCommunicationsAPIClient(AsyncMFLAPIClient, CommunicationsAPIClient):
+    """
+    Async variant of CommunicationsAPIClient.
+    """
+    ...
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, AsyncIterator, Mapping, Any
+
+from pymfl.api.transport import RequestTimeout
+
+
+@dataclass(kw_only=True, frozen=True)
+class AsyncResponse:
+    """
+    Used to hold the fully-read response of an async request.
+
+    error: The aiohttp.ClientResponseError of an error status, raised by raise_for_status.
+    """
+    status: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+    error: Optional[Exception] = None
+
+    @property
+    def status_code(self) -> int:
+        # named like requests.Response.status_code, so transport policies work on either response
+        return self.status
+
+    def raise_for_status(self):
+        if self.error is not None:
+            raise self.error
+
+
+class AsyncConnectionPool:
+    """
+    Holds one pooled aiohttp.ClientSession per running event loop.
+    All requests on an event loop share a single semaphore, so any number of coroutines can be scheduled
+    while at most max_concurrency requests are in flight at once.
+    A session is closed when its event loop shuts down (i.e. at the end of asyncio.run) or by close(),
+    so successive event loops never leak the session of the previous one.
+    Requires the optional "aiohttp" dependency.
+
+    max_concurrency: The maximum number of requests in flight at once per event loop.
+    limit_per_host: The maximum number of open connections per host (0 means no per-host limit).
+    """
+
+    def __init__(self, *, max_concurrency: int = 100, limit_per_host: int = 0):
+        self.__max_concurrency = max_concurrency
+        self.__limit_per_host = limit_per_host
+        self.__lock = threading.Lock()
+        # event loop -> (session, semaphore, task closing the session when the loop shuts down)
+        self.__session_by_loop: dict[asyncio.AbstractEventLoop, tuple[Any, asyncio.Semaphore, asyncio.Task]] = dict()
+
+    async def get(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def request(self, method: str, url: str, *, raise_for_status: bool = True, **kwargs) -> AsyncResponse:
+        """
+        raise_for_status: Whether to raise an aiohttp.ClientResponseError for an error status,
+                          otherwise it is held by the returned AsyncResponse.
+        """
+        session, semaphore = self.__get_session_and_semaphore()
+        self.__convert_timeout(kwargs)
+        async with semaphore:
+            async with session.request(method, url, **kwargs) as response:
+                error = None
+                try:
+                    response.raise_for_status()
+                except Exception as e:
+                    if raise_for_status:
+                        raise
+                    error = e
+                content = await response.read()
+                return AsyncResponse(status=response.status, content=content, headers=response.headers, error=error)
+
+    async def iter_content(self, url: str, *, chunk_size: int, **kwargs) -> AsyncIterator[bytes]:
+        """
+        Streams the body of a GET request in chunks of at most chunk_size bytes, without reading it all into memory.
+        """
+        session, semaphore = self.__get_session_and_semaphore()
+        self.__convert_timeout(kwargs)
+        async with semaphore:
+            async with session.get(url, **kwargs) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+
+    async def close(self):
+        """
+        Closes the pooled session of the running event loop.
+        The pool can still be used afterwards, a new session will be created as needed.
+        """
+        with self.__lock:
+            session_entry = self.__session_by_loop.pop(asyncio.get_running_loop(), None)
+        if session_entry is not None:
+            session, _, closer = session_entry
+            closer.cancel()
+            if not session.closed:
+                await session.close()
+
+    @staticmethod
+    def __convert_timeout(kwargs: dict):
+        # a RequestTimeout is given as the aiohttp.ClientTimeout it describes
+        request_timeout = kwargs.get("timeout")
+        if isinstance(request_timeout, RequestTimeout):
+            import aiohttp
+            kwargs["timeout"] = aiohttp.ClientTimeout(sock_connect=request_timeout.connect_seconds,
+                                                      sock_read=request_timeout.read_seconds)
+
+    def __get_session_and_semaphore(self):
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            session_entry = self.__session_by_loop.get(loop)
+            if session_entry is not None and not session_entry[0].closed:
+                return session_entry[0], session_entry[1]
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("The async API Clients require aiohttp: pip install pymfl[async]") from e
+            connector = aiohttp.TCPConnector(limit=self.__max_concurrency, limit_per_host=self.__limit_per_host)
+            # cookies are passed per request, so never let one user's cookies leak into another's request
+            session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+            semaphore = asyncio.Semaphore(self.__max_concurrency)
+            closer = loop.create_task(self.__close_on_shutdown(loop, session))
+            self.__session_by_loop[loop] = (session, semaphore, closer)
+            return session, semaphore
+
+    async def __close_on_shutdown(self, loop: asyncio.AbstractEventLoop, session):
+        # asyncio.run cancels every remaining task before closing its loop,
+        # so the session is closed while the loop that owns its connections still runs
+        try:
+            await loop.create_future()
+        finally:
+            with self.__lock:
+                session_entry = self.__session_by_loop.get(loop)
+                if session_entry is not None and session_entry[0] is session:
+                    del self.__session_by_loop[loop]
+            if not session.closed:
+                await session.close()
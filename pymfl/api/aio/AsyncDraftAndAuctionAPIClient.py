@@ -0,0 +1,9 @@
+from pymfl.api.DraftAndAuctionAPIClient import DraftAndAuctionAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncDraftAndAuctionAPIClient(AsyncMFLAPIClient, DraftAndAuctionAPIClient):
+    """
+    Async variant of DraftAndAuctionAPIClient.
+    """
+    ...
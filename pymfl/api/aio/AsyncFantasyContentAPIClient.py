@@ -0,0 +1,9 @@
+from pymfl.api.FantasyContentAPIClient import FantasyContentAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncFantasyContentAPIClient(AsyncMFLAPIClient, FantasyContentAPIClient):
+    """
+    Async variant of FantasyContentAPIClient.
+    """
+    ...
@@ -0,0 +1,9 @@
+from pymfl.api.LeaguePlayersAPIClient import LeaguePlayersAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncLeaguePlayersAPIClient(AsyncMFLAPIClient, LeaguePlayersAPIClient):
+    """
+    Async variant of LeaguePlayersAPIClient.
+    """
+    ...
@@ -0,0 +1,162 @@
+import asyncio
+import xml.etree.ElementTree as ET
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.aio.AsyncConnectionPool import AsyncConnectionPool, AsyncResponse
+from pymfl.api.transport import Deadline, RateLimiter
+from pymfl.enum import APIResponseType
+from pymfl.util import XMLRecordParser, ResponseView
+
+
+class AsyncMFLAPIClient(MFLAPIClient):
+    """
+    Should be inherited (before the blocking API Client it mirrors) by all async API Clients.
+    Async API Clients reuse the filter-building of the blocking API Client they mirror,
+    but every method returns a coroutine that must be awaited (the iter_ methods return async iterators instead).
+    Requests go through the same RateLimiter, RetryPolicy and CircuitBreaker as blocking requests.
+    """
+    _ASYNC_CONNECTION_POOL = AsyncConnectionPool()
+
+    @classmethod
+    def get_async_connection_pool(cls) -> AsyncConnectionPool:
+        return cls._ASYNC_CONNECTION_POOL
+
+    @classmethod
+    def set_async_connection_pool(cls, async_connection_pool: AsyncConnectionPool):
+        """
+        Replaces the AsyncConnectionPool used by all async API Clients.
+        The previous pool is not closed, as it may be shared elsewhere.
+        """
+        cls._set_state("_ASYNC_CONNECTION_POOL", async_connection_pool, owner=AsyncMFLAPIClient)
+
+    @classmethod
+    async def _get_for_year_and_league_id(cls, *, url: str, year: int, league_id: str,
+                                          api_response_type: APIResponseType = APIResponseType.JSON) -> dict | bytes:
+        try:
+            return await cls.__get_for_year_and_league_id(url=url, year=year, league_id=league_id,
+                                                          api_response_type=api_response_type)
+        except Exception as e:
+            # logging in again is a blocking request, so it runs off the event loop
+            if not cls._is_auth_error(e) or not await asyncio.to_thread(cls._refresh_api_config, year=year,
+                                                                        league_id=league_id):
+                raise
+        return await cls.__get_for_year_and_league_id(url=url, year=year, league_id=league_id,
+                                                      api_response_type=api_response_type)
+
+    @classmethod
+    async def __get_for_year_and_league_id(cls, *, url: str, year: int, league_id: str,
+                                           api_response_type: APIResponseType) -> dict | bytes:
+        api_response_type = cls._resolve_api_response_type(api_response_type)
+        stored_response = cls._get_stored_response(url=url, year=year, league_id=league_id,
+                                                   api_response_type=api_response_type)
+        if stored_response is not None:
+            return stored_response
+        cookies = cls._get_cookies_for_year_and_league_id(year=year, league_id=league_id)
+        headers = cls._get_headers_for_year_and_league_id(year=year, league_id=league_id)
+        request_url = cls._build_request_url(url, year=year, league_id=league_id)
+        user = cls._get_api_config(year=year, league_id=league_id).user_context
+        response = await cls.__get_response(url=request_url, user=user, cookies=cookies, headers=headers)
+        result = cls._decode_content(response.content, api_response_type)
+        cls._learn_home_host(url=url, year=year, league_id=league_id, result=result)
+        cls._store_response(url=url, year=year, league_id=league_id, api_response_type=api_response_type,
+                            content=response.content, result=result)
+        return result
+
+    @classmethod
+    async def _get_chunked_for_year_and_league_id(cls, *, urls: list[str], year: int,
+                                                  league_id: str) -> dict | ResponseView:
+        if len(urls) == 1:
+            return await cls._get_for_year_and_league_id(url=urls[0], year=year, league_id=league_id)
+        semaphore = asyncio.Semaphore(cls._MAX_CHUNK_CONCURRENCY)
+
+        async def get_chunk(url: str) -> dict | ResponseView:
+            async with semaphore:
+                return await cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id)
+
+        return cls._merge_chunked_responses(await asyncio.gather(*(get_chunk(url) for url in urls)))
+
+    @classmethod
+    async def __get_response(cls, *, url: str, user: str, cookies: dict[str, str],
+                             headers: dict[str, str]) -> AsyncResponse:
+        # the same retries with backoff and circuit breaking as blocking requests, only waiting without blocking
+        host = urlparse(url).netloc
+        for attempt in range(cls._RETRY_POLICY.max_retries + 1):
+            cls._CIRCUIT_BREAKER.before_request(host)
+            try:
+                response = await cls.__get_rate_limited_response(url=url, host=host, user=user, cookies=cookies,
+                                                                 headers=headers)
+            except BaseException as e:
+                if not isinstance(e, Exception) or not cls._RETRY_POLICY.is_retryable_exception(e):
+                    cls._CIRCUIT_BREAKER.release(host)
+                    raise
+                cls._CIRCUIT_BREAKER.on_failure(host)
+                if attempt == cls._RETRY_POLICY.max_retries:
+                    raise
+            else:
+                if not cls._RETRY_POLICY.is_retryable_response(response):
+                    cls._CIRCUIT_BREAKER.on_success(host)
+                    break
+                cls._CIRCUIT_BREAKER.on_failure(host)
+                if attempt == cls._RETRY_POLICY.max_retries:
+                    break
+            delay_seconds = cls._RETRY_POLICY.get_delay_seconds(attempt)
+            Deadline.check_current_allows_wait(delay_seconds,
+                                               "The deadline would pass before the request could be retried.")
+            await asyncio.sleep(delay_seconds)
+        response.raise_for_status()
+        return response
+
+    @classmethod
+    async def __get_rate_limited_response(cls, *, url: str, host: str, user: str, cookies: dict[str, str],
+                                          headers: dict[str, str]) -> AsyncResponse:
+        for attempt in range(cls._RATE_LIMITER.max_throttle_retries + 1):
+            await cls.__acquire(host, user)
+            response = await cls._ASYNC_CONNECTION_POOL.get(url, cookies=cookies, headers=headers,
+                                                            timeout=cls._get_request_timeout(),
+                                                            raise_for_status=False)
+            retry_after_seconds = RateLimiter.get_retry_after_seconds(response)
+            if retry_after_seconds is None:
+                cls._RATE_LIMITER.on_success(host, user)
+                break
+            cls._RATE_LIMITER.on_throttled(host, user, retry_after_seconds)
+        return response
+
+    @classmethod
+    async def __acquire(cls, host: str, user: str):
+        # the rate limiter is shared with blocking requests, but waiting for it must not block the event loop
+        while (wait_seconds := cls._RATE_LIMITER.try_acquire(host, user)) > 0:
+            Deadline.check_current_allows_wait(wait_seconds)
+            await asyncio.sleep(wait_seconds)
+
+    @classmethod
+    async def _iter_for_year_and_league_id(cls, *, url: str, year: int, league_id: str,
+                                           tag: str) -> AsyncIterator[dict[str, str]]:
+        cookies = cls._get_cookies_for_year_and_league_id(year=year, league_id=league_id)
+        headers = cls._get_headers_for_year_and_league_id(year=year, league_id=league_id)
+        request_url = cls._build_request_url(url, year=year, league_id=league_id)
+        # a stream cannot be retried once records have been yielded, so it is only rate limited
+        await cls.__acquire(urlparse(request_url).netloc,
+                            cls._get_api_config(year=year, league_id=league_id).user_context)
+        parser = XMLRecordParser(tag)
+        async for chunk in cls._ASYNC_CONNECTION_POOL.iter_content(request_url, chunk_size=cls._STREAM_CHUNK_SIZE,
+                                                                   cookies=cookies, headers=headers,
+                                                                   timeout=cls._get_request_timeout()):
+            for record in parser.feed(chunk):
+                yield record
+        for record in parser.close():
+            yield record
+
+    @classmethod
+    async def _post(cls, url: str, body: dict = None, **kwargs) -> dict | ET.Element:
+        if body is None:
+            body = dict()
+        as_xml = kwargs.pop("as_xml")
+        user_agent_name = kwargs.pop("user_agent_name", None)
+        headers = {"User-Agent": user_agent_name} if user_agent_name is not None else None
+        response = await cls._ASYNC_CONNECTION_POOL.post(url, data=body, headers=headers,
+                                                         timeout=cls._get_request_timeout())
+        if as_xml:
+            return cls._check_xml_response(ET.fromstring(response.content))
+        return cls._JSON_DECODER.decode(response.content)
@@ -0,0 +1,9 @@
+from pymfl.api.NFLContentAPIClient import NFLContentAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncNFLContentAPIClient(AsyncMFLAPIClient, NFLContentAPIClient):
+    """
+    Async variant of NFLContentAPIClient.
+    """
+    ...
@@ -0,0 +1,18 @@
+from pymfl.api.OtherLeagueInfoAPIClient import OtherLeagueInfoAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+from pymfl.enum import APIResponseType
+
+
+class AsyncOtherLeagueInfoAPIClient(AsyncMFLAPIClient, OtherLeagueInfoAPIClient):
+    """
+    Async variant of OtherLeagueInfoAPIClient.
+    """
+
+    @classmethod
+    async def get_ics(cls, *, year: int, league_id: str) -> str:
+        filters = [("TYPE", "ics"), ("L", league_id), ("JSON", 1)]
+        url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls._EXPORT_ROUTE)
+        url = cls._add_filters(url, *filters)
+        response = await cls._get_for_year_and_league_id(url=url, year=year, league_id=league_id,
+                                                         api_response_type=APIResponseType.CONTENT)
+        return response.decode("utf-8")
@@ -0,0 +1,9 @@
+from pymfl.api.ScoringAndResultsAPIClient import ScoringAndResultsAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncScoringAndResultsAPIClient(AsyncMFLAPIClient, ScoringAndResultsAPIClient):
+    """
+    Async variant of ScoringAndResultsAPIClient.
+    """
+    ...
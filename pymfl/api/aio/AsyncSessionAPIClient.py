@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pymfl.api.SessionAPIClient import SessionAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+from pymfl.util import ConfigReader
+
+
+class AsyncSessionAPIClient(AsyncMFLAPIClient, SessionAPIClient):
+    """
+    Async variant of SessionAPIClient.
+    """
+    __LOGIN_ROUTE = ConfigReader.get("api", "login_route")
+
+    @classmethod
+    async def get_mfl_user_id(cls, *, year: int, username: str, password: str,
+                              user_agent_name: Optional[str] = None) -> str:
+        url = cls._build_route(cls._MFL_APP_BASE_URL, year, cls.__LOGIN_ROUTE)
+        url = cls._add_filters(url, ("USERNAME", username), ("PASSWORD", password), ("XML", 1))
+        response = await cls._post(url, as_xml=True, user_agent_name=user_agent_name)
+        return response.attrib["MFL_USER_ID"]
@@ -0,0 +1,9 @@
+from pymfl.api.TransactionsAPIClient import TransactionsAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncTransactionsAPIClient(AsyncMFLAPIClient, TransactionsAPIClient):
+    """
+    Async variant of TransactionsAPIClient.
+    """
+    ...
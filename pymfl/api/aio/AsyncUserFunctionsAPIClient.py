@@ -0,0 +1,9 @@
+from pymfl.api.UserFunctionsAPIClient import UserFunctionsAPIClient
+from pymfl.api.aio.AsyncMFLAPIClient import AsyncMFLAPIClient
+
+
+class AsyncUserFunctionsAPIClient(AsyncMFLAPIClient, UserFunctionsAPIClient):
+    """
+    Async variant of UserFunctionsAPIClient.
+    """
+    ...
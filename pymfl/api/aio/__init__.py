@@ -0,0 +1,12 @@
+from .AsyncCommonLeagueInfoAPIClient import AsyncCommonLeagueInfoAPIClient
+from .AsyncCommunicationsAPIClient import AsyncCommunicationsAPIClient
+from .AsyncConnectionPool import AsyncConnectionPool
+from .AsyncDraftAndAuctionAPIClient import AsyncDraftAndAuctionAPIClient
+from .AsyncFantasyContentAPIClient import AsyncFantasyContentAPIClient
+from .AsyncLeaguePlayersAPIClient import AsyncLeaguePlayersAPIClient
+from .AsyncNFLContentAPIClient import AsyncNFLContentAPIClient
+from .AsyncOtherLeagueInfoAPIClient import AsyncOtherLeagueInfoAPIClient
+from .AsyncScoringAndResultsAPIClient import AsyncScoringAndResultsAPIClient
+from .AsyncSessionAPIClient import AsyncSessionAPIClient
+from .AsyncTransactionsAPIClient import AsyncTransactionsAPIClient
+from .AsyncUserFunctionsAPIClient import AsyncUserFunctionsAPIClient
@@ -0,0 +1,132 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Callable, Any, Optional, Iterable, Iterator
+
+from pymfl.api.transport import Deadline
+from pymfl.exception import DeadlineExceededException
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class CallSpec:
+    """
+    Used to describe a single API Client call to run as part of a batch.
+    Specs are compared and hashed by identity, so each one can key its own result.
+
+    method: Any API Client method, for example ScoringAndResultsAPIClient.get_league_standings
+    kwargs: Any extra keyword arguments to pass to the method
+    """
+    method: Callable[..., Any]
+    year: int
+    league_id: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def call(self) -> Any:
+        return self.method(year=self.year, league_id=self.league_id, **self.kwargs)
+
+    @classmethod
+    def for_each(cls, method: Callable[..., Any], year_and_league_ids: Iterable[tuple[int, str]],
+                 **kwargs) -> list["CallSpec"]:
+        """
+        Builds one CallSpec per (year, league_id) pair, each calling the given method with the given kwargs.
+        """
+        return [cls(method=method, year=year, league_id=league_id, kwargs=dict(kwargs))
+                for year, league_id in year_and_league_ids]
+
+
+@dataclass(kw_only=True, frozen=True)
+class BatchResult:
+    """
+    Used to hold the outcome of a single CallSpec.
+    Exactly one of response or exception is set.
+    """
+    call_spec: CallSpec
+    response: Any = None
+    exception: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+    @property
+    def skipped(self) -> bool:
+        """
+        Whether the call was not finished because the deadline of the batch passed.
+        """
+        return isinstance(self.exception, DeadlineExceededException)
+
+
+class BatchExecutor:
+    """
+    Runs many API Client calls on a bounded thread pool.
+    An exception raised by one call is reported on its BatchResult and never aborts the rest of the batch.
+    Calls run in a copy of the caller's context, so a Deadline or API Client settings
+    (i.e. MFLAPIClient.request_timeout) apply to them as well.
+
+    max_concurrency: The maximum number of calls in flight at once.
+    """
+
+    def __init__(self, *, max_concurrency: int = 10):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.__max_concurrency = max_concurrency
+
+    def stream(self, call_specs: Iterable[CallSpec], *, deadline: Optional[Deadline] = None) -> Iterator[BatchResult]:
+        """
+        Yields a BatchResult for each given CallSpec as soon as it finishes (not in the given order).
+        Specs are consumed lazily, so at most max_concurrency calls are queued at any time.
+
+        deadline: When the batch has to be done by, defaults to the current Deadline.
+                  Once it passes, every call not yet finished is yielded as skipped right away.
+        """
+        deadline = deadline if deadline is not None else Deadline.get_current()
+        call_spec_iterator = iter(call_specs)
+        executor = ThreadPoolExecutor(max_workers=self.__max_concurrency)
+        call_spec_by_future: dict[Future, CallSpec] = dict()
+        try:
+            self.__submit(executor, call_spec_iterator, call_spec_by_future, deadline)
+            while call_spec_by_future:
+                done, _ = wait(call_spec_by_future.keys(),
+                               timeout=None if deadline is None else deadline.remaining_seconds,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    call_spec = call_spec_by_future.pop(future)
+                    exception = future.exception()
+                    if exception is None:
+                        yield BatchResult(call_spec=call_spec, response=future.result())
+                    else:
+                        yield BatchResult(call_spec=call_spec, exception=exception)
+                if deadline is not None and deadline.expired:
+                    break
+                self.__submit(executor, call_spec_iterator, call_spec_by_future, deadline)
+            # calls still in flight are abandoned, they stop at their next request since they share the deadline
+            for call_spec in [*call_spec_by_future.values(), *call_spec_iterator]:
+                yield BatchResult(call_spec=call_spec,
+                                  exception=DeadlineExceededException("The deadline passed before the call finished."))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, call_specs: Iterable[CallSpec], *,
+            deadline: Optional[Deadline] = None) -> dict[CallSpec, BatchResult]:
+        """
+        Runs every given CallSpec and returns all results keyed by their CallSpec.
+        With a deadline, the results of calls that could not finish in time are skipped (see BatchResult.skipped).
+        """
+        return {batch_result.call_spec: batch_result
+                for batch_result in self.stream(call_specs, deadline=deadline)}
+
+    def __submit(self, executor: ThreadPoolExecutor, call_spec_iterator: Iterator[CallSpec],
+                 call_spec_by_future: dict[Future, CallSpec], deadline: Optional[Deadline]):
+        while len(call_spec_by_future) < self.__max_concurrency and (deadline is None or not deadline.expired):
+            call_spec = next(call_spec_iterator, None)
+            if call_spec is None:
+                return
+            future = executor.submit(contextvars.copy_context().run, self.__call, call_spec, deadline)
+            call_spec_by_future[future] = call_spec
+
+    @staticmethod
+    def __call(call_spec: CallSpec, deadline: Optional[Deadline]) -> Any:
+        if deadline is None:
+            return call_spec.call()
+        with deadline:
+            return call_spec.call()
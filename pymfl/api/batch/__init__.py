@@ -0,0 +1 @@
+from .BatchExecutor import BatchExecutor, BatchResult, CallSpec
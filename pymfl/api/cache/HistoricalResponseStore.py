@@ -0,0 +1,114 @@
+import datetime
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from pymfl.api.cache.ResponseCache import ResponseCache
+
+
+@dataclass(kw_only=True, frozen=True)
+class HistoricalResponseStoreReport:
+    """
+    Used to hold the size of a HistoricalResponseStore.
+    """
+    entries: int
+    content_bytes: int
+    file_bytes: int
+    entries_by_year: dict[int, int]
+    content_bytes_by_year: dict[int, int]
+
+
+class HistoricalResponseStore:
+    """
+    A persistent SQLite store for export responses of completed seasons.
+    Responses from completed seasons never change, so once stored they are treated as permanent
+    and served without any network call until they are purged.
+    The raw response content is stored, keyed by the canonical export url plus a user context (i.e. the MFL_USER_ID).
+
+    path: The SQLite database file to use. It is created if it does not exist.
+    """
+    __SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            content BLOB NOT NULL,
+            stored_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path: str):
+        self.__path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute(self.__SCHEMA)
+            self.__connection.execute("CREATE INDEX IF NOT EXISTS responses_year ON responses (year)")
+
+    @staticmethod
+    def is_completed_season(year: int) -> bool:
+        """
+        Whether the given season is over and its data will no longer change.
+        A season is considered complete from March 1st of the following year, after every fantasy playoff has ended.
+        """
+        return datetime.date.today() >= datetime.date(year + 1, 3, 1)
+
+    def get(self, url: str, *, context: str = "") -> Optional[bytes]:
+        """
+        Returns the stored content for the given url and context, or None if nothing is stored.
+        """
+        with self.__lock:
+            row = self.__connection.execute("SELECT content FROM responses WHERE key = ?",
+                                            (self.__build_key(url, context),)).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def put(self, url: str, content: bytes, *, year: int, context: str = ""):
+        """
+        Stores the given content for the given url and context.
+        Does nothing if the given year is not a completed season.
+        """
+        if not self.is_completed_season(year):
+            return
+        with self.__lock, self.__connection:
+            self.__connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                                      (self.__build_key(url, context), url, year, content, time.time()))
+
+    def get_report(self) -> HistoricalResponseStoreReport:
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT year, COUNT(*), SUM(LENGTH(content)) FROM responses GROUP BY year ORDER BY year").fetchall()
+        entries_by_year = {year: entries for year, entries, _ in rows}
+        content_bytes_by_year = {year: content_bytes for year, _, content_bytes in rows}
+        return HistoricalResponseStoreReport(entries=sum(entries_by_year.values()),
+                                             content_bytes=sum(content_bytes_by_year.values()),
+                                             file_bytes=os.path.getsize(self.__path),
+                                             entries_by_year=entries_by_year,
+                                             content_bytes_by_year=content_bytes_by_year)
+
+    def purge(self, *, year: Optional[int] = None) -> int:
+        """
+        Deletes every stored response, or only those for the given year, and returns how many were deleted.
+        The freed space is returned to the file system.
+        """
+        with self.__lock:
+            with self.__connection:
+                if year is None:
+                    cursor = self.__connection.execute("DELETE FROM responses")
+                else:
+                    cursor = self.__connection.execute("DELETE FROM responses WHERE year = ?", (year,))
+            self.__connection.execute("VACUUM")
+        return cursor.rowcount
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+    @staticmethod
+    def __build_key(url: str, context: str) -> str:
+        return hashlib.sha256(f"{ResponseCache.canonicalize(url)}\n{context}".encode("utf-8")).hexdigest()
@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+from urllib.parse import urlparse, parse_qs, parse_qsl, urlencode
+
+
+@dataclass(kw_only=True, frozen=True)
+class ResponseCacheStats:
+    """
+    Used to hold hit/miss stats for a ResponseCache.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class ResponseCache:
+    """
+    An in-memory LRU cache for export responses, keyed by the export URL plus a user context (i.e. the MFL_USER_ID).
+    Each MFL TYPE has its own time-to-live, so rarely-changing data (players, allRules, nflByeWeeks) is reused
+    while fast-changing data (liveScoring) is only reused for a few seconds.
+    TYPEs with a TTL of 0 are never cached, and a TTL of None means the response never expires.
+
+    Cached responses are shared between callers, so they should not be mutated.
+    This is why API Clients only use a ResponseCache once one is set (see MFLAPIClient.set_response_cache).
+
+    max_entries: The maximum number of responses to hold before evicting the least recently used one.
+    ttl_seconds_by_type: Overrides for DEFAULT_TTL_SECONDS_BY_TYPE.
+    default_ttl_seconds: The TTL for any TYPE not in DEFAULT_TTL_SECONDS_BY_TYPE or ttl_seconds_by_type.
+    """
+    DEFAULT_TTL_SECONDS_BY_TYPE: dict[str, Optional[float]] = {
+        # "Our player database is updated at most once per day"
+        "players": 24 * 60 * 60,
+        "allRules": 24 * 60 * 60,
+        # bye weeks do not change once a season's schedule is released, and the year is part of the url
+        "nflByeWeeks": None,
+        "liveScoring": 10
+    }
+
+    def __init__(self, *, max_entries: int = 1024, ttl_seconds_by_type: Optional[dict[str, Optional[float]]] = None,
+                 default_ttl_seconds: Optional[float] = 0):
+        self.__max_entries = max_entries
+        self.__ttl_seconds_by_type = {**self.DEFAULT_TTL_SECONDS_BY_TYPE, **(ttl_seconds_by_type or dict())}
+        self.__default_ttl_seconds = default_ttl_seconds
+        self.__lock = threading.Lock()
+        # (url, context) -> (expires_at, value)
+        self.__entries: OrderedDict[tuple[str, Hashable], tuple[Optional[float], Any]] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, url: str, *, context: Hashable = None) -> Optional[Any]:
+        """
+        Returns the cached response for the given url and context, or None if there is no fresh one.
+        """
+        key = (self.canonicalize(url), context)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return value
+                del self.__entries[key]
+            self.__misses += 1
+            return None
+
+    def put(self, url: str, value: Any, *, context: Hashable = None):
+        """
+        Caches the given response for its TYPE's TTL.
+        Does nothing if that TTL is 0.
+        """
+        ttl_seconds = self.get_ttl_seconds(self.get_type(url))
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            return
+        expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+        key = (self.canonicalize(url), context)
+        with self.__lock:
+            self.__entries[key] = (expires_at, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def get_ttl_seconds(self, mfl_type: Optional[str]) -> Optional[float]:
+        return self.__ttl_seconds_by_type.get(mfl_type, self.__default_ttl_seconds)
+
+    def set_ttl_seconds(self, mfl_type: str, ttl_seconds: Optional[float]):
+        """
+        Overrides the TTL for the given TYPE.
+        Only affects responses cached after this is called.
+        """
+        with self.__lock:
+            self.__ttl_seconds_by_type[mfl_type] = ttl_seconds
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def get_stats(self) -> ResponseCacheStats:
+        with self.__lock:
+            return ResponseCacheStats(hits=self.__hits,
+                                      misses=self.__misses,
+                                      evictions=self.__evictions,
+                                      size=len(self.__entries))
+
+    @staticmethod
+    def canonicalize(url: str) -> str:
+        """
+        Returns the given url with its query parameters sorted, so equivalent urls share a cache entry.
+        """
+        parsed_url = urlparse(url)
+        return parsed_url._replace(query=urlencode(sorted(parse_qsl(parsed_url.query, keep_blank_values=True)))).geturl()
+
+    @staticmethod
+    def get_type(url: str) -> Optional[str]:
+        """
+        Returns the MFL TYPE of the given export url.
+        """
+        types = parse_qs(urlparse(url).query).get("TYPE")
+        return types[0] if types else None
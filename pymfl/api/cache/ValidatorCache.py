@@ -0,0 +1,107 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+from pymfl.api.cache.ResponseCache import ResponseCache
+
+
+@dataclass(kw_only=True, frozen=True)
+class ValidatedResponse:
+    """
+    Used to hold the validators and decoded result of a previous response.
+
+    size_bytes: The size of the response body, which the cache counts the entry as.
+    """
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: bytes
+    result: Any
+    size_bytes: int = 0
+
+
+class ValidatorCache:
+    """
+    An in-memory LRU cache of the validators (ETag / Last-Modified) and decoded results of previous responses,
+    keyed by the export URL plus a user context.
+    It lets repeated requests be sent as conditional requests, and lets a 304 Not Modified response
+    (or a response whose body hash matches the previous one) reuse the previously decoded result.
+
+    Results are shared between callers, so they should not be mutated.
+    This is why API Clients only use a ValidatorCache once one is set (see MFLAPIClient.set_validator_cache).
+
+    max_entries: The maximum number of responses to hold before evicting the least recently used one.
+    max_bytes: The maximum total size of the held response bodies before evicting the least recently used one.
+               A single response larger than this is not held at all.
+    """
+
+    def __init__(self, *, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[tuple[str, Hashable], ValidatedResponse] = OrderedDict()
+        self.__size_bytes = 0
+        self.__reused_results = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        The total size of the held response bodies.
+        """
+        return self.__size_bytes
+
+    @property
+    def reused_results(self) -> int:
+        """
+        How many responses reused a previously decoded result instead of being decoded again.
+        """
+        return self.__reused_results
+
+    def get(self, url: str, *, context: Hashable = None) -> Optional[ValidatedResponse]:
+        key = (ResponseCache.canonicalize(url), context)
+        with self.__lock:
+            validated_response = self.__entries.get(key)
+            if validated_response is not None:
+                self.__entries.move_to_end(key)
+            return validated_response
+
+    def put(self, url: str, validated_response: ValidatedResponse, *, context: Hashable = None):
+        key = (ResponseCache.canonicalize(url), context)
+        with self.__lock:
+            previous_validated_response = self.__entries.pop(key, None)
+            if previous_validated_response is not None:
+                self.__size_bytes -= previous_validated_response.size_bytes
+            if validated_response.size_bytes > self.__max_bytes:
+                return
+            self.__entries[key] = validated_response
+            self.__size_bytes += validated_response.size_bytes
+            while len(self.__entries) > self.__max_entries or self.__size_bytes > self.__max_bytes:
+                _, evicted_validated_response = self.__entries.popitem(last=False)
+                self.__size_bytes -= evicted_validated_response.size_bytes
+
+    def record_reused_result(self):
+        with self.__lock:
+            self.__reused_results += 1
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__size_bytes = 0
+
+    @staticmethod
+    def get_conditional_headers(validated_response: Optional[ValidatedResponse]) -> dict[str, str]:
+        """
+        Returns the headers that make a request conditional on the given previous response.
+        """
+        headers = dict()
+        if validated_response is not None:
+            if validated_response.etag is not None:
+                headers["If-None-Match"] = validated_response.etag
+            if validated_response.last_modified is not None:
+                headers["If-Modified-Since"] = validated_response.last_modified
+        return headers
+
+    @staticmethod
+    def hash_content(content: bytes) -> bytes:
+        return hashlib.blake2b(content, digest_size=16).digest()
@@ -0,0 +1,3 @@
+from .HistoricalResponseStore import HistoricalResponseStore, HistoricalResponseStoreReport
+from .ResponseCache import ResponseCache, ResponseCacheStats
+from .ValidatorCache import ValidatorCache, ValidatedResponse
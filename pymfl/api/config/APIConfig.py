@@ -1,18 +1,57 @@
-from dataclasses import dataclass
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Optional, Iterable, TYPE_CHECKING
 
+from pymfl.api.config.ConfigRegistry import ConfigRegistry
+from pymfl.api.config.LoginSessionCache import LoginSessionCache
+from pymfl.enum import AuthMode
 from pymfl.exception import MissingYearAPIConfigException
 
+if TYPE_CHECKING:
+    from pymfl.api.SessionAPIClient import SessionAPIClient
+
 
 @dataclass(kw_only=True, frozen=True)
 class YearAPIConfig:
     """
     Used to hold the API config for a single year/league combination.
+
+    auth_mode: Whether requests are authenticated with the MFL_USER_ID cookie of a login or with an APIKEY.
     """
     league_id: str
-    mfl_user_id: str
+    username: Optional[str] = None
+    mfl_user_id: Optional[str] = None
+    api_key: Optional[str] = None
+    auth_mode: AuthMode = AuthMode.LOGIN
     user_agent_name: str
     year: int
 
+    @property
+    def user_context(self) -> str:
+        """
+        Identifies the user that requests are made as, for keying caches and rate limits.
+        API keys are hashed, as caches can be persisted to disk.
+        """
+        if self.auth_mode == AuthMode.API_KEY:
+            return f"APIKEY:{hashlib.sha256(self.api_key.encode('utf-8')).hexdigest()[:32]}"
+        return self.mfl_user_id
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class ConfigSpec:
+    """
+    Used to describe a single config to register with APIConfig.register_many.
+    Either username and password or api_key must be given.
+    Specs are compared and hashed by identity, so each one can key its own failure.
+    """
+    year: int
+    league_id: str
+    user_agent_name: str
+    username: Optional[str] = None
+    password: Optional[str] = None
+    api_key: Optional[str] = None
+
 
 class APIConfig:
     """
@@ -20,22 +59,170 @@ class APIConfig:
     It should be set before any API calls are made.
     This is a BORG: https://code.activestate.com/recipes/66531/
     """
-    config_by_year_and_league_id: dict[str, YearAPIConfig] = dict()
+    _CONFIG_REGISTRY = ConfigRegistry()
+    _LOGIN_SESSION_CACHE = LoginSessionCache()
+    # the SessionAPIClient to log in through, defaults to the process-wide one
+    _SESSION_API_CLIENT = None
+    # passwords are only held in memory, to log in again when MFL no longer accepts an MFL_USER_ID
+    __password_by_username_and_year: dict[tuple[str, int], str] = dict()
+
+    @classmethod
+    def new_isolated(cls, *, login_session_cache: Optional[LoginSessionCache] = None) -> type["APIConfig"]:
+        """
+        Returns a new APIConfig with its own configs, logins and credentials, sharing nothing with this one.
+        Used to run differently configured clients side by side (see MFLClient).
+
+        login_session_cache: The LoginSessionCache to use, defaults to a new one.
+        """
+        isolated_api_config = type(cls.__name__, (cls,), {
+            "__module__": cls.__module__,
+            "_CONFIG_REGISTRY": ConfigRegistry(),
+            "_LOGIN_SESSION_CACHE": login_session_cache if login_session_cache is not None else LoginSessionCache(),
+            "_SESSION_API_CLIENT": None
+        })
+        isolated_api_config.__password_by_username_and_year = dict()
+        return isolated_api_config
+
+    @classmethod
+    def get_config_registry(cls) -> ConfigRegistry:
+        return cls._CONFIG_REGISTRY
+
+    @classmethod
+    def set_config_registry(cls, config_registry: ConfigRegistry):
+        """
+        Replaces the ConfigRegistry holding every YearAPIConfig.
+        """
+        cls._CONFIG_REGISTRY = config_registry
+
+    @classmethod
+    def get_session_api_client(cls) -> type["SessionAPIClient"]:
+        if cls._SESSION_API_CLIENT is None:
+            from pymfl.api.SessionAPIClient import SessionAPIClient
+            return SessionAPIClient
+        return cls._SESSION_API_CLIENT
+
+    @classmethod
+    def set_session_api_client(cls, session_api_client: Optional[type["SessionAPIClient"]]):
+        """
+        Sets the SessionAPIClient to log in through, i.e. one bound to an MFLClient.
+        Pass None to log in through the process-wide SessionAPIClient.
+        """
+        cls._SESSION_API_CLIENT = session_api_client
+
+    @classmethod
+    def get_login_session_cache(cls) -> LoginSessionCache:
+        return cls._LOGIN_SESSION_CACHE
+
+    @classmethod
+    def set_login_session_cache(cls, login_session_cache: LoginSessionCache):
+        """
+        Replaces the LoginSessionCache used to share logins between configs of the same username and year.
+        """
+        cls._LOGIN_SESSION_CACHE = login_session_cache
 
     @classmethod
     def get_config_by_year_and_league_id(cls, *, year: int, league_id: str) -> YearAPIConfig:
-        try:
-            return cls.config_by_year_and_league_id[f"{year}{league_id}"]
-        except KeyError as e:
+        config = cls._CONFIG_REGISTRY.get(year=year, league_id=league_id)
+        if config is None:
             raise MissingYearAPIConfigException(
                 f"Cannot find YearAPIConfig for year '{year}' and league_id '{league_id}'.")
+        return config
 
     @classmethod
     def add_config_for_year_and_league_id(cls, *, year: int, league_id: str, username: str, password: str,
                                           user_agent_name: str):
-        from pymfl.api.SessionAPIClient import SessionAPIClient
-        mfl_user_id = SessionAPIClient.get_mfl_user_id(year=year, username=username, password=password)
-        cls.config_by_year_and_league_id[f"{year}{league_id}"] = YearAPIConfig(year=year,
-                                                                               league_id=league_id,
-                                                                               mfl_user_id=mfl_user_id,
-                                                                               user_agent_name=user_agent_name)
+        """
+        Logs in and adds the config for the given year and league.
+        The login is shared with every other config of the same username and year.
+        """
+        cls._CONFIG_REGISTRY.put(cls.__build_config(ConfigSpec(year=year,
+                                                               league_id=league_id,
+                                                               user_agent_name=user_agent_name,
+                                                               username=username,
+                                                               password=password)))
+
+    @classmethod
+    def add_api_key_config_for_year_and_league_id(cls, *, year: int, league_id: str, api_key: str,
+                                                  user_agent_name: str):
+        """
+        Adds the config for the given year and league, authenticated with an MFL APIKEY instead of a login.
+        No request is made.
+        """
+        cls._CONFIG_REGISTRY.put(cls.__build_config(ConfigSpec(year=year,
+                                                               league_id=league_id,
+                                                               user_agent_name=user_agent_name,
+                                                               api_key=api_key)))
+
+    @classmethod
+    def register_many(cls, config_specs: Iterable[ConfigSpec], *,
+                      max_concurrency: int = 10) -> dict[ConfigSpec, Exception]:
+        """
+        Adds a config for each of the given specs, logging in for up to max_concurrency of them at once.
+        Each username and year still only logs in once.
+        A failed login never aborts the rest; the exception of every spec that could not be added is returned.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        config_specs = list(config_specs)
+        failures: dict[ConfigSpec, Exception] = dict()
+        configs = list()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as thread_pool_executor:
+            futures = [(config_spec, thread_pool_executor.submit(cls.__build_config, config_spec))
+                       for config_spec in config_specs]
+            for config_spec, future in futures:
+                try:
+                    configs.append(future.result())
+                except Exception as e:
+                    failures[config_spec] = e
+        cls._CONFIG_REGISTRY.put_many(configs)
+        return failures
+
+    @classmethod
+    def refresh_config_for_year_and_league_id(cls, *, year: int, league_id: str) -> bool:
+        """
+        Logs in again for the given year and league, i.e. after MFL rejected its MFL_USER_ID,
+        and updates every config of the same username and year.
+        Returns False if there are no credentials to log in again with (i.e. for APIKEY configs).
+        """
+        stale_config = cls.get_config_by_year_and_league_id(year=year, league_id=league_id)
+        username = stale_config.username
+        password = cls.__password_by_username_and_year.get((username, year))
+        if stale_config.auth_mode != AuthMode.LOGIN or password is None:
+            return False
+        mfl_user_id = cls._LOGIN_SESSION_CACHE.get_or_login(
+            year=year,
+            username=username,
+            login=lambda: cls.__login(year=year, username=username, password=password,
+                                      user_agent_name=stale_config.user_agent_name),
+            stale_mfl_user_id=stale_config.mfl_user_id)
+        cls._CONFIG_REGISTRY.put_many(replace(config, mfl_user_id=mfl_user_id)
+                                      for config in cls._CONFIG_REGISTRY.get_by_username(username)
+                                      if config.year == year)
+        return True
+
+    @classmethod
+    def __build_config(cls, config_spec: ConfigSpec) -> YearAPIConfig:
+        if config_spec.api_key is not None:
+            return YearAPIConfig(year=config_spec.year,
+                                 league_id=config_spec.league_id,
+                                 api_key=config_spec.api_key,
+                                 auth_mode=AuthMode.API_KEY,
+                                 user_agent_name=config_spec.user_agent_name)
+        if config_spec.username is None or config_spec.password is None:
+            raise ValueError("Either username and password or api_key must be given.")
+        mfl_user_id = cls._LOGIN_SESSION_CACHE.get_or_login(
+            year=config_spec.year,
+            username=config_spec.username,
+            login=lambda: cls.__login(year=config_spec.year, username=config_spec.username,
+                                      password=config_spec.password, user_agent_name=config_spec.user_agent_name))
+        cls.__password_by_username_and_year[(config_spec.username, config_spec.year)] = config_spec.password
+        return YearAPIConfig(year=config_spec.year,
+                             league_id=config_spec.league_id,
+                             username=config_spec.username,
+                             mfl_user_id=mfl_user_id,
+                             user_agent_name=config_spec.user_agent_name)
+
+    @classmethod
+    def __login(cls, *, year: int, username: str, password: str, user_agent_name: str) -> str:
+        return cls.get_session_api_client().get_mfl_user_id(year=year, username=username, password=password,
+                                                            user_agent_name=user_agent_name)
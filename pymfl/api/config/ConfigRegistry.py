@@ -0,0 +1,93 @@
+import threading
+from typing import Optional, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pymfl.api.config.APIConfig import YearAPIConfig
+
+
+class ConfigRegistry:
+    """
+    A thread-safe registry of YearAPIConfigs, keyed by (year, league_id).
+    Configs are also indexed by year, by league and by username, so each of those lookups is O(1).
+    """
+
+    def __init__(self):
+        self.__lock = threading.RLock()
+        self.__config_by_key: dict[tuple[int, str], "YearAPIConfig"] = dict()
+        self.__keys_by_year: dict[int, set[tuple[int, str]]] = dict()
+        self.__keys_by_league_id: dict[str, set[tuple[int, str]]] = dict()
+        self.__keys_by_username: dict[str, set[tuple[int, str]]] = dict()
+
+    def __len__(self) -> int:
+        return len(self.__config_by_key)
+
+    def __contains__(self, year_and_league_id: tuple[int, str]) -> bool:
+        return year_and_league_id in self.__config_by_key
+
+    def get(self, *, year: int, league_id: str) -> Optional["YearAPIConfig"]:
+        return self.__config_by_key.get((year, league_id))
+
+    def get_all(self) -> list["YearAPIConfig"]:
+        with self.__lock:
+            return list(self.__config_by_key.values())
+
+    def get_by_year(self, year: int) -> list["YearAPIConfig"]:
+        return self.__get_by_index(self.__keys_by_year, year)
+
+    def get_by_league_id(self, league_id: str) -> list["YearAPIConfig"]:
+        return self.__get_by_index(self.__keys_by_league_id, league_id)
+
+    def get_by_username(self, username: str) -> list["YearAPIConfig"]:
+        """
+        Returns every login config of the given username.
+        """
+        return self.__get_by_index(self.__keys_by_username, username)
+
+    def put(self, config: "YearAPIConfig"):
+        """
+        Adds the given config, replacing any config of the same year and league.
+        """
+        self.put_many((config,))
+
+    def put_many(self, configs: Iterable["YearAPIConfig"]):
+        with self.__lock:
+            for config in configs:
+                key = (config.year, config.league_id)
+                self.__remove(key)
+                self.__config_by_key[key] = config
+                self.__keys_by_year.setdefault(config.year, set()).add(key)
+                self.__keys_by_league_id.setdefault(config.league_id, set()).add(key)
+                if config.username is not None:
+                    self.__keys_by_username.setdefault(config.username, set()).add(key)
+
+    def remove(self, *, year: int, league_id: str) -> Optional["YearAPIConfig"]:
+        with self.__lock:
+            return self.__remove((year, league_id))
+
+    def clear(self):
+        with self.__lock:
+            self.__config_by_key.clear()
+            self.__keys_by_year.clear()
+            self.__keys_by_league_id.clear()
+            self.__keys_by_username.clear()
+
+    def __get_by_index(self, keys_by_index: dict, index) -> list["YearAPIConfig"]:
+        with self.__lock:
+            return [self.__config_by_key[key] for key in keys_by_index.get(index, ())]
+
+    def __remove(self, key: tuple[int, str]) -> Optional["YearAPIConfig"]:
+        config = self.__config_by_key.pop(key, None)
+        if config is None:
+            return None
+        self.__discard(self.__keys_by_year, config.year, key)
+        self.__discard(self.__keys_by_league_id, config.league_id, key)
+        if config.username is not None:
+            self.__discard(self.__keys_by_username, config.username, key)
+        return config
+
+    @staticmethod
+    def __discard(keys_by_index: dict, index, key: tuple[int, str]):
+        keys = keys_by_index[index]
+        keys.discard(key)
+        if not keys:
+            del keys_by_index[index]
@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+
+class LoginSessionCache:
+    """
+    Caches MFL_USER_ID login cookies by username and year, so a user logs in once per season
+    no matter how many of their leagues are configured.
+    Concurrent logins for the same username and year are coalesced into one.
+
+    Only the MFL_USER_ID and its expiry are ever persisted, never the password.
+
+    ttl_seconds: How long a login is reused before logging in again.
+    path: A JSON file to persist logins to, so they survive restarts. It is only readable by its owner.
+    """
+
+    def __init__(self, *, ttl_seconds: float = 24 * 60 * 60, path: Optional[str] = None):
+        self.__ttl_seconds = ttl_seconds
+        self.__path = path
+        self.__lock = threading.Lock()
+        self.__login_lock_by_key: dict[tuple[str, int], threading.Lock] = dict()
+        # (username, year) -> (expires_at, mfl_user_id)
+        self.__entries: dict[tuple[str, int], tuple[float, str]] = dict()
+        self.__logins = 0
+        if path is not None:
+            self.__load()
+
+    @property
+    def logins(self) -> int:
+        """
+        How many logins have been made through this cache.
+        """
+        return self.__logins
+
+    def get(self, *, year: int, username: str) -> Optional[str]:
+        """
+        Returns the cached MFL_USER_ID for the given username and year, or None if there is no fresh one.
+        """
+        with self.__lock:
+            entry = self.__entries.get((username, year))
+            if entry is None or time.time() >= entry[0]:
+                return None
+            return entry[1]
+
+    def get_or_login(self, *, year: int, username: str, login: Callable[[], str],
+                     stale_mfl_user_id: Optional[str] = None) -> str:
+        """
+        Returns the cached MFL_USER_ID for the given username and year, calling login for a new one if there is none.
+
+        stale_mfl_user_id: An MFL_USER_ID that MFL no longer accepts. It is never returned from the cache,
+                           but a different one cached meanwhile (i.e. by a concurrent refresh) is.
+        """
+        key = (username, year)
+        with self.__lock:
+            login_lock = self.__login_lock_by_key.setdefault(key, threading.Lock())
+        with login_lock:
+            mfl_user_id = self.get(year=year, username=username)
+            if mfl_user_id is not None and mfl_user_id != stale_mfl_user_id:
+                return mfl_user_id
+            mfl_user_id = login()
+            with self.__lock:
+                self.__logins += 1
+                self.__entries[key] = (time.time() + self.__ttl_seconds, mfl_user_id)
+                self.__save()
+            return mfl_user_id
+
+    def invalidate(self, *, year: int, username: str):
+        with self.__lock:
+            if self.__entries.pop((username, year), None) is not None:
+                self.__save()
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__save()
+
+    def __load(self):
+        try:
+            with open(self.__path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            # a missing or unreadable file only means logging in again
+            return
+        now = time.time()
+        for entry in entries:
+            if entry["expires_at"] > now:
+                self.__entries[(entry["username"], entry["year"])] = (entry["expires_at"], entry["mfl_user_id"])
+
+    def __save(self):
+        if self.__path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        os.makedirs(directory, exist_ok=True)
+        entries = [{"username": username, "year": year, "mfl_user_id": mfl_user_id, "expires_at": expires_at}
+                   for (username, year), (expires_at, mfl_user_id) in self.__entries.items()]
+        temporary_path = f"{self.__path}.tmp"
+        # the MFL_USER_ID is a credential, so the file is created readable by its owner only
+        file_descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(entries, file)
+        os.replace(temporary_path, self.__path)
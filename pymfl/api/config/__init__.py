@@ -1 +1,3 @@
-from .APIConfig import APIConfig
+from .APIConfig import APIConfig, YearAPIConfig, ConfigSpec
+from .ConfigRegistry import ConfigRegistry
+from .LoginSessionCache import LoginSessionCache
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from pymfl.enum import CircuitState
+from pymfl.exception import CircuitOpenException
+
+
+class _Circuit:
+    __slots__ = ("state", "consecutive_failures", "opened_at")
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker per host.
+    After failure_threshold consecutive failures the circuit opens and requests to that host fail fast
+    with a CircuitOpenException instead of waiting on a degraded server.
+    After reset_timeout_seconds a single trial request is let through (half-open):
+    if it succeeds the circuit closes again, if it fails the circuit re-opens.
+    A trial that ends without telling either (i.e. it was never sent) is released, so the next request is the trial.
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0):
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout_seconds = reset_timeout_seconds
+        self.__lock = threading.Lock()
+        self.__circuit_by_host: dict[str, _Circuit] = dict()
+
+    def before_request(self, host: str):
+        """
+        Raises a CircuitOpenException if a request to the given host is not allowed right now.
+        """
+        with self.__lock:
+            circuit = self.__get_circuit(host)
+            if circuit.state == CircuitState.CLOSED:
+                return
+            if circuit.state == CircuitState.OPEN \
+                    and time.monotonic() - circuit.opened_at >= self.__reset_timeout_seconds:
+                # let exactly one trial request through
+                circuit.state = CircuitState.HALF_OPEN
+                return
+            raise CircuitOpenException(f"Circuit for host '{host}' is open after repeated failures.")
+
+    def on_success(self, host: str):
+        with self.__lock:
+            circuit = self.__get_circuit(host)
+            circuit.state = CircuitState.CLOSED
+            circuit.consecutive_failures = 0
+
+    def on_failure(self, host: str):
+        with self.__lock:
+            circuit = self.__get_circuit(host)
+            circuit.consecutive_failures += 1
+            if circuit.state == CircuitState.HALF_OPEN or circuit.consecutive_failures >= self.__failure_threshold:
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+
+    def release(self, host: str):
+        """
+        Ends a request to the given host that neither succeeded nor failed against it.
+        A half-open circuit re-opens without restarting its timeout, so the next request is let through as the trial.
+        """
+        with self.__lock:
+            circuit = self.__get_circuit(host)
+            if circuit.state == CircuitState.HALF_OPEN:
+                circuit.state = CircuitState.OPEN
+
+    def get_state(self, host: str) -> CircuitState:
+        with self.__lock:
+            return self.__get_circuit(host).state
+
+    def __get_circuit(self, host: str) -> _Circuit:
+        circuit = self.__circuit_by_host.get(host)
+        if circuit is None:
+            circuit = _Circuit()
+            self.__circuit_by_host[host] = circuit
+        return circuit
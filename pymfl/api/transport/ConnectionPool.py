@@ -0,0 +1,112 @@
+import threading
+import weakref
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlparse
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(kw_only=True, frozen=True)
+class ConnectionPoolStats:
+    """
+    Used to hold connection reuse stats for a single host.
+    """
+    host: str
+    requests_sent: int
+    connections_opened: int
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests_sent - self.connections_opened, 0)
+
+
+class ConnectionPool:
+    """
+    Holds one pooled, keep-alive requests.Session per host so TCP/TLS connections are reused across API calls.
+    Sessions are created lazily and closed when close() is called or the interpreter exits.
+
+    pool_connections: The number of host pools to cache per session.
+    pool_maxsize: The maximum number of connections to keep open per host.
+    pool_block: Whether to block when no connection is free instead of opening a throwaway connection.
+    """
+
+    def __init__(self, *, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False):
+        self.__pool_connections = pool_connections
+        self.__pool_maxsize = pool_maxsize
+        self.__pool_block = pool_block
+        self.__lock = threading.Lock()
+        self.__session_by_host: dict[str, requests.Session] = dict()
+        self.__requests_sent_by_host: dict[str, int] = dict()
+        weakref.finalize(self, self.__close_sessions, self.__session_by_host)
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        host = urlparse(url).netloc
+        session = self.get_session(host)
+        with self.__lock:
+            self.__requests_sent_by_host[host] = self.__requests_sent_by_host.get(host, 0) + 1
+        if method == "GET":
+            return session.get(url, **kwargs)
+        elif method == "POST":
+            return session.post(url, **kwargs)
+        return session.request(method, url, **kwargs)
+
+    def get_session(self, host: str) -> requests.Session:
+        """
+        Returns the pooled session for the given host, creating it if needed.
+        """
+        with self.__lock:
+            session = self.__session_by_host.get(host)
+            if session is None:
+                session = requests.Session()
+                # cookies are passed per request, so never let one user's cookies leak into another's request
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=self.__pool_connections,
+                                      pool_maxsize=self.__pool_maxsize,
+                                      pool_block=self.__pool_block)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self.__session_by_host[host] = session
+            return session
+
+    def get_stats(self) -> dict[str, ConnectionPoolStats]:
+        """
+        Returns connection reuse stats keyed by host.
+        """
+        with self.__lock:
+            stats = dict()
+            for host, session in self.__session_by_host.items():
+                connections_opened = 0
+                for adapter in set(session.adapters.values()):
+                    pools = adapter.poolmanager.pools
+                    for key in pools.keys():
+                        pool = pools.get(key)
+                        if pool is not None:
+                            connections_opened += pool.num_connections
+                stats[host] = ConnectionPoolStats(host=host,
+                                                  requests_sent=self.__requests_sent_by_host.get(host, 0),
+                                                  connections_opened=connections_opened)
+            return stats
+
+    def close(self):
+        """
+        Closes every pooled session.
+        The pool can still be used afterwards, new sessions will be created as needed.
+        """
+        with self.__lock:
+            self.__close_sessions(self.__session_by_host)
+            self.__requests_sent_by_host.clear()
+
+    @staticmethod
+    def __close_sessions(session_by_host: dict[str, requests.Session]):
+        for session in session_by_host.values():
+            session.close()
+        session_by_host.clear()
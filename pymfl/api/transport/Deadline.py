@@ -0,0 +1,73 @@
+import contextvars
+import time
+from typing import Optional
+
+from pymfl.exception import DeadlineExceededException
+
+
+class Deadline:
+    """
+    A point in time by which work has to be done, i.e. to meet a latency target.
+    Within a Deadline context, API Client requests are given no more time than is left (see RequestTimeout),
+    requests are no longer sent once it has passed and a BatchExecutor skips the calls it could not finish.
+    Nested deadlines never extend the one they are nested in.
+    The current deadline is per thread / async task, and is passed on to the calls of a BatchExecutor.
+
+    The read timeout of a request applies to each read from the socket, not to the whole response,
+    so a server that keeps sending a response slowly can keep a single request going past the deadline.
+    A BatchExecutor still stops waiting for such a call once the deadline passes (reporting it as skipped),
+    and streamed responses (i.e. TransactionsAPIClient.iter_transactions) stop being read.
+
+    seconds: How long from now the deadline is.
+    """
+    # the stack of entered deadlines, as a deadline may be entered in many threads / async tasks at once
+    __STACK = contextvars.ContextVar("deadline_stack", default=())
+
+    def __init__(self, seconds: float):
+        self.__expires_at = time.monotonic() + seconds
+
+    def __enter__(self) -> "Deadline":
+        current = self.get_current()
+        effective = self if current is None or self.__expires_at < current.__expires_at else current
+        Deadline.__STACK.set((*Deadline.__STACK.get(), effective))
+        return effective
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        Deadline.__STACK.set(Deadline.__STACK.get()[:-1])
+
+    @classmethod
+    def get_current(cls) -> Optional["Deadline"]:
+        stack = Deadline.__STACK.get()
+        return stack[-1] if stack else None
+
+    @classmethod
+    def check_current(cls):
+        """
+        Raises a DeadlineExceededException if the current deadline has passed.
+        """
+        current = cls.get_current()
+        if current is not None:
+            current.check()
+
+    @classmethod
+    def check_current_allows_wait(cls, seconds: float,
+                                  message: str = "The deadline would pass before the request could be sent."):
+        """
+        Raises a DeadlineExceededException with the given message if waiting the given seconds
+        would outlast the current deadline, so callers fail right away instead of waiting in vain.
+        """
+        current = cls.get_current()
+        if current is not None and current.remaining_seconds < seconds:
+            raise DeadlineExceededException(message)
+
+    @property
+    def remaining_seconds(self) -> float:
+        return max(self.__expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.__expires_at
+
+    def check(self):
+        if self.expired:
+            raise DeadlineExceededException("The deadline has passed.")
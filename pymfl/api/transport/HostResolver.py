@@ -0,0 +1,69 @@
+import threading
+from typing import Optional
+from urllib.parse import urlparse, parse_qs
+
+from requests import Response
+
+
+class HostResolver:
+    """
+    Learns and caches the home host (i.e. "www43.myfantasyleague.com") of each league per year.
+    League data lives on per-league hosts, so requests to the shared API host are redirected there.
+    Once a league's home host is known, league-specific urls are built against it directly,
+    saving the redirect round trip (and each host gets its own connection pool).
+
+    A home host is learned from a redirected response or from the "baseURL" of a league export.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__host_by_year_and_league_id: dict[tuple[int, str], str] = dict()
+
+    def get_host(self, *, year: int, league_id: str) -> Optional[str]:
+        with self.__lock:
+            return self.__host_by_year_and_league_id.get((year, league_id))
+
+    def set_host(self, *, year: int, league_id: str, host: str):
+        with self.__lock:
+            self.__host_by_year_and_league_id[(year, league_id)] = host
+
+    def clear(self):
+        with self.__lock:
+            self.__host_by_year_and_league_id.clear()
+
+    def resolve_url(self, url: str, *, year: int, league_id: str) -> str:
+        """
+        Returns the given url pointed at the league's home host, if it is known and the url is for that league.
+        """
+        host = self.get_host(year=year, league_id=league_id)
+        if host is None:
+            return url
+        parsed_url = urlparse(url)
+        if parsed_url.netloc == host or not self.__is_for_league(parsed_url.query, league_id):
+            return url
+        return parsed_url._replace(netloc=host).geturl()
+
+    def learn_from_response(self, response: Response, *, url: str, year: int, league_id: str):
+        """
+        Remembers the league's home host if the given response was redirected there from the requested url.
+        """
+        if not response.history or not response.url:
+            return
+        parsed_url = urlparse(url)
+        host = urlparse(response.url).netloc
+        if host and host != parsed_url.netloc and self.__is_for_league(parsed_url.query, league_id):
+            self.set_host(year=year, league_id=league_id, host=host)
+
+    def learn_from_league(self, league_response: dict, *, year: int, league_id: str):
+        """
+        Remembers the league's home host from the "baseURL" of a league export (CommonLeagueInfoAPIClient.get_league).
+        """
+        base_url = league_response.get("league", dict()).get("baseURL")
+        if base_url:
+            host = urlparse(base_url).netloc
+            if host:
+                self.set_host(year=year, league_id=league_id, host=host)
+
+    @staticmethod
+    def __is_for_league(query: str, league_id: str) -> bool:
+        return parse_qs(query).get("L") == [league_id]
@@ -0,0 +1,167 @@
+import datetime
+import email.utils
+import threading
+import time
+from collections import deque
+from typing import Optional, Hashable, TYPE_CHECKING
+
+from requests import Response
+
+from pymfl.api.transport.Deadline import Deadline
+
+if TYPE_CHECKING:
+    from pymfl.api.aio.AsyncConnectionPool import AsyncResponse
+
+
+class _TokenBucket:
+    __slots__ = ("requests_per_second", "tokens", "last_refill", "blocked_until", "request_times")
+
+    def __init__(self, requests_per_second: Optional[float], now: float):
+        self.requests_per_second = requests_per_second
+        self.tokens = 1.0
+        self.last_refill = now
+        self.blocked_until = 0.0
+        # when the most recent requests were sent, used to estimate the rate that got throttled
+        self.request_times: deque[float] = deque(maxlen=20)
+
+
+class RateLimiter:
+    """
+    A shared token-bucket rate limiter with one bucket per (host, user).
+    Callers that are over the rate are queued (they block) instead of failing.
+
+    The rate adapts to throttling: when MFL responds with HTTP 429 or a Retry-After header,
+    the bucket is paused for the Retry-After duration and its rate is halved,
+    then every successful request adds recovery_step requests per second back (additive increase, multiplicative decrease).
+
+    requests_per_second: The maximum rate per bucket. None means no limit until MFL throttles.
+    requests_per_second_by_host: Overrides for requests_per_second for specific hosts.
+    min_requests_per_second: The rate never adapts below this.
+    recovery_step: How many requests per second each successful request adds back after throttling.
+    max_throttle_retries: How many times a throttled request is queued and retried before its error is raised.
+    """
+
+    def __init__(self, *, requests_per_second: Optional[float] = None,
+                 requests_per_second_by_host: Optional[dict[str, Optional[float]]] = None,
+                 min_requests_per_second: float = 0.2, recovery_step: float = 0.05, max_throttle_retries: int = 5):
+        self.__requests_per_second = requests_per_second
+        self.__requests_per_second_by_host = requests_per_second_by_host or dict()
+        self.__min_requests_per_second = min_requests_per_second
+        self.__recovery_step = recovery_step
+        self.max_throttle_retries = max_throttle_retries
+        self.__lock = threading.Lock()
+        self.__bucket_by_key: dict[tuple[str, Hashable], _TokenBucket] = dict()
+
+    def acquire(self, host: str, user: Hashable = None):
+        """
+        Blocks until a request to the given host for the given user is allowed.
+        Raises a DeadlineExceededException right away if that would outlast the current Deadline.
+        """
+        while True:
+            wait_seconds = self.try_acquire(host, user)
+            if wait_seconds <= 0:
+                return
+            Deadline.check_current_allows_wait(wait_seconds)
+            time.sleep(wait_seconds)
+
+    def try_acquire(self, host: str, user: Hashable = None) -> float:
+        """
+        Takes the allowance for a request to the given host for the given user without blocking.
+        Returns 0 if the request is allowed, otherwise how long to wait before trying again (i.e. with asyncio.sleep).
+        """
+        with self.__lock:
+            now = time.monotonic()
+            bucket = self.__get_bucket(host, user, now)
+            wait_seconds = self.__try_take_token(bucket, now)
+            if wait_seconds <= 0:
+                bucket.request_times.append(now)
+                return 0
+            return wait_seconds
+
+    def on_success(self, host: str, user: Hashable = None):
+        with self.__lock:
+            bucket = self.__get_bucket(host, user, time.monotonic())
+            max_requests_per_second = self.__get_max_requests_per_second(host)
+            if bucket.requests_per_second is not None and bucket.requests_per_second != max_requests_per_second:
+                bucket.requests_per_second += self.__recovery_step
+                if max_requests_per_second is not None:
+                    bucket.requests_per_second = min(bucket.requests_per_second, max_requests_per_second)
+
+    def on_throttled(self, host: str, user: Hashable = None, retry_after_seconds: Optional[float] = None):
+        with self.__lock:
+            now = time.monotonic()
+            bucket = self.__get_bucket(host, user, now)
+            current_requests_per_second = bucket.requests_per_second
+            if current_requests_per_second is None:
+                current_requests_per_second = self.__get_observed_requests_per_second(bucket)
+            bucket.requests_per_second = max(current_requests_per_second / 2, self.__min_requests_per_second)
+            bucket.tokens = 0.0
+            if retry_after_seconds is None:
+                retry_after_seconds = 1 / bucket.requests_per_second
+            bucket.blocked_until = max(bucket.blocked_until, now + retry_after_seconds)
+
+    def get_requests_per_second(self, host: str, user: Hashable = None) -> Optional[float]:
+        """
+        Returns the current rate for the given host and user, or None if it is not limited.
+        """
+        with self.__lock:
+            return self.__get_bucket(host, user, time.monotonic()).requests_per_second
+
+    @staticmethod
+    def get_retry_after_seconds(response: "Response | AsyncResponse") -> Optional[float]:
+        """
+        Returns how long to wait before retrying if the given response means the client is being throttled,
+        otherwise None.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if response.status_code != 429 and retry_after is None:
+            return None
+        if retry_after is None:
+            return 1.0
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            # a malformed HTTP-date still means the client is being throttled
+            return 1.0
+        if retry_at.tzinfo is None:
+            # HTTP-dates are always in GMT
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+    def __get_max_requests_per_second(self, host: str) -> Optional[float]:
+        return self.__requests_per_second_by_host.get(host, self.__requests_per_second)
+
+    def __get_bucket(self, host: str, user: Hashable, now: float) -> _TokenBucket:
+        key = (host, user)
+        bucket = self.__bucket_by_key.get(key)
+        if bucket is None:
+            bucket = _TokenBucket(self.__get_max_requests_per_second(host), now)
+            self.__bucket_by_key[key] = bucket
+        return bucket
+
+    @staticmethod
+    def __try_take_token(bucket: _TokenBucket, now: float) -> float:
+        """
+        Takes a token from the bucket and returns 0, or returns how long to wait for one.
+        """
+        if now < bucket.blocked_until:
+            return bucket.blocked_until - now
+        if bucket.requests_per_second is None:
+            return 0
+        capacity = max(bucket.requests_per_second, 1.0)
+        bucket.tokens = min(capacity, bucket.tokens + (now - bucket.last_refill) * bucket.requests_per_second)
+        bucket.last_refill = now
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0
+        return (1 - bucket.tokens) / bucket.requests_per_second
+
+    def __get_observed_requests_per_second(self, bucket: _TokenBucket) -> float:
+        request_times = bucket.request_times
+        if len(request_times) < 2 or request_times[-1] <= request_times[0]:
+            return self.__min_requests_per_second * 2
+        return (len(request_times) - 1) / (request_times[-1] - request_times[0])
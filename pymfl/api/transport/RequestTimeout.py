@@ -0,0 +1,40 @@
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from pymfl.api.transport.Deadline import Deadline
+
+
+@dataclass(kw_only=True, frozen=True)
+class RequestTimeout:
+    """
+    Used to hold how long a request may take, so a stuck socket never blocks a thread forever.
+    None means no limit.
+
+    connect_seconds: How long to wait for a connection to be established.
+    read_seconds: How long to wait for the server between bytes of the response.
+                  This does not bound the time it takes to read the whole response.
+    """
+    connect_seconds: Optional[float] = 5.0
+    read_seconds: Optional[float] = 30.0
+
+    def bounded_by(self, deadline: Optional[Deadline]) -> "RequestTimeout":
+        """
+        Returns this timeout, shortened to the time left before the given deadline.
+        """
+        if deadline is None:
+            return self
+        # timeouts must be positive, a deadline that has passed is caught before the request is sent
+        remaining_seconds = max(deadline.remaining_seconds, 0.001)
+        return replace(self,
+                       connect_seconds=self.__bound(self.connect_seconds, remaining_seconds),
+                       read_seconds=self.__bound(self.read_seconds, remaining_seconds))
+
+    def as_tuple(self) -> tuple[Optional[float], Optional[float]]:
+        """
+        Returns this timeout as the (connect, read) tuple requests expects.
+        """
+        return self.connect_seconds, self.read_seconds
+
+    @staticmethod
+    def __bound(seconds: Optional[float], remaining_seconds: float) -> float:
+        return remaining_seconds if seconds is None else min(seconds, remaining_seconds)
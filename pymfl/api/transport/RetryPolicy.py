@@ -0,0 +1,51 @@
+import asyncio
+import random
+import sys
+from typing import TYPE_CHECKING
+
+from requests import Response
+from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError
+
+if TYPE_CHECKING:
+    from pymfl.api.aio.AsyncConnectionPool import AsyncResponse
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed idempotent request should be retried and how long to wait before retrying.
+    Delays grow exponentially from base_delay_seconds up to max_delay_seconds, with full jitter
+    (a random delay between 0 and the exponential delay) so many clients do not retry in lockstep.
+
+    max_retries: How many times a request is retried after its first attempt (0 disables retries).
+    retry_status_codes: The HTTP status codes that are retried.
+    """
+    DEFAULT_RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+    def __init__(self, *, max_retries: int = 3, base_delay_seconds: float = 0.5, max_delay_seconds: float = 30.0,
+                 retry_status_codes: frozenset[int] = DEFAULT_RETRY_STATUS_CODES):
+        self.max_retries = max_retries
+        self.__base_delay_seconds = base_delay_seconds
+        self.__max_delay_seconds = max_delay_seconds
+        self.__retry_status_codes = retry_status_codes
+
+    def get_delay_seconds(self, attempt: int) -> float:
+        """
+        Returns how long to wait after the given (0-indexed) failed attempt.
+        """
+        return random.uniform(0, min(self.__max_delay_seconds, self.__base_delay_seconds * 2 ** attempt))
+
+    def is_retryable_response(self, response: "Response | AsyncResponse") -> bool:
+        return response.status_code in self.__retry_status_codes
+
+    @staticmethod
+    def is_retryable_exception(exception: Exception) -> bool:
+        """
+        Whether the given exception means the connection failed or timed out (for blocking or async requests).
+        """
+        if isinstance(exception, (ConnectionError, Timeout, ChunkedEncodingError)):
+            return True
+        # aiohttp is optional and only imported by async requests, so any exception of it has it imported already
+        aiohttp = sys.modules.get("aiohttp")
+        return aiohttp is not None and isinstance(exception, (aiohttp.ClientConnectionError,
+                                                              aiohttp.ClientPayloadError,
+                                                              asyncio.TimeoutError))
@@ -0,0 +1,63 @@
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from pymfl.api.transport.Deadline import Deadline
+from pymfl.exception import DeadlineExceededException
+
+
+class _Call:
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls.
+    While a call for a key is in flight, any other thread calling with the same key waits for it
+    and receives the same result, or has the same exception raised.
+    Waiting threads give up with a DeadlineExceededException once their current Deadline passes.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__call_by_key: dict[Hashable, _Call] = dict()
+        self.__coalesced_calls = 0
+
+    @property
+    def coalesced_calls(self) -> int:
+        """
+        How many calls have been served by waiting on an identical in-flight call.
+        """
+        return self.__coalesced_calls
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        with self.__lock:
+            call = self.__call_by_key.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self.__call_by_key[key] = call
+            else:
+                self.__coalesced_calls += 1
+        if not is_leader:
+            # the leader may have no deadline (or a later one), so waiting for it is bounded by the current deadline
+            deadline = Deadline.get_current()
+            if not call.done.wait(deadline.remaining_seconds if deadline is not None else None):
+                raise DeadlineExceededException("The deadline passed while waiting for an identical request.")
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__call_by_key[key]
+            call.done.set()
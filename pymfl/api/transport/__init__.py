@@ -0,0 +1,8 @@
+from .CircuitBreaker import CircuitBreaker
+from .ConnectionPool import ConnectionPool, ConnectionPoolStats
+from .Deadline import Deadline
+from .HostResolver import HostResolver
+from .RateLimiter import RateLimiter
+from .RequestTimeout import RequestTimeout
+from .RetryPolicy import RetryPolicy
+from .SingleFlight import SingleFlight
@@ -0,0 +1,156 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Any
+
+from pymfl.api import CommonLeagueInfoAPIClient, ScoringAndResultsAPIClient, DraftAndAuctionAPIClient, \
+    TransactionsAPIClient
+from pymfl.api.batch import BatchExecutor, CallSpec
+from pymfl.backfill.BackfillTask import BackfillTask
+from pymfl.backfill.CheckpointJournal import CheckpointJournal
+from pymfl.backfill.sink import BackfillSink
+
+
+@dataclass(kw_only=True, frozen=True)
+class BackfillProgress:
+    """
+    Used to hold the progress of a backfill.
+
+    skipped_tasks: Tasks already completed by an earlier, interrupted backfill.
+    """
+    total_tasks: int
+    skipped_tasks: int
+    completed_tasks: int
+    failed_tasks: int
+    elapsed_seconds: float
+
+    @property
+    def remaining_tasks(self) -> int:
+        return self.total_tasks - self.skipped_tasks - self.completed_tasks - self.failed_tasks
+
+    @property
+    def tasks_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.completed_tasks / self.elapsed_seconds
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """
+        The estimated time left at the current throughput, or None until a task has completed.
+        """
+        if self.tasks_per_second <= 0:
+            return None
+        return self.remaining_tasks / self.tasks_per_second
+
+
+@dataclass(kw_only=True, frozen=True)
+class BackfillReport:
+    """
+    Used to hold the outcome of a backfill.
+    Failed tasks are not checkpointed, so running the backfill again retries them.
+    """
+    progress: BackfillProgress
+    failures: dict[BackfillTask, Exception]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+class BackfillPipeline:
+    """
+    Rebuilds league history: for each year and league it fetches the league, the weekly results of every week,
+    the draft results and the transactions, and writes every response to a BackfillSink.
+    Tasks run on a BatchExecutor with bounded concurrency.
+    Completed tasks are recorded in a CheckpointJournal (after the sink has been flushed),
+    so a backfill that crashed or was interrupted resumes where it stopped instead of fetching everything again.
+
+    journal: Where to checkpoint completed tasks. Without one, nothing is resumable.
+    checkpoint_interval: How many completed tasks to write between flushing the sink and checkpointing them.
+    on_progress: Called with the BackfillProgress after every finished task.
+    """
+    METHOD_BY_TYPE: dict[str, Callable[..., dict]] = {
+        "league": CommonLeagueInfoAPIClient.get_league,
+        "weekly_results": ScoringAndResultsAPIClient.get_weekly_results,
+        "draft_results": DraftAndAuctionAPIClient.get_draft_results,
+        "transactions": TransactionsAPIClient.get_transactions
+    }
+
+    def __init__(self, *, sink: BackfillSink, journal: Optional[CheckpointJournal] = None, max_concurrency: int = 10,
+                 checkpoint_interval: int = 50, on_progress: Optional[Callable[[BackfillProgress], Any]] = None):
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1.")
+        self.__sink = sink
+        self.__journal = journal
+        self.__batch_executor = BatchExecutor(max_concurrency=max_concurrency)
+        self.__checkpoint_interval = checkpoint_interval
+        self.__on_progress = on_progress
+
+    @staticmethod
+    def plan(year_and_league_ids: Iterable[tuple[int, str]],
+             weeks: Optional[Iterable[int]] = None) -> list[BackfillTask]:
+        """
+        Returns every task needed to backfill the given leagues.
+
+        weeks: The weeks to fetch weekly results for.
+               Defaults to every week of the season (17 weeks until 2020, 18 weeks since 2021).
+        """
+        tasks = list()
+        for year, league_id in year_and_league_ids:
+            tasks.append(BackfillTask(year=year, league_id=league_id, type="league"))
+            for week in weeks if weeks is not None else range(1, 18 if year < 2021 else 19):
+                tasks.append(BackfillTask(year=year, league_id=league_id, type="weekly_results", week=week))
+            tasks.append(BackfillTask(year=year, league_id=league_id, type="draft_results"))
+            tasks.append(BackfillTask(year=year, league_id=league_id, type="transactions"))
+        return tasks
+
+    def run(self, tasks: Iterable[BackfillTask]) -> BackfillReport:
+        """
+        Runs every given task that is not already checkpointed and returns the outcome.
+        """
+        start = time.monotonic()
+        tasks = list(tasks)
+        pending_tasks = [task for task in tasks if self.__journal is None or not self.__journal.is_completed(task.key)]
+        skipped_tasks = len(tasks) - len(pending_tasks)
+        task_by_call_spec = {self.__to_call_spec(task): task for task in pending_tasks}
+        uncheckpointed_keys: list[str] = list()
+        failures: dict[BackfillTask, Exception] = dict()
+        completed_tasks = 0
+        try:
+            for batch_result in self.__batch_executor.stream(task_by_call_spec.keys()):
+                task = task_by_call_spec[batch_result.call_spec]
+                if batch_result.ok:
+                    self.__sink.write(task, batch_result.response)
+                    uncheckpointed_keys.append(task.key)
+                    completed_tasks += 1
+                    if len(uncheckpointed_keys) >= self.__checkpoint_interval:
+                        self.__checkpoint(uncheckpointed_keys)
+                else:
+                    failures[task] = batch_result.exception
+                if self.__on_progress is not None:
+                    self.__on_progress(BackfillProgress(total_tasks=len(tasks),
+                                                        skipped_tasks=skipped_tasks,
+                                                        completed_tasks=completed_tasks,
+                                                        failed_tasks=len(failures),
+                                                        elapsed_seconds=time.monotonic() - start))
+        finally:
+            # whatever was written before an interruption is still checkpointed
+            self.__checkpoint(uncheckpointed_keys)
+        return BackfillReport(progress=BackfillProgress(total_tasks=len(tasks),
+                                                        skipped_tasks=skipped_tasks,
+                                                        completed_tasks=completed_tasks,
+                                                        failed_tasks=len(failures),
+                                                        elapsed_seconds=time.monotonic() - start),
+                              failures=failures)
+
+    def __checkpoint(self, uncheckpointed_keys: list[str]):
+        self.__sink.flush()
+        if self.__journal is not None:
+            self.__journal.mark_completed(uncheckpointed_keys)
+        uncheckpointed_keys.clear()
+
+    def __to_call_spec(self, task: BackfillTask) -> CallSpec:
+        kwargs = dict()
+        if task.week is not None:
+            kwargs["week"] = task.week
+        return CallSpec(method=self.METHOD_BY_TYPE[task.type], year=task.year, league_id=task.league_id, kwargs=kwargs)
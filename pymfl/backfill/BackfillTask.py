@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True)
+class BackfillTask:
+    """
+    Used to describe a single export to fetch as part of a backfill.
+
+    type: What to fetch, one of BackfillTask.TYPES.
+    week: The week to fetch, only used for "weekly_results".
+    """
+    TYPES = ("league", "weekly_results", "draft_results", "transactions")
+
+    year: int
+    league_id: str
+    type: str
+    week: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        """
+        Uniquely identifies the task in a CheckpointJournal.
+        """
+        key = f"{self.year}/{self.league_id}/{self.type}"
+        if self.week is not None:
+            key = f"{key}/{self.week}"
+        return key
@@ -0,0 +1,54 @@
+import os
+import threading
+from typing import Iterable
+
+
+class CheckpointJournal:
+    """
+    An append-only file of the keys of completed BackfillTasks, so an interrupted backfill resumes where it stopped.
+    Every batch of keys is flushed and fsynced before mark_completed returns.
+
+    path: The journal file to use. It is created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self.__path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__completed_keys: set[str] = set()
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                content = f.read()
+            complete_length = content.rfind(b"\n") + 1
+            if complete_length < len(content):
+                # a crash mid-write can leave a partial last line, which could look like another task's key
+                os.truncate(path, complete_length)
+            self.__completed_keys.update(content[:complete_length].decode("utf-8").splitlines())
+
+    def __len__(self) -> int:
+        return len(self.__completed_keys)
+
+    def is_completed(self, key: str) -> bool:
+        with self.__lock:
+            return key in self.__completed_keys
+
+    def mark_completed(self, keys: Iterable[str]):
+        with self.__lock:
+            keys = [key for key in keys if key not in self.__completed_keys]
+            if not keys:
+                return
+            with open(self.__path, "a", encoding="utf-8") as f:
+                f.write("".join(f"{key}\n" for key in keys))
+                f.flush()
+                os.fsync(f.fileno())
+            self.__completed_keys.update(keys)
+
+    def clear(self):
+        """
+        Forgets every completed task, so the next backfill starts over.
+        """
+        with self.__lock:
+            self.__completed_keys.clear()
+            if os.path.exists(self.__path):
+                os.remove(self.__path)
@@ -0,0 +1,3 @@
+from .BackfillPipeline import BackfillPipeline, BackfillProgress, BackfillReport
+from .BackfillTask import BackfillTask
+from .CheckpointJournal import CheckpointJournal
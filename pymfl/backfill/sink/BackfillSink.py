@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from pymfl.backfill.BackfillTask import BackfillTask
+
+
+class BackfillSink(ABC):
+    """
+    Should be inherited by all backfill sinks.
+    A BackfillPipeline writes the response of every completed task to its sink and only checkpoints tasks
+    after the sink has been flushed, so everything written before flush() must be durable after it.
+    """
+
+    @abstractmethod
+    def write(self, task: BackfillTask, response: dict):
+        ...
+
+    @abstractmethod
+    def flush(self):
+        ...
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,35 @@
+import json
+import os
+
+from pymfl.backfill.BackfillTask import BackfillTask
+from pymfl.backfill.sink.BackfillSink import BackfillSink
+
+
+class NDJSONSink(BackfillSink):
+    """
+    Appends one JSON line per task to a file:
+    {"year": ..., "league_id": ..., "type": ..., "week": ..., "response": ...}
+    A task that was written but not yet checkpointed when a backfill crashed is written again on resume.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.__file = open(path, "a", encoding="utf-8")
+
+    def write(self, task: BackfillTask, response: dict):
+        self.__file.write(json.dumps({"year": task.year,
+                                      "league_id": task.league_id,
+                                      "type": task.type,
+                                      "week": task.week,
+                                      "response": response}))
+        self.__file.write("\n")
+
+    def flush(self):
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+
+    def close(self):
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
@@ -0,0 +1,48 @@
+import json
+import os
+import uuid
+
+from pymfl.backfill.BackfillTask import BackfillTask
+from pymfl.backfill.sink.BackfillSink import BackfillSink
+
+
+class ParquetSink(BackfillSink):
+    """
+    Writes tasks to Parquet files in a directory, one new part file per flush
+    with the columns year, league_id, type, week and response (as a JSON string).
+    Parquet files cannot be appended to, so every flush (and every resumed backfill) adds files instead.
+    Requires the optional "pyarrow" dependency.
+    """
+
+    def __init__(self, directory: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("ParquetSink requires pyarrow: pip install pymfl[parquet]") from e
+        self.__pyarrow = pyarrow
+        self.__directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.__rows: list[tuple] = list()
+        self.__run_id = uuid.uuid4().hex
+        self.__part = 0
+
+    def write(self, task: BackfillTask, response: dict):
+        self.__rows.append((task.year, task.league_id, task.type, task.week, json.dumps(response)))
+
+    def flush(self):
+        if not self.__rows:
+            return
+        years, league_ids, types, weeks, responses = zip(*self.__rows)
+        table = self.__pyarrow.table({"year": self.__pyarrow.array(years, type=self.__pyarrow.int32()),
+                                      "league_id": self.__pyarrow.array(league_ids, type=self.__pyarrow.string()),
+                                      "type": self.__pyarrow.array(types, type=self.__pyarrow.string()),
+                                      "week": self.__pyarrow.array(weeks, type=self.__pyarrow.int32()),
+                                      "response": self.__pyarrow.array(responses, type=self.__pyarrow.string())})
+        path = os.path.join(self.__directory, f"part-{self.__run_id}-{self.__part:05d}.parquet")
+        # write under a temporary name first, so a crash never leaves a truncated part file behind
+        temporary_path = f"{path}.tmp"
+        self.__pyarrow.parquet.write_table(table, temporary_path)
+        os.replace(temporary_path, path)
+        self.__part += 1
+        self.__rows.clear()
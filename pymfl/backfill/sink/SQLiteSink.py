@@ -0,0 +1,41 @@
+import json
+import os
+import sqlite3
+
+from pymfl.backfill.BackfillTask import BackfillTask
+from pymfl.backfill.sink.BackfillSink import BackfillSink
+
+
+class SQLiteSink(BackfillSink):
+    """
+    Writes one row per task to the "backfill" table of a SQLite database, keyed by the task key.
+    Rewriting a task replaces its row, so resuming a backfill never duplicates data.
+    """
+    __SCHEMA = """
+        CREATE TABLE IF NOT EXISTS backfill (
+            key TEXT PRIMARY KEY,
+            year INTEGER NOT NULL,
+            league_id TEXT NOT NULL,
+            type TEXT NOT NULL,
+            week INTEGER,
+            response TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(path)
+        with self.__connection:
+            self.__connection.execute(self.__SCHEMA)
+
+    def write(self, task: BackfillTask, response: dict):
+        self.__connection.execute("INSERT OR REPLACE INTO backfill VALUES (?, ?, ?, ?, ?, ?)",
+                                  (task.key, task.year, task.league_id, task.type, task.week, json.dumps(response)))
+
+    def flush(self):
+        self.__connection.commit()
+
+    def close(self):
+        self.flush()
+        self.__connection.close()
@@ -0,0 +1,4 @@
+from .BackfillSink import BackfillSink
+from .NDJSONSink import NDJSONSink
+from .ParquetSink import ParquetSink
+from .SQLiteSink import SQLiteSink
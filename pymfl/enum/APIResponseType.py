@@ -5,3 +5,4 @@ from enum import unique, Enum, auto
 class APIResponseType(Enum):
     JSON = auto()
     CONTENT = auto()
+    LAZY = auto()
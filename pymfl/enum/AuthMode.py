@@ -0,0 +1,7 @@
+from enum import unique, Enum, auto
+
+
+@unique
+class AuthMode(Enum):
+    LOGIN = auto()
+    API_KEY = auto()
@@ -0,0 +1,8 @@
+from enum import unique, Enum, auto
+
+
+@unique
+class CircuitState(Enum):
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
@@ -0,0 +1,7 @@
+from enum import unique, Enum, auto
+
+
+@unique
+class ScoreEventType(Enum):
+    FRANCHISE = auto()
+    PLAYER = auto()
\ No newline at end of file
@@ -1 +1,4 @@
 from .APIResponseType import APIResponseType
+from .AuthMode import AuthMode
+from .CircuitState import CircuitState
+from .ScoreEventType import ScoreEventType
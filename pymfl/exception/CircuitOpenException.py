@@ -0,0 +1,8 @@
+from pymfl.exception.MFLAPIClientException import MFLAPIClientException
+
+
+class CircuitOpenException(MFLAPIClientException):
+    """
+    Raised when a request is rejected because the circuit breaker for its host is open.
+    """
+    ...
@@ -0,0 +1,8 @@
+from pymfl.exception.MFLAPIClientException import MFLAPIClientException
+
+
+class DeadlineExceededException(MFLAPIClientException):
+    """
+    Raised when a request or batch call is skipped because its Deadline has passed.
+    """
+    ...
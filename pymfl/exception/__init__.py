@@ -1,2 +1,4 @@
+from .CircuitOpenException import CircuitOpenException
+from .DeadlineExceededException import DeadlineExceededException
 from .MFLAPIClientException import MFLAPIClientException
 from .MissingYearAPIConfigException import MissingYearAPIConfigException
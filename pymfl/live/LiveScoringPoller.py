@@ -0,0 +1,145 @@
+import threading
+from typing import Callable, Optional, Any
+
+from pymfl.api import ScoringAndResultsAPIClient
+from pymfl.enum import ScoreEventType
+from pymfl.live.ScoreEvent import ScoreEvent
+from pymfl.util.RecordConverter import RecordConverter
+
+
+class LiveScoringPoller:
+    """
+    Polls ScoringAndResultsAPIClient.get_live_scoring for a league and emits only the franchise and player scores
+    that changed since the previous poll to its subscribers.
+    The first poll emits every score.
+
+    Polls are scheduled adaptively from the last response:
+    every live_interval_seconds while any of the league's players is playing,
+    every waiting_interval_seconds while games are left (gameSecondsRemaining) but none are in progress,
+    and every idle_interval_seconds once every game of the week is over.
+
+    week: The week to poll, defaults to the current week.
+    details: Whether to also poll the scores of non-starters.
+    on_error: Called with any exception raised while polling in the background, which keeps polling.
+    """
+
+    def __init__(self, *, year: int, league_id: str, week: Optional[int] = None, details: bool = False,
+                 live_interval_seconds: float = 15.0, waiting_interval_seconds: float = 120.0,
+                 idle_interval_seconds: float = 900.0, on_error: Optional[Callable[[Exception], Any]] = None):
+        self.__year = year
+        self.__league_id = league_id
+        self.__week = week
+        self.__details = details
+        self.__live_interval_seconds = live_interval_seconds
+        self.__waiting_interval_seconds = waiting_interval_seconds
+        self.__idle_interval_seconds = idle_interval_seconds
+        self.__on_error = on_error
+        self.__lock = threading.Lock()
+        self.__subscribers: list[Callable[[list[ScoreEvent]], Any]] = list()
+        # (franchise id, player id or None) -> score
+        self.__scores: dict[tuple[str, Optional[str]], Optional[float]] = dict()
+        self.__next_interval_seconds = live_interval_seconds
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def next_interval_seconds(self) -> float:
+        """
+        How long to wait before the next poll, based on the last response.
+        """
+        return self.__next_interval_seconds
+
+    def subscribe(self, subscriber: Callable[[list[ScoreEvent]], Any]):
+        """
+        Calls the given subscriber with the list of changed scores after every poll that changed any.
+        """
+        with self.__lock:
+            self.__subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Callable[[list[ScoreEvent]], Any]):
+        with self.__lock:
+            self.__subscribers.remove(subscriber)
+
+    def poll(self) -> list[ScoreEvent]:
+        """
+        Fetches live scoring once, notifies subscribers of the changed scores and returns them.
+        """
+        # a cached response may be a few seconds old, which would be diffed against itself
+        with ScoringAndResultsAPIClient.bypass_response_cache():
+            response = ScoringAndResultsAPIClient.get_live_scoring(year=self.__year,
+                                                                   league_id=self.__league_id,
+                                                                   week=self.__week,
+                                                                   details=1 if self.__details else None)
+        live_scoring = response.get("liveScoring", dict())
+        week = RecordConverter.to_int(live_scoring.get("week"))
+        franchises = [franchise for matchup in RecordConverter.as_list(live_scoring.get("matchup"))
+                      for franchise in RecordConverter.as_list(matchup.get("franchise"))]
+        franchises.extend(RecordConverter.as_list(live_scoring.get("franchise")))
+        events = list()
+        is_live = False
+        has_games_left = False
+        with self.__lock:
+            for franchise in franchises:
+                franchise_id = franchise["id"]
+                game_seconds_remaining = RecordConverter.to_int(franchise.get("gameSecondsRemaining"))
+                is_live |= (RecordConverter.to_int(franchise.get("playersCurrentlyPlaying")) or 0) > 0
+                has_games_left |= (game_seconds_remaining or 0) > 0
+                self.__diff(events, ScoreEventType.FRANCHISE, week, franchise_id, None,
+                            RecordConverter.to_float(franchise.get("score")), game_seconds_remaining)
+                for player in RecordConverter.as_list(franchise.get("players", dict()).get("player")):
+                    self.__diff(events, ScoreEventType.PLAYER, week, franchise_id, player["id"],
+                                RecordConverter.to_float(player.get("score")),
+                                RecordConverter.to_int(player.get("gameSecondsRemaining")))
+            if is_live:
+                self.__next_interval_seconds = self.__live_interval_seconds
+            elif has_games_left:
+                self.__next_interval_seconds = self.__waiting_interval_seconds
+            else:
+                self.__next_interval_seconds = self.__idle_interval_seconds
+            subscribers = list(self.__subscribers)
+        if events:
+            for subscriber in subscribers:
+                subscriber(events)
+        return events
+
+    def start(self):
+        """
+        Starts polling on a background thread until stop() is called.
+        """
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__run, name="LiveScoringPoller", daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops the background polling and waits for an in-progress poll to finish.
+        """
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __run(self):
+        while not self.__stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                if self.__on_error is not None:
+                    self.__on_error(e)
+            self.__stop_event.wait(self.__next_interval_seconds)
+
+    def __diff(self, events: list[ScoreEvent], event_type: ScoreEventType, week: Optional[int], franchise_id: str,
+               player_id: Optional[str], score: Optional[float], game_seconds_remaining: Optional[int]):
+        key = (franchise_id, player_id)
+        if key in self.__scores and self.__scores[key] == score:
+            return
+        events.append(ScoreEvent(type=event_type,
+                                 week=week,
+                                 franchise_id=franchise_id,
+                                 player_id=player_id,
+                                 previous_score=self.__scores.get(key),
+                                 score=score,
+                                 game_seconds_remaining=game_seconds_remaining))
+        self.__scores[key] = score
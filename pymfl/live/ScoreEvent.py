@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from pymfl.enum import ScoreEventType
+
+
+@dataclass(kw_only=True, frozen=True)
+class ScoreEvent:
+    """
+    Used to hold a change in a franchise's or player's live score.
+    previous_score is None the first time a score is seen.
+
+    player_id: Only set for ScoreEventType.PLAYER events.
+    """
+    type: ScoreEventType
+    week: Optional[int]
+    franchise_id: str
+    player_id: Optional[str]
+    previous_score: Optional[float]
+    score: Optional[float]
+    game_seconds_remaining: Optional[int]
@@ -0,0 +1,2 @@
+from .LiveScoringPoller import LiveScoringPoller
+from .ScoreEvent import ScoreEvent
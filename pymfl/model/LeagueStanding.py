@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class LeagueStanding:
+    """
+    Used to hold a franchise's standing from a "leagueStandings" export.
+    """
+    franchise_id: str
+    h2h_wins: Optional[int]
+    h2h_losses: Optional[int]
+    h2h_ties: Optional[int]
+    all_play_wins: Optional[int]
+    all_play_losses: Optional[int]
+    all_play_ties: Optional[int]
+    points_for: Optional[float]
+    points_against: Optional[float]
+    potential_points: Optional[float]
@@ -0,0 +1,147 @@
+import sys
+
+from pymfl.model.LeagueStanding import LeagueStanding
+from pymfl.model.Player import Player
+from pymfl.model.PlayerScore import PlayerScore
+from pymfl.model.Roster import Roster, RosterPlayer
+from pymfl.model.Transaction import Transaction
+from pymfl.model.WeeklyResults import WeeklyResults, Matchup, MatchupFranchise, MatchupPlayer
+from pymfl.util.RecordConverter import RecordConverter
+
+
+class ModelConverter:
+    """
+    Converts raw JSON responses of the API Clients into compact, typed models.
+    Numeric fields are parsed once (empty values become None)
+    and values that repeat across records and leagues (ids, positions, teams, statuses, types) share one string object.
+    """
+
+    @classmethod
+    def to_players(cls, players_response: dict) -> tuple[Player, ...]:
+        """
+        Converts the response of FantasyContentAPIClient.get_players.
+        """
+        return tuple(cls.to_player(player)
+                     for player in RecordConverter.as_list(players_response["players"].get("player")))
+
+    @classmethod
+    def to_player(cls, player: dict) -> Player:
+        """
+        Converts a single player, i.e. a record of FantasyContentAPIClient.iter_players.
+        """
+        return Player(id=cls.__intern(player["id"]),
+                      name=player.get("name", ""),
+                      position=cls.__intern(player.get("position", "")),
+                      team=cls.__intern(player.get("team", "")))
+
+    @classmethod
+    def to_rosters(cls, rosters_response: dict) -> tuple[Roster, ...]:
+        """
+        Converts the response of CommonLeagueInfoAPIClient.get_rosters.
+        """
+        return tuple(Roster(franchise_id=cls.__intern(franchise["id"]),
+                            week=RecordConverter.to_int(franchise.get("week")),
+                            players=tuple(RosterPlayer(id=cls.__intern(player["id"]),
+                                                       status=cls.__intern(player.get("status", "")),
+                                                       salary=RecordConverter.to_float(player.get("salary")),
+                                                       contract_year=RecordConverter.to_int(player.get("contractYear")),
+                                                       contract_info=player.get("contractInfo") or None)
+                                          for player in RecordConverter.as_list(franchise.get("player"))))
+                     for franchise in RecordConverter.as_list(rosters_response["rosters"].get("franchise")))
+
+    @classmethod
+    def to_weekly_results(cls, weekly_results_response: dict) -> tuple[WeeklyResults, ...]:
+        """
+        Converts the response of ScoringAndResultsAPIClient.get_weekly_results,
+        which holds a single week, or every week when called with week="YTD".
+        """
+        if "allWeeklyResults" in weekly_results_response:
+            weeks = RecordConverter.as_list(weekly_results_response["allWeeklyResults"].get("weeklyResults"))
+        else:
+            weeks = [weekly_results_response["weeklyResults"]]
+        return tuple(WeeklyResults(week=RecordConverter.to_int(week.get("week")),
+                                   matchups=tuple(Matchup(franchises=tuple(
+                                       cls.__to_matchup_franchise(franchise)
+                                       for franchise in RecordConverter.as_list(matchup.get("franchise"))))
+                                                  for matchup in RecordConverter.as_list(week.get("matchup"))),
+                                   franchises=tuple(cls.__to_matchup_franchise(franchise)
+                                                    for franchise in RecordConverter.as_list(week.get("franchise"))))
+                     for week in weeks)
+
+    @classmethod
+    def to_player_scores(cls, player_scores_response: dict) -> tuple[PlayerScore, ...]:
+        """
+        Converts the response of ScoringAndResultsAPIClient.get_player_scores.
+        """
+        player_scores = player_scores_response["playerScores"].get("playerScore")
+        return tuple(cls.to_player_score(player_score) for player_score in RecordConverter.as_list(player_scores))
+
+    @classmethod
+    def to_player_score(cls, player_score: dict) -> PlayerScore:
+        """
+        Converts a single player score, i.e. a record of ScoringAndResultsAPIClient.iter_player_scores.
+        """
+        return PlayerScore(id=cls.__intern(player_score["id"]),
+                           score=RecordConverter.to_float(player_score.get("score")),
+                           is_available=RecordConverter.to_bool(player_score.get("isAvailable")))
+
+    @classmethod
+    def to_transactions(cls, transactions_response: dict) -> tuple[Transaction, ...]:
+        """
+        Converts the response of TransactionsAPIClient.get_transactions.
+        """
+        transactions = transactions_response["transactions"].get("transaction")
+        return tuple(cls.to_transaction(transaction) for transaction in RecordConverter.as_list(transactions))
+
+    @classmethod
+    def to_transaction(cls, transaction: dict) -> Transaction:
+        """
+        Converts a single transaction, i.e. a record of TransactionsAPIClient.iter_transactions.
+        """
+        return Transaction(type=cls.__intern(transaction.get("type", "")),
+                           franchise_id=cls.__intern(transaction.get("franchise", "")),
+                           timestamp=RecordConverter.to_int(transaction.get("timestamp")),
+                           transaction=transaction.get("transaction") or None,
+                           franchise2_id=(cls.__intern(transaction["franchise2"])
+                                          if transaction.get("franchise2") else None),
+                           franchise1_gave_up=transaction.get("franchise1_gave_up") or None,
+                           franchise2_gave_up=transaction.get("franchise2_gave_up") or None,
+                           comments=transaction.get("comments") or None)
+
+    @classmethod
+    def to_league_standings(cls, league_standings_response: dict) -> tuple[LeagueStanding, ...]:
+        """
+        Converts the response of ScoringAndResultsAPIClient.get_league_standings.
+        """
+        return tuple(LeagueStanding(franchise_id=cls.__intern(franchise["id"]),
+                                    h2h_wins=RecordConverter.to_int(franchise.get("h2hw")),
+                                    h2h_losses=RecordConverter.to_int(franchise.get("h2hl")),
+                                    h2h_ties=RecordConverter.to_int(franchise.get("h2ht")),
+                                    all_play_wins=RecordConverter.to_int(franchise.get("all_play_w")),
+                                    all_play_losses=RecordConverter.to_int(franchise.get("all_play_l")),
+                                    all_play_ties=RecordConverter.to_int(franchise.get("all_play_t")),
+                                    points_for=RecordConverter.to_float(franchise.get("pf")),
+                                    points_against=RecordConverter.to_float(franchise.get("pa")),
+                                    potential_points=RecordConverter.to_float(franchise.get("pp")))
+                     for franchise in
+                     RecordConverter.as_list(league_standings_response["leagueStandings"].get("franchise")))
+
+    @classmethod
+    def __to_matchup_franchise(cls, franchise: dict) -> MatchupFranchise:
+        players = franchise.get("players", dict()).get("player")
+        return MatchupFranchise(id=cls.__intern(franchise["id"]),
+                                score=RecordConverter.to_float(franchise.get("score")),
+                                result=cls.__intern(franchise["result"]) if franchise.get("result") else None,
+                                is_home=RecordConverter.to_bool(franchise.get("isHome")),
+                                starters=tuple(cls.__intern(player_id)
+                                               for player_id in franchise.get("starters", "").split(",") if player_id),
+                                players=tuple(MatchupPlayer(id=cls.__intern(player["id"]),
+                                                            score=RecordConverter.to_float(player.get("score")),
+                                                            status=cls.__intern(player.get("status", "")),
+                                                            should_start=RecordConverter.to_bool(
+                                                                player.get("shouldStart")))
+                                              for player in RecordConverter.as_list(players)))
+
+    @staticmethod
+    def __intern(value: str) -> str:
+        return sys.intern(value)
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Player:
+    """
+    Used to hold a player from a "players" export.
+    """
+    id: str
+    name: str
+    position: str
+    team: str
+
+    @property
+    def first_name(self) -> str:
+        # MFL names are formatted as "Last, First"
+        return self.name.partition(", ")[2]
+
+    @property
+    def last_name(self) -> str:
+        return self.name.partition(", ")[0]
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class PlayerScore:
+    """
+    Used to hold a player's score from a "playerScores" export.
+    """
+    id: str
+    score: Optional[float]
+    is_available: Optional[bool]
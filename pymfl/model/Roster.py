@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class RosterPlayer:
+    """
+    Used to hold a player on a franchise's roster.
+    """
+    id: str
+    status: str
+    salary: Optional[float]
+    contract_year: Optional[int]
+    contract_info: Optional[str]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Roster:
+    """
+    Used to hold a franchise's roster from a "rosters" export.
+    """
+    franchise_id: str
+    week: Optional[int]
+    players: tuple[RosterPlayer, ...]
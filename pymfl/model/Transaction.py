@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Transaction:
+    """
+    Used to hold a transaction from a "transactions" export.
+    The franchise2 and gave_up fields are only set for trades.
+    """
+    type: str
+    franchise_id: str
+    timestamp: Optional[int]
+    transaction: Optional[str]
+    franchise2_id: Optional[str]
+    franchise1_gave_up: Optional[str]
+    franchise2_gave_up: Optional[str]
+    comments: Optional[str]
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class MatchupPlayer:
+    """
+    Used to hold a player's score for a franchise in a week.
+    """
+    id: str
+    score: Optional[float]
+    status: str
+    should_start: Optional[bool]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class MatchupFranchise:
+    """
+    Used to hold a franchise's result in a week.
+    """
+    id: str
+    score: Optional[float]
+    result: Optional[str]
+    is_home: Optional[bool]
+    starters: tuple[str, ...]
+    players: tuple[MatchupPlayer, ...]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Matchup:
+    """
+    Used to hold a head-to-head matchup between franchises.
+    """
+    franchises: tuple[MatchupFranchise, ...]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class WeeklyResults:
+    """
+    Used to hold a "weeklyResults" export.
+    franchises holds the results of franchises that are not in a matchup (i.e. in leagues without head-to-head play).
+    """
+    week: Optional[int]
+    matchups: tuple[Matchup, ...]
+    franchises: tuple[MatchupFranchise, ...]
@@ -0,0 +1,7 @@
+from .LeagueStanding import LeagueStanding
+from .ModelConverter import ModelConverter
+from .Player import Player
+from .PlayerScore import PlayerScore
+from .Roster import Roster, RosterPlayer
+from .Transaction import Transaction
+from .WeeklyResults import WeeklyResults, Matchup, MatchupFranchise, MatchupPlayer
@@ -0,0 +1,145 @@
+import bisect
+import re
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from pymfl.model import ModelConverter, Player
+from pymfl.util import RecordConverter
+
+
+class PlayerIndex:
+    """
+    An in-memory index of players, built from the response of FantasyContentAPIClient.get_players
+    (or from any iterable of player dicts, such as PlayerStore.get_players().values()).
+    Supports O(1) lookups by id, prefix and fuzzy name search and filtering by position/team.
+    Players are held as pymfl.model.Player, converted with ModelConverter.to_player.
+
+    Prefix search uses a sorted array of name keys ("tom brady", "brady tom", "brady", "tom"),
+    fuzzy search uses a trigram index and position/team filters use precomputed buckets.
+    """
+    __NON_ALPHANUMERIC = re.compile(r"[^a-z0-9 ]+")
+
+    def __init__(self, players: Iterable[dict]):
+        self.__entry_by_id: dict[str, Player] = dict()
+        for player in players:
+            entry = ModelConverter.to_player(player)
+            self.__entry_by_id[entry.id] = entry
+        self.__entries_by_position: dict[str, list[Player]] = defaultdict(list)
+        self.__entries_by_team: dict[str, list[Player]] = defaultdict(list)
+        name_keys: list[tuple[str, str]] = list()
+        self.__ids_by_trigram: dict[str, list[str]] = defaultdict(list)
+        self.__trigram_count_by_id: dict[str, int] = dict()
+        for entry in self.__entry_by_id.values():
+            self.__entries_by_position[entry.position].append(entry)
+            self.__entries_by_team[entry.team].append(entry)
+            for name_key in self.__get_name_keys(entry.name):
+                name_keys.append((name_key, entry.id))
+            trigrams = self.__get_trigrams(self.__normalize(entry.name))
+            for trigram in trigrams:
+                self.__ids_by_trigram[trigram].append(entry.id)
+            self.__trigram_count_by_id[entry.id] = len(trigrams)
+        name_keys.sort()
+        self.__name_keys = [name_key for name_key, _ in name_keys]
+        self.__name_key_ids = [player_id for _, player_id in name_keys]
+
+    @classmethod
+    def from_response(cls, response: dict) -> "PlayerIndex":
+        """
+        Builds a PlayerIndex from the response of FantasyContentAPIClient.get_players.
+        """
+        return cls(RecordConverter.as_list(response.get("players", dict()).get("player")))
+
+    def __len__(self) -> int:
+        return len(self.__entry_by_id)
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self.__entry_by_id
+
+    def get(self, player_id: str) -> Optional[Player]:
+        return self.__entry_by_id.get(player_id)
+
+    def resolve(self, player_ids: Iterable[str]) -> list[Optional[Player]]:
+        """
+        Returns the Player for each given player id, or None for unknown ids.
+        """
+        entry_by_id = self.__entry_by_id
+        return [entry_by_id.get(player_id) for player_id in player_ids]
+
+    def search_prefix(self, prefix: str, *, limit: Optional[int] = None) -> list[Player]:
+        """
+        Returns players whose first name, last name or full name (in either order) starts with the given prefix.
+        The search ignores case and punctuation.
+        """
+        prefix = self.__normalize(prefix)
+        if not prefix:
+            return list()
+        entries = list()
+        seen_ids = set()
+        i = bisect.bisect_left(self.__name_keys, prefix)
+        while i < len(self.__name_keys) and self.__name_keys[i].startswith(prefix):
+            player_id = self.__name_key_ids[i]
+            if player_id not in seen_ids:
+                seen_ids.add(player_id)
+                entries.append(self.__entry_by_id[player_id])
+                if limit is not None and len(entries) >= limit:
+                    break
+            i += 1
+        return entries
+
+    def search_fuzzy(self, name: str, *, limit: int = 10, min_similarity: float = 0.3) -> list[Player]:
+        """
+        Returns up to limit players whose names are most similar to the given name, most similar first.
+        Similarity is the Jaccard similarity of the names' trigrams, so misspellings still match.
+        """
+        trigrams = self.__get_trigrams(self.__normalize(name))
+        if not trigrams:
+            return list()
+        shared_count_by_id: dict[str, int] = defaultdict(int)
+        for trigram in trigrams:
+            for player_id in self.__ids_by_trigram.get(trigram, ()):
+                shared_count_by_id[player_id] += 1
+        scored_ids = list()
+        for player_id, shared_count in shared_count_by_id.items():
+            similarity = shared_count / (len(trigrams) + self.__trigram_count_by_id[player_id] - shared_count)
+            if similarity >= min_similarity:
+                scored_ids.append((similarity, player_id))
+        scored_ids.sort(key=lambda scored_id: (-scored_id[0], scored_id[1]))
+        return [self.__entry_by_id[player_id] for _, player_id in scored_ids[:limit]]
+
+    def filter(self, *, position: Optional[str] = None, team: Optional[str] = None) -> list[Player]:
+        """
+        Returns every player with the given position and/or team.
+        """
+        if position is None and team is None:
+            return list(self.__entry_by_id.values())
+        if position is None:
+            return list(self.__entries_by_team.get(team, ()))
+        if team is None:
+            return list(self.__entries_by_position.get(position, ()))
+        return [entry for entry in self.__entries_by_position.get(position, ()) if entry.team == team]
+
+    def get_positions(self) -> list[str]:
+        return sorted(self.__entries_by_position.keys())
+
+    def get_teams(self) -> list[str]:
+        return sorted(self.__entries_by_team.keys())
+
+    @classmethod
+    def __normalize(cls, name: str) -> str:
+        return " ".join(cls.__NON_ALPHANUMERIC.sub(" ", name.lower()).split())
+
+    @classmethod
+    def __get_name_keys(cls, name: str) -> set[str]:
+        last_name, _, first_name = name.partition(", ")
+        last_name = cls.__normalize(last_name)
+        first_name = cls.__normalize(first_name)
+        name_keys = {last_name, first_name, f"{first_name} {last_name}", f"{last_name} {first_name}"}
+        name_keys.update(cls.__normalize(name).split())
+        return {name_key.strip() for name_key in name_keys if name_key.strip()}
+
+    @staticmethod
+    def __get_trigrams(normalized_name: str) -> set[str]:
+        if not normalized_name:
+            return set()
+        padded_name = f"  {normalized_name} "
+        return {padded_name[i:i + 3] for i in range(len(padded_name) - 2)}
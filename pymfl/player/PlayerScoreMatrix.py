@@ -0,0 +1,198 @@
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from pymfl.api import ScoringAndResultsAPIClient
+from pymfl.api.batch import BatchExecutor, CallSpec
+from pymfl.model import ModelConverter
+from pymfl.player.PlayerIndex import PlayerIndex
+
+if TYPE_CHECKING:
+    import numpy
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("PlayerScoreMatrix requires numpy: pip install pymfl[numpy]") from e
+    return numpy
+
+
+class PlayerScoreMatrix:
+    """
+    A dense week x player matrix of the player scores of a season, as float32 with NaN where a player has no score.
+    Statistics are computed for all players at once with NumPy instead of walking nested dicts.
+    Requires the optional "numpy" dependency.
+
+    weeks: The week of each row.
+    player_ids: The player id of each column.
+    scores: The (len(weeks), len(player_ids)) score matrix.
+    positions: The position of each player id, used to filter by position.
+    """
+
+    def __init__(self, *, weeks: Iterable[int], player_ids: Iterable[str], scores: "numpy.ndarray",
+                 positions: Optional[dict[str, str]] = None):
+        numpy = _import_numpy()
+        self.__weeks = tuple(weeks)
+        self.__player_ids = tuple(player_ids)
+        self.__scores = numpy.asarray(scores, dtype=numpy.float32)
+        if self.__scores.shape != (len(self.__weeks), len(self.__player_ids)):
+            raise ValueError(f"scores must have shape ({len(self.__weeks)}, {len(self.__player_ids)}).")
+        self.__scores.flags.writeable = False
+        self.__week_index_by_week = {week: i for i, week in enumerate(self.__weeks)}
+        self.__player_index_by_player_id = {player_id: i for i, player_id in enumerate(self.__player_ids)}
+        positions = positions or dict()
+        self.__positions = numpy.array([positions.get(player_id, "") for player_id in self.__player_ids],
+                                       dtype=object)
+
+    @classmethod
+    def build(cls, *, year: int, league_id: str, weeks: Optional[Iterable[int]] = None,
+              player_index: Optional[PlayerIndex] = None, max_concurrency: int = 10) -> "PlayerScoreMatrix":
+        """
+        Fetches the player scores of every given week concurrently and builds the matrix.
+        Pass a PlayerIndex to be able to filter by position.
+        Raises the exception of the first week that could not be fetched.
+
+        weeks: Defaults to every week of the season (17 weeks until 2020, 18 weeks since 2021).
+        """
+        weeks = list(weeks if weeks is not None else range(1, 18 if year < 2021 else 19))
+        call_specs = [CallSpec(method=ScoringAndResultsAPIClient.get_player_scores, year=year, league_id=league_id,
+                               kwargs={"week": week}) for week in weeks]
+        batch_results = BatchExecutor(max_concurrency=max_concurrency).run(call_specs)
+        player_scores_responses_by_week = dict()
+        for week, call_spec in zip(weeks, call_specs):
+            batch_result = batch_results[call_spec]
+            if not batch_result.ok:
+                raise batch_result.exception
+            player_scores_responses_by_week[week] = batch_result.response
+        return cls.from_responses(player_scores_responses_by_week, player_index=player_index)
+
+    @classmethod
+    def from_responses(cls, player_scores_responses_by_week: dict[int, dict],
+                       player_index: Optional[PlayerIndex] = None) -> "PlayerScoreMatrix":
+        """
+        Builds the matrix from responses of ScoringAndResultsAPIClient.get_player_scores, keyed by week.
+        """
+        numpy = _import_numpy()
+        weeks = sorted(player_scores_responses_by_week)
+        player_scores_by_week = {week: ModelConverter.to_player_scores(player_scores_responses_by_week[week])
+                                 for week in weeks}
+        player_index_by_player_id: dict[str, int] = dict()
+        for player_scores in player_scores_by_week.values():
+            for player_score in player_scores:
+                player_index_by_player_id.setdefault(player_score.id, len(player_index_by_player_id))
+        scores = numpy.full((len(weeks), len(player_index_by_player_id)), numpy.nan, dtype=numpy.float32)
+        for week_index, week in enumerate(weeks):
+            player_scores = [player_score for player_score in player_scores_by_week[week]
+                             if player_score.score is not None]
+            player_indexes = [player_index_by_player_id[player_score.id] for player_score in player_scores]
+            scores[week_index, player_indexes] = [player_score.score for player_score in player_scores]
+        positions = None
+        if player_index is not None:
+            positions = {player_id: player.position for player_id in player_index_by_player_id
+                         if (player := player_index.get(player_id)) is not None}
+        return cls(weeks=weeks, player_ids=player_index_by_player_id.keys(), scores=scores, positions=positions)
+
+    @property
+    def weeks(self) -> tuple[int, ...]:
+        return self.__weeks
+
+    @property
+    def player_ids(self) -> tuple[str, ...]:
+        return self.__player_ids
+
+    @property
+    def scores(self) -> "numpy.ndarray":
+        """
+        The read-only (weeks, players) score matrix.
+        """
+        return self.__scores
+
+    def get_week_index(self, week: int) -> int:
+        return self.__week_index_by_week[week]
+
+    def get_player_index(self, player_id: str) -> int:
+        return self.__player_index_by_player_id[player_id]
+
+    def get_player_scores(self, player_id: str) -> "numpy.ndarray":
+        """
+        Returns the weekly scores of the given player.
+        """
+        return self.__scores[:, self.get_player_index(player_id)]
+
+    def get_games_played(self) -> "numpy.ndarray":
+        """
+        Returns how many weeks each player has a score.
+        """
+        numpy = _import_numpy()
+        return numpy.count_nonzero(~numpy.isnan(self.__scores), axis=0)
+
+    def get_totals(self) -> "numpy.ndarray":
+        numpy = _import_numpy()
+        return numpy.nansum(self.__scores, axis=0, dtype=numpy.float64).astype(numpy.float32)
+
+    def get_averages(self) -> "numpy.ndarray":
+        """
+        Returns the average weekly score of each player, over the weeks they have a score (NaN if none).
+        """
+        numpy = _import_numpy()
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return (self.get_totals() / self.get_games_played()).astype(numpy.float32)
+
+    def get_standard_deviations(self) -> "numpy.ndarray":
+        """
+        Returns the standard deviation of the weekly scores of each player (NaN if they have none).
+        The lower it is, the more consistent the player.
+        """
+        numpy = _import_numpy()
+        deviations = self.__scores - self.get_averages()
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return numpy.sqrt(numpy.nansum(deviations * deviations, axis=0) / self.get_games_played())
+
+    def get_consistency(self) -> "numpy.ndarray":
+        """
+        Returns the coefficient of variation (standard deviation / average) of each player.
+        Unlike the standard deviation it is comparable between high and low scoring players; lower is more consistent.
+        """
+        numpy = _import_numpy()
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return self.get_standard_deviations() / self.get_averages()
+
+    def get_rolling_averages(self, window: int) -> "numpy.ndarray":
+        """
+        Returns the (weeks, players) matrix of each player's average score over the last window weeks,
+        ignoring weeks without a score (NaN if none of them has one).
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        numpy = _import_numpy()
+        has_score = ~numpy.isnan(self.__scores)
+        number_of_weeks = len(self.__weeks)
+        zeros = numpy.zeros((1, len(self.__player_ids)))
+        cumulative_scores = numpy.vstack((zeros, numpy.cumsum(numpy.where(has_score, self.__scores, 0), axis=0,
+                                                              dtype=numpy.float64)))
+        cumulative_counts = numpy.vstack((zeros, numpy.cumsum(has_score, axis=0)))
+        ends = numpy.arange(1, number_of_weeks + 1)
+        starts = numpy.maximum(ends - window, 0)
+        window_scores = cumulative_scores[ends] - cumulative_scores[starts]
+        window_counts = cumulative_counts[ends] - cumulative_counts[starts]
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return (window_scores / window_counts).astype(numpy.float32)
+
+    def get_top(self, values: "numpy.ndarray", n: int, *, position: Optional[str] = None) -> list[tuple[str, float]]:
+        """
+        Returns the (player id, value) of the n players with the highest of the given per-player values
+        (i.e. get_totals()), optionally only for players at the given position. NaN values are skipped.
+        """
+        numpy = _import_numpy()
+        values = numpy.asarray(values)
+        candidates = ~numpy.isnan(values)
+        if position is not None:
+            candidates &= self.__positions == position
+        candidate_indexes = numpy.flatnonzero(candidates)
+        n = min(n, len(candidate_indexes))
+        if n <= 0:
+            return list()
+        candidate_values = values[candidate_indexes]
+        top_indexes = numpy.argpartition(-candidate_values, n - 1)[:n]
+        top_indexes = top_indexes[numpy.argsort(-candidate_values[top_indexes], kind="stable")]
+        return [(self.__player_ids[candidate_indexes[i]], float(candidate_values[i])) for i in top_indexes]
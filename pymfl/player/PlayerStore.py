@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from pymfl.api import FantasyContentAPIClient
+from pymfl.util import RecordConverter
+
+
+class PlayerStore:
+    """
+    A local copy of the MyFantasyLeague player database for a single year.
+    The first sync downloads the full database, every later sync only asks for the players changed since the last one
+    (via the SINCE parameter) and merges them in.
+    When a path is given, the players and the last sync timestamp are persisted there between runs.
+
+    details: Whether to keep complete player details, including player IDs from other sources.
+    """
+
+    def __init__(self, *, year: int, league_id: str, path: Optional[str] = None, details: bool = False):
+        self.__year = year
+        self.__league_id = league_id
+        self.__path = path
+        self.__details = details
+        self.__lock = threading.Lock()
+        self.__players_by_id: dict[str, dict] = dict()
+        self.__last_sync_timestamp: Optional[int] = None
+        if path is not None and os.path.exists(path):
+            self.__load()
+
+    @property
+    def last_sync_timestamp(self) -> Optional[int]:
+        """
+        The unix timestamp of the last sync, or None if the store has never been synced.
+        """
+        return self.__last_sync_timestamp
+
+    def sync(self) -> int:
+        """
+        Brings the store up to date and returns how many players were added or changed.
+        """
+        with self.__lock:
+            request_timestamp = int(time.time())
+            # a cached response may be up to a day old, which would skip the changes made since
+            with FantasyContentAPIClient.bypass_response_cache():
+                response = FantasyContentAPIClient.get_players(year=self.__year,
+                                                               league_id=self.__league_id,
+                                                               details=1 if self.__details else None,
+                                                               since=self.__last_sync_timestamp)
+            players = response.get("players", dict())
+            changed_players = RecordConverter.as_list(players.get("player"))
+            for player in changed_players:
+                self.__players_by_id[player["id"]] = player
+            self.__last_sync_timestamp = int(players.get("timestamp", request_timestamp))
+            if self.__path is not None:
+                self.__save()
+            return len(changed_players)
+
+    def get_player(self, player_id: str) -> Optional[dict]:
+        return self.__players_by_id.get(player_id)
+
+    def get_players(self) -> dict[str, dict]:
+        """
+        Returns every player keyed by player id.
+        """
+        with self.__lock:
+            return dict(self.__players_by_id)
+
+    def __len__(self) -> int:
+        return len(self.__players_by_id)
+
+    def __load(self):
+        with open(self.__path) as f:
+            state = json.load(f)
+        if state["year"] != self.__year or state["details"] != self.__details:
+            # a store for another year or detail level has to be rebuilt from a full load
+            return
+        self.__players_by_id = state["players"]
+        self.__last_sync_timestamp = state["last_sync_timestamp"]
+
+    def __save(self):
+        state = {
+            "year": self.__year,
+            "details": self.__details,
+            "last_sync_timestamp": self.__last_sync_timestamp,
+            "players": self.__players_by_id
+        }
+        temporary_path = f"{self.__path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(state, f)
+        os.replace(temporary_path, self.__path)
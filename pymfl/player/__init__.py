@@ -0,0 +1,3 @@
+from .PlayerIndex import PlayerIndex
+from .PlayerStore import PlayerStore
+from .PlayerScoreMatrix import PlayerScoreMatrix
@@ -0,0 +1,43 @@
+import json
+from typing import Any, Callable, Optional
+
+
+class JSONDecoder:
+    """
+    Decodes JSON straight from the raw bytes of a response, without first building a str from them.
+    By default it uses the fastest decoder installed: orjson, then ujson, then the standard library.
+
+    loads: A function that decodes JSON bytes, to use instead of the default.
+    """
+
+    def __init__(self, loads: Optional[Callable[[bytes], Any]] = None):
+        if loads is None:
+            loads = self.get_fastest_loads()
+        self.__loads = loads
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the module the decoder comes from (i.e. "orjson").
+        """
+        return getattr(self.__loads, "__module__", None) or repr(self.__loads)
+
+    def decode(self, content: bytes | str) -> Any:
+        return self.__loads(content)
+
+    @staticmethod
+    def get_fastest_loads() -> Callable[[bytes], Any]:
+        """
+        Returns the loads function of the fastest JSON decoder installed.
+        """
+        try:
+            import orjson
+            return orjson.loads
+        except ImportError:
+            pass
+        try:
+            import ujson
+            return ujson.loads
+        except ImportError:
+            pass
+        return json.loads
@@ -0,0 +1,37 @@
+from typing import Any, Optional
+
+
+class RecordConverter:
+    """
+    Normalizes the values of decoded MFL responses, which are all strings and may omit a list of one record.
+    """
+
+    @staticmethod
+    def as_list(value: Optional[dict | list]) -> list:
+        """
+        Returns the records as a list, even if MFL returned a single record or none.
+        """
+        # MFL returns a single record as an object instead of a list with one object
+        if value is None:
+            return list()
+        if isinstance(value, dict):
+            return [value]
+        return value
+
+    @staticmethod
+    def to_int(value: Optional[Any]) -> Optional[int]:
+        if value is None or value == "":
+            return None
+        return int(value)
+
+    @staticmethod
+    def to_float(value: Optional[Any]) -> Optional[float]:
+        if value is None or value == "":
+            return None
+        return float(value)
+
+    @staticmethod
+    def to_bool(value: Optional[Any]) -> Optional[bool]:
+        if value is None or value == "":
+            return None
+        return value == "1"
@@ -0,0 +1,130 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Iterator, Optional
+
+from pymfl.util.JSONDecoder import JSONDecoder
+
+
+class ResponseView(Mapping):
+    """
+    A read-only, lazily decoded view of a JSON response.
+    The raw bytes are kept and only decoded when the view is first accessed,
+    so responses that are cached, stored or passed along without being read are never decoded.
+    Nested objects and lists are wrapped into views only when they are accessed, and are memoized.
+
+    get_list() normalizes MFL's habit of returning a single record as an object instead of a list with one object,
+    and find() returns the first record of a list matching the given attributes (i.e. one franchise by id).
+
+    Views are shared between callers (they are cached like decoded responses),
+    so the data they return should not be mutated.
+    """
+    __slots__ = ("__raw", "__json_decoder", "__data", "__views")
+
+    def __init__(self, raw: Optional[bytes] = None, *, json_decoder: Optional[JSONDecoder] = None,
+                 data: Optional[dict] = None):
+        self.__raw = raw
+        self.__json_decoder = json_decoder
+        self.__data = data
+        self.__views: dict[str, Any] = dict()
+
+    @property
+    def raw(self) -> Optional[bytes]:
+        """
+        The raw bytes of the response, or None for views of nested objects or of merged responses.
+        """
+        return self.__raw
+
+    @property
+    def is_decoded(self) -> bool:
+        return self.__data is not None
+
+    def __getitem__(self, key: str) -> Any:
+        view = self.__views.get(key)
+        if view is None:
+            view = self._wrap(self.__get_data()[key])
+            self.__views[key] = view
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__get_data())
+
+    def __len__(self) -> int:
+        return len(self.__get_data())
+
+    def __repr__(self) -> str:
+        if self.__data is None:
+            return f"ResponseView(<{len(self.__raw)} bytes not decoded>)"
+        return f"ResponseView({self.__data!r})"
+
+    def get_list(self, key: str) -> Sequence:
+        """
+        Returns the records under the given key as a list, even if MFL returned a single record or none.
+        """
+        value = self.get(key)
+        if value is None:
+            return list()
+        if isinstance(value, ResponseView):
+            return [value]
+        return value
+
+    def find(self, key: str, **attributes: str) -> Optional["ResponseView"]:
+        """
+        Returns the first record under the given key with all the given attributes,
+        i.e. view["rosters"].find("franchise", id="0001").
+        """
+        for record in self.get_list(key):
+            if all(record.get(name) == value for name, value in attributes.items()):
+                return record
+        return None
+
+    def to_dict(self) -> dict:
+        """
+        Returns the fully decoded response.
+        """
+        return self.__get_data()
+
+    def __get_data(self) -> dict:
+        if self.__data is None:
+            json_decoder = self.__json_decoder or JSONDecoder()
+            self.__data = json_decoder.decode(self.__raw)
+        return self.__data
+
+    @staticmethod
+    def _wrap(value: Any) -> Any:
+        if isinstance(value, dict):
+            return ResponseView(data=value)
+        if isinstance(value, list):
+            return _ListView(value)
+        return value
+
+
+class _ListView(Sequence):
+    """
+    A read-only view of a list in a response, wrapping its items into views only when they are accessed.
+    """
+    __slots__ = ("__items", "__views")
+
+    def __init__(self, items: list):
+        self.__items = items
+        self.__views: dict[int, Any] = dict()
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.__items)))]
+        if index < 0:
+            index += len(self.__items)
+        view = self.__views.get(index)
+        if view is None:
+            view = ResponseView._wrap(self.__items[index])
+            self.__views[index] = view
+        return view
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, _ListView)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"_ListView({self.__items!r})"
@@ -0,0 +1,41 @@
+import xml.etree.ElementTree as ET
+
+from pymfl.exception import MFLAPIClientException
+
+
+class XMLRecordParser:
+    """
+    Incrementally parses an MFL XML export fed to it in chunks,
+    returning the attributes of each record element (i.e. every "transaction") as soon as it has been read.
+    Records are dropped from the tree once returned, so memory stays flat no matter how large the export is.
+
+    tag: The tag of the record elements.
+    """
+
+    def __init__(self, tag: str):
+        self.__tag = tag
+        self.__parser = ET.XMLPullParser(events=("start", "end"))
+        self.__parents: list[ET.Element] = list()
+
+    def feed(self, data: bytes) -> list[dict[str, str]]:
+        self.__parser.feed(data)
+        return self.__read_records()
+
+    def close(self) -> list[dict[str, str]]:
+        self.__parser.close()
+        return self.__read_records()
+
+    def __read_records(self) -> list[dict[str, str]]:
+        records = list()
+        for event, element in self.__parser.read_events():
+            if event == "start":
+                self.__parents.append(element)
+                continue
+            self.__parents.pop()
+            if element.tag == "error" and not self.__parents:
+                raise MFLAPIClientException(element.text)
+            if element.tag == self.__tag:
+                records.append(dict(element.attrib))
+                if self.__parents:
+                    self.__parents[-1].remove(element)
+        return records
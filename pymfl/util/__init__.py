@@ -1 +1,5 @@
 from .ConfigReader import ConfigReader
+from .JSONDecoder import JSONDecoder
+from .XMLRecordParser import XMLRecordParser
+from .ResponseView import ResponseView
+from .RecordConverter import RecordConverter
@@ -17,8 +17,9 @@ setuptools.setup(
     long_description=read_me,
     license="MIT",
     include_package_data=True,
-    packages=setuptools.find_packages(exclude=("test", "docs")),
+    packages=setuptools.find_packages(exclude=("test", "docs", "benchmark")),
     install_requires=["setuptools",
                       "configparser",
-                      "requests"]
+                      "requests"],
+    extras_require={"async": ["aiohttp"], "fast": ["orjson"], "numpy": ["numpy"], "parquet": ["pyarrow"]}
 )
@@ -1,3 +1,5 @@
+import json
+
 from requests import HTTPError
 
 
@@ -5,11 +7,23 @@ class MockResponse:
     def __init__(self, data: dict | str, status_code: int, **kwargs):
         self.__data = data
         self.content = kwargs.pop("content", None)
+        if self.content is None and isinstance(data, dict):
+            self.content = json.dumps(data).encode("utf-8")
         self.status_code = status_code
+        self.headers = kwargs.pop("headers", dict())
+        self.url = kwargs.pop("url", None)
+        self.history = kwargs.pop("history", list())
 
     def json(self) -> dict:
         return self.__data
 
+    def iter_content(self, chunk_size: int = 1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        ...
+
     def raise_for_status(self):
         """
         This is meant to closely resemble the actual raise_for_status method found here:
@@ -14,7 +14,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
     __TEST_USER_AGENT_NAME = "user_agent_name"
 
     @classmethod
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def setUpClass(cls, mock_requests_post):
         mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
         mock_response = MockResponse(dict(), 200, content=mock_xml)
@@ -25,7 +25,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
                                                     password=cls.__TEST_PASSWORD,
                                                     user_agent_name=cls.__TEST_USER_AGENT_NAME)
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_league_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -39,7 +39,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_rules_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -53,7 +53,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_rosters_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -67,7 +67,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_free_agents_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -81,7 +81,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_schedule_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -95,7 +95,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_calendar_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -109,7 +109,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_playoff_brackets_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -124,7 +124,7 @@ class TestCommonLeagueInfoAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_playoff_bracket_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
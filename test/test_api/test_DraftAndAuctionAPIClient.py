@@ -14,7 +14,7 @@ class TestDraftAndAuctionAPIClient(unittest.TestCase):
     __TEST_USER_AGENT_NAME = "user_agent_name"
 
     @classmethod
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def setUpClass(cls, mock_requests_post):
         mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
         mock_response = MockResponse(dict(), 200, content=mock_xml)
@@ -25,7 +25,7 @@ class TestDraftAndAuctionAPIClient(unittest.TestCase):
                                                     password=cls.__TEST_PASSWORD,
                                                     user_agent_name=cls.__TEST_USER_AGENT_NAME)
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_draft_results_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -39,7 +39,7 @@ class TestDraftAndAuctionAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_auction_results_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -53,7 +53,7 @@ class TestDraftAndAuctionAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_my_draft_list_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
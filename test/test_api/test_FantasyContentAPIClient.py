@@ -1,5 +1,6 @@
 import unittest
 from unittest import mock
+from urllib.parse import urlparse, parse_qs
 
 from pymfl.api import FantasyContentAPIClient
 from pymfl.api.config import APIConfig
@@ -14,7 +15,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
     __TEST_USER_AGENT_NAME = "user_agent_name"
 
     @classmethod
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def setUpClass(cls, mock_requests_post):
         mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
         mock_response = MockResponse(dict(), 200, content=mock_xml)
@@ -25,7 +26,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
                                                     password=cls.__TEST_PASSWORD,
                                                     user_agent_name=cls.__TEST_USER_AGENT_NAME)
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_players_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -39,7 +40,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_player_profile_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -55,7 +56,30 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch.object(FantasyContentAPIClient, "_ID_CHUNK_SIZE", 2)
+    @mock.patch("requests.Session.get")
+    def test_get_player_profile_many_players_fetches_chunks_and_merges_them(self, mock_requests_get):
+        def mock_get(url: str, **kwargs) -> MockResponse:
+            player_ids = parse_qs(urlparse(url).query)["P"][0].split(",")
+            player_profiles = [{"id": player_id, "name": f"Player {player_id}"} for player_id in player_ids]
+            return MockResponse({"version": "1.0",
+                                 "playerProfiles": {"playerProfile": player_profiles[0]
+                                                    if len(player_profiles) == 1 else player_profiles}}, 200)
+
+        mock_requests_get.side_effect = mock_get
+        response = FantasyContentAPIClient.get_player_profile(year=self.__TEST_YEAR,
+                                                              league_id=self.__TEST_LEAGUE_ID,
+                                                              player_id_or_ids=["101", "102", "103", "104", "105"])
+
+        self.assertEqual(3, mock_requests_get.call_count)
+        requested_player_ids = sorted(parse_qs(urlparse(call.args[0]).query)["P"][0]
+                                      for call in mock_requests_get.call_args_list)
+        self.assertEqual(["101,102", "103,104", "105"], requested_player_ids)
+        self.assertEqual("1.0", response["version"])
+        self.assertEqual(["101", "102", "103", "104", "105"],
+                         [player_profile["id"] for player_profile in response["playerProfiles"]["playerProfile"]])
+
+    @mock.patch("requests.Session.get")
     def test_get_all_rules_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -69,7 +93,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_player_ranks_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -83,7 +107,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_adp_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -97,7 +121,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_aav_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -111,7 +135,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_top_adds_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -125,7 +149,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_top_drops_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -139,7 +163,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_top_starters_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -153,7 +177,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_top_trades_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -167,7 +191,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_top_owns_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -181,7 +205,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_site_news_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -195,7 +219,7 @@ class TestFantasyContentAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_who_should_i_start_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -14,7 +14,7 @@ class TestLeaguePlayersAPIClient(unittest.TestCase):
     __TEST_USER_AGENT_NAME = "user_agent_name"
 
     @classmethod
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def setUpClass(cls, mock_requests_post):
         mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
         mock_response = MockResponse(dict(), 200, content=mock_xml)
@@ -25,7 +25,7 @@ class TestLeaguePlayersAPIClient(unittest.TestCase):
                                                     password=cls.__TEST_PASSWORD,
                                                     user_agent_name=cls.__TEST_USER_AGENT_NAME)
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_player_roster_status_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -41,7 +41,7 @@ class TestLeaguePlayersAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_contest_players_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -55,7 +55,7 @@ class TestLeaguePlayersAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_my_watch_list_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -69,7 +69,7 @@ class TestLeaguePlayersAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_salaries_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -83,7 +83,7 @@ class TestLeaguePlayersAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_salary_adjustments_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
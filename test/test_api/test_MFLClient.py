@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from pymfl.api import MFLClient, CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.aio import AsyncScoringAndResultsAPIClient
+from pymfl.api.aio.AsyncConnectionPool import AsyncConnectionPool, AsyncResponse
+from pymfl.api.cache import ResponseCache
+from pymfl.api.config import APIConfig
+from pymfl.exception import MissingYearAPIConfigException
+from test.helper.helper_classes import MockResponse
+
+
+class TestMFLClient(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_TENANT_LEAGUE_ID = "77777"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @mock.patch("requests.Session.post")
+    def setUp(self, mock_requests_post):
+        mock_requests_post.return_value = MockResponse(dict(), 200,
+                                                       content="""<status MFL_USER_ID="tenant_user_id=">OK</status>""")
+        self.mfl_client = MFLClient()
+        self.mfl_client.api_config.add_config_for_year_and_league_id(year=self.__TEST_YEAR,
+                                                                     league_id=self.__TEST_TENANT_LEAGUE_ID,
+                                                                     username=self.__TEST_USERNAME,
+                                                                     password=self.__TEST_PASSWORD,
+                                                                     user_agent_name=self.__TEST_USER_AGENT_NAME)
+
+    def tearDown(self):
+        self.mfl_client.close()
+
+    def test_configs_are_isolated_from_the_default_api_config(self):
+        with self.assertRaises(MissingYearAPIConfigException):
+            APIConfig.get_config_by_year_and_league_id(year=self.__TEST_YEAR, league_id=self.__TEST_TENANT_LEAGUE_ID)
+        self.assertEqual("tenant_user_id=",
+                         self.mfl_client.api_config.get_config_by_year_and_league_id(
+                             year=self.__TEST_YEAR, league_id=self.__TEST_TENANT_LEAGUE_ID).mfl_user_id)
+        self.assertEqual(0, len(MFLClient().api_config.get_config_registry()))
+
+    @mock.patch("requests.Session.get")
+    def test_endpoint_groups_use_the_client_state(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+
+        response = self.mfl_client.common_league_info.get_league(year=self.__TEST_YEAR,
+                                                                 league_id=self.__TEST_TENANT_LEAGUE_ID)
+
+        self.assertEqual({"k": "v"}, response)
+        self.assertTrue(issubclass(self.mfl_client.common_league_info, CommonLeagueInfoAPIClient))
+        self.assertEqual({"MFL_LAST_LEAGUE_ID": self.__TEST_TENANT_LEAGUE_ID, "MFL_USER_ID": "tenant_user_id="},
+                         mock_requests_get.call_args.kwargs["cookies"])
+        # the login and the export
+        self.assertEqual(2, self.mfl_client.connection_pool.get_stats()["api.myfantasyleague.com"].requests_sent)
+        self.assertIsNone(self.mfl_client.response_cache)
+        self.assertIs(self.mfl_client.common_league_info, self.mfl_client.bind(CommonLeagueInfoAPIClient))
+
+    @mock.patch("requests.Session.get")
+    def test_base_url_is_per_client(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+        mfl_client = MFLClient(api_config=self.mfl_client.api_config, base_url="https://www.example.com")
+
+        mfl_client.scoring_and_results.get_league_standings(year=self.__TEST_YEAR,
+                                                            league_id=self.__TEST_TENANT_LEAGUE_ID)
+
+        self.assertEqual("https://www.example.com/2020/export?TYPE=leagueStandings&L=77777&JSON=1",
+                         mock_requests_get.call_args.args[0])
+
+    @mock.patch("requests.Session.post")
+    def test_isolated_configs_log_in_through_the_client(self, mock_requests_post):
+        mock_requests_post.return_value = MockResponse(dict(), 200,
+                                                       content="""<status MFL_USER_ID="tenant_user_id=">OK</status>""")
+        mfl_client = MFLClient(base_url="https://tenant.example.com")
+
+        mfl_client.api_config.add_config_for_year_and_league_id(year=self.__TEST_YEAR,
+                                                                league_id=self.__TEST_TENANT_LEAGUE_ID,
+                                                                username=self.__TEST_USERNAME,
+                                                                password=self.__TEST_PASSWORD,
+                                                                user_agent_name=self.__TEST_USER_AGENT_NAME)
+
+        self.assertTrue(mock_requests_post.call_args.args[0].startswith("https://tenant.example.com/2020/"))
+        self.assertEqual(1, mfl_client.connection_pool.get_stats()["tenant.example.com"].requests_sent)
+        self.assertNotIn("tenant.example.com", MFLAPIClient.get_connection_pool().get_stats())
+
+    def test_set_methods_of_bound_api_clients_only_replace_the_client_state(self):
+        original_response_cache = MFLAPIClient.get_response_cache()
+        response_cache = ResponseCache()
+
+        self.mfl_client.scoring_and_results.set_response_cache(response_cache)
+
+        self.assertIs(original_response_cache, MFLAPIClient.get_response_cache())
+        self.assertIs(response_cache, self.mfl_client.response_cache)
+        self.assertIs(response_cache, self.mfl_client.common_league_info.get_response_cache())
+
+    def test_bind_async_api_client(self):
+        async_connection_pool = AsyncConnectionPool()
+        mfl_client = MFLClient(api_config=self.mfl_client.api_config, async_connection_pool=async_connection_pool)
+
+        async_scoring_and_results = mfl_client.bind(AsyncScoringAndResultsAPIClient)
+
+        self.assertIs(async_connection_pool, async_scoring_and_results.get_async_connection_pool())
+        with mock.patch.object(async_connection_pool, "get") as mock_async_get:
+            mock_async_get.return_value = AsyncResponse(status=200, content=b'{"k": "v"}')
+            response = asyncio.run(async_scoring_and_results.get_live_scoring(
+                year=self.__TEST_YEAR, league_id=self.__TEST_TENANT_LEAGUE_ID))
+        self.assertEqual({"k": "v"}, response)
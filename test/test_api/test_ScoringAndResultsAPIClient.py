@@ -3,6 +3,7 @@ from unittest import mock
 
 from pymfl.api import ScoringAndResultsAPIClient
 from pymfl.api.config import APIConfig
+from pymfl.util import ResponseView
 from test.helper.helper_classes import MockResponse
 
 
@@ -14,7 +15,7 @@ class TestScoringAndResultsAPIClient(unittest.TestCase):
     __TEST_USER_AGENT_NAME = "user_agent_name"
 
     @classmethod
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def setUpClass(cls, mock_requests_post):
         mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
         mock_response = MockResponse(dict(), 200, content=mock_xml)
@@ -25,7 +26,7 @@ class TestScoringAndResultsAPIClient(unittest.TestCase):
                                                     password=cls.__TEST_PASSWORD,
                                                     user_agent_name=cls.__TEST_USER_AGENT_NAME)
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_league_standings_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -40,7 +41,7 @@ class TestScoringAndResultsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_weekly_results_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -54,7 +55,7 @@ class TestScoringAndResultsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_live_scoring_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -68,7 +69,7 @@ class TestScoringAndResultsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_player_scores_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -82,7 +83,25 @@ class TestScoringAndResultsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
+    def test_iter_player_scores_happy_path(self, mock_requests_get):
+        mock_xml = b"""<playerScores week="YTD">
+        <playerScore id="13593" score="101.5" isAvailable="0"/>
+        <playerScore id="13594" score="88.25" isAvailable="1"/>
+        </playerScores>"""
+
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_get.return_value = mock_response
+        player_scores = ScoringAndResultsAPIClient.iter_player_scores(year=self.__TEST_YEAR,
+                                                                      league_id=self.__TEST_LEAGUE_ID,
+                                                                      week="YTD")
+
+        self.assertEqual({"id": "13593", "score": "101.5", "isAvailable": "0"}, next(player_scores))
+        self.assertEqual({"id": "13594", "score": "88.25", "isAvailable": "1"}, next(player_scores))
+        with self.assertRaises(StopIteration):
+            next(player_scores)
+
+    @mock.patch("requests.Session.get")
     def test_get_projected_scores_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -97,3 +116,39 @@ class TestScoringAndResultsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
+    @mock.patch("requests.Session.get")
+    def test_get_projected_scores_collection_of_players_is_fetched_in_one_request(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"projectedScores": {"playerScore": []}}, 200)
+        ScoringAndResultsAPIClient.get_projected_scores(year=self.__TEST_YEAR,
+                                                        league_id=self.__TEST_LEAGUE_ID,
+                                                        players=["13593", "13594"])
+
+        self.assertEqual(1, mock_requests_get.call_count)
+        self.assertEqual("https://api.myfantasyleague.com/2020/export?TYPE=projectedScores&L=12345&JSON=1&PLAYERS=13593,13594",
+                         mock_requests_get.call_args.args[0])
+
+    @mock.patch.object(ScoringAndResultsAPIClient, "_ID_CHUNK_SIZE", 2)
+    @mock.patch("requests.Session.get")
+    def test_get_player_scores_many_players_merges_lazy_responses_into_a_response_view(self, mock_requests_get):
+        mock_requests_get.side_effect = [MockResponse({"playerScores": {"playerScore": [{"id": "1"}, {"id": "2"}]}},
+                                                      200),
+                                         MockResponse({"playerScores": {"playerScore": {"id": "3"}}}, 200)]
+        with ScoringAndResultsAPIClient.lazy_responses():
+            response = ScoringAndResultsAPIClient.get_player_scores(year=self.__TEST_YEAR,
+                                                                    league_id=self.__TEST_LEAGUE_ID,
+                                                                    week=3,
+                                                                    players=["1", "2", "3"])
+
+        self.assertIsInstance(response, ResponseView)
+        self.assertEqual(["1", "2", "3"],
+                         sorted(player_score["id"] for player_score in response["playerScores"].get_list("playerScore")))
+
+    @mock.patch.object(ScoringAndResultsAPIClient, "_ID_CHUNK_SIZE", 2)
+    @mock.patch("requests.Session.get")
+    def test_get_player_scores_count_with_many_players_raises_value_error(self, mock_requests_get):
+        with self.assertRaises(ValueError):
+            ScoringAndResultsAPIClient.get_player_scores(year=self.__TEST_YEAR,
+                                                         league_id=self.__TEST_LEAGUE_ID,
+                                                         players=["1", "2", "3"],
+                                                         count=10)
+        mock_requests_get.assert_not_called()
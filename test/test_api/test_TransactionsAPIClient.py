@@ -14,7 +14,7 @@ class TestTransactionsAPIClient(unittest.TestCase):
     __TEST_USER_AGENT_NAME = "user_agent_name"
 
     @classmethod
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def setUpClass(cls, mock_requests_post):
         mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
         mock_response = MockResponse(dict(), 200, content=mock_xml)
@@ -25,7 +25,7 @@ class TestTransactionsAPIClient(unittest.TestCase):
                                                     password=cls.__TEST_PASSWORD,
                                                     user_agent_name=cls.__TEST_USER_AGENT_NAME)
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_transactions_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -39,7 +39,29 @@ class TestTransactionsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
+    def test_iter_transactions_happy_path(self, mock_requests_get):
+        mock_xml = b"""<transactions>
+        <transaction type="FREE_AGENT" franchise="0001" transaction="13593,|" timestamp="1600000000"/>
+        <transaction type="TRADE" franchise="0002" franchise1_gave_up="13593," timestamp="1600000001"/>
+        </transactions>"""
+
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_get.return_value = mock_response
+        transactions = TransactionsAPIClient.iter_transactions(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID,
+                                                               week=1)
+
+        self.assertEqual(0, mock_requests_get.call_count)
+        self.assertEqual([{"type": "FREE_AGENT", "franchise": "0001", "transaction": "13593,|",
+                           "timestamp": "1600000000"},
+                          {"type": "TRADE", "franchise": "0002", "franchise1_gave_up": "13593,",
+                           "timestamp": "1600000001"}],
+                         list(transactions))
+        self.assertEqual("https://api.myfantasyleague.com/2020/export?TYPE=transactions&L=12345&W=1",
+                         mock_requests_get.call_args.args[0])
+        self.assertTrue(mock_requests_get.call_args.kwargs["stream"])
+
+    @mock.patch("requests.Session.get")
     def test_get_pending_waivers_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -53,7 +75,7 @@ class TestTransactionsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_pending_trades_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -67,7 +89,7 @@ class TestTransactionsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_trade_bait_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -81,7 +103,7 @@ class TestTransactionsAPIClient(unittest.TestCase):
         self.assertEqual(1, len(response.keys()))
         self.assertEqual("v", response["k"])
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_get_assets_happy_path(self, mock_requests_get):
         mock_dict = {
             "k": "v"
@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pymfl.api.aio import AsyncConnectionPool
+
+
+class TestAsyncConnectionPool(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return web.Response(body=request.cookies.get("MFL_USER_ID", "").encode())
+
+        app = web.Application()
+        app.router.add_get("/export", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_get_bounds_concurrency(self):
+        async_connection_pool = AsyncConnectionPool(max_concurrency=3)
+        url = str(self.server.make_url("/export"))
+        try:
+            responses = await asyncio.gather(*(async_connection_pool.get(url, cookies={"MFL_USER_ID": str(i)})
+                                               for i in range(20)))
+        finally:
+            await async_connection_pool.close()
+
+        self.assertEqual([str(i).encode() for i in range(20)], [response.content for response in responses])
+        self.assertEqual(3, self.max_in_flight)
+
+
+class TestAsyncConnectionPoolEventLoops(unittest.TestCase):
+
+    def test_session_is_closed_when_its_event_loop_shuts_down(self):
+        async_connection_pool = AsyncConnectionPool()
+
+        async def get_session():
+            session, _ = async_connection_pool._AsyncConnectionPool__get_session_and_semaphore()
+            return session
+
+        session_1 = asyncio.run(get_session())
+        session_2 = asyncio.run(get_session())
+
+        self.assertIsNot(session_1, session_2)
+        self.assertTrue(session_1.closed)
+        self.assertTrue(session_2.closed)
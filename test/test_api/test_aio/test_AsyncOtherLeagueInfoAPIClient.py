@@ -0,0 +1,44 @@
+import unittest
+from unittest import mock
+
+from pymfl.api.aio import AsyncOtherLeagueInfoAPIClient
+from pymfl.api.aio.AsyncConnectionPool import AsyncResponse
+from pymfl.api.config import APIConfig
+from test.helper.helper_classes import MockResponse
+
+
+class TestAsyncOtherLeagueInfoAPIClient(unittest.IsolatedAsyncioTestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    @mock.patch("pymfl.api.aio.AsyncConnectionPool.AsyncConnectionPool.get")
+    async def test_get_accounting_happy_path(self, mock_async_get):
+        mock_async_get.return_value = AsyncResponse(status=200, content=b'{"k": "v"}')
+        response = await AsyncOtherLeagueInfoAPIClient.get_accounting(year=self.__TEST_YEAR,
+                                                                      league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual("v", response["k"])
+
+    @mock.patch("pymfl.api.aio.AsyncConnectionPool.AsyncConnectionPool.get")
+    async def test_get_ics_happy_path(self, mock_async_get):
+        mock_async_get.return_value = AsyncResponse(status=200, content=b"BEGIN:VCALENDAR")
+        response = await AsyncOtherLeagueInfoAPIClient.get_ics(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertIsInstance(response, str)
+        self.assertEqual("BEGIN:VCALENDAR", response)
@@ -0,0 +1,123 @@
+import unittest
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.aio import AsyncScoringAndResultsAPIClient
+from pymfl.api.aio.AsyncConnectionPool import AsyncResponse
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import RateLimiter, RetryPolicy, CircuitBreaker
+from pymfl.enum import CircuitState
+from pymfl.exception import MFLAPIClientException
+from test.helper.helper_classes import MockResponse
+
+
+class TestAsyncScoringAndResultsAPIClient(unittest.IsolatedAsyncioTestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    @mock.patch("pymfl.api.aio.AsyncConnectionPool.AsyncConnectionPool.get")
+    async def test_get_live_scoring_happy_path(self, mock_async_get):
+        mock_async_get.return_value = AsyncResponse(status=200, content=b'{"k": "v"}')
+        response = await AsyncScoringAndResultsAPIClient.get_live_scoring(year=self.__TEST_YEAR,
+                                                                          league_id=self.__TEST_LEAGUE_ID,
+                                                                          week=1)
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(1, len(response.keys()))
+        self.assertEqual("v", response["k"])
+        url = mock_async_get.call_args.args[0]
+        self.assertEqual("https://api.myfantasyleague.com/2020/export?TYPE=liveScoring&L=12345&JSON=1&W=1", url)
+        self.assertEqual({"MFL_LAST_LEAGUE_ID": self.__TEST_LEAGUE_ID, "MFL_USER_ID": "test_user_id="},
+                         mock_async_get.call_args.kwargs["cookies"])
+
+    @mock.patch("pymfl.api.aio.AsyncConnectionPool.AsyncConnectionPool.get")
+    async def test_get_league_standings_error_payload_raises_mfl_api_client_exception(self, mock_async_get):
+        mock_async_get.return_value = AsyncResponse(status=200, content=b'{"error": "Invalid league"}')
+
+        with self.assertRaises(MFLAPIClientException) as context:
+            await AsyncScoringAndResultsAPIClient.get_league_standings(year=self.__TEST_YEAR,
+                                                                       league_id=self.__TEST_LEAGUE_ID)
+        self.assertEqual("Invalid league", str(context.exception))
+
+    @mock.patch("asyncio.sleep")
+    @mock.patch("pymfl.api.aio.AsyncConnectionPool.AsyncConnectionPool.get")
+    async def test_get_league_standings_is_rate_limited_and_retried(self, mock_async_get, mock_async_sleep):
+        mock_async_get.side_effect = [AsyncResponse(status=429, content=b"", headers={"Retry-After": "0.05"}),
+                                      AsyncResponse(status=503, content=b"", error=Exception("503")),
+                                      AsyncResponse(status=200, content=b'{"k": "v"}')]
+        original_rate_limiter = MFLAPIClient.get_rate_limiter()
+        original_retry_policy = MFLAPIClient.get_retry_policy()
+        original_circuit_breaker = MFLAPIClient.get_circuit_breaker()
+        rate_limiter = RateLimiter(min_requests_per_second=1000)
+        circuit_breaker = CircuitBreaker(failure_threshold=2)
+        MFLAPIClient.set_rate_limiter(rate_limiter)
+        MFLAPIClient.set_retry_policy(RetryPolicy(max_retries=1, base_delay_seconds=0))
+        MFLAPIClient.set_circuit_breaker(circuit_breaker)
+        try:
+            response = await AsyncScoringAndResultsAPIClient.get_league_standings(year=self.__TEST_YEAR,
+                                                                                  league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_rate_limiter(original_rate_limiter)
+            MFLAPIClient.set_retry_policy(original_retry_policy)
+            MFLAPIClient.set_circuit_breaker(original_circuit_breaker)
+
+        self.assertEqual({"k": "v"}, response)
+        self.assertEqual(3, mock_async_get.call_count)
+        self.assertFalse(mock_async_get.call_args.kwargs["raise_for_status"])
+        # the throttled request waited out its Retry-After on the event loop
+        self.assertAlmostEqual(0.05, mock_async_sleep.call_args_list[0].args[0], delta=0.01)
+        self.assertIsNotNone(rate_limiter.get_requests_per_second("api.myfantasyleague.com", "test_user_id="))
+        self.assertEqual(CircuitState.CLOSED, circuit_breaker.get_state("api.myfantasyleague.com"))
+
+    @mock.patch("pymfl.api.aio.AsyncConnectionPool.AsyncConnectionPool.iter_content")
+    async def test_iter_player_scores_happy_path(self, mock_async_iter_content):
+        async def mock_chunks(*args, **kwargs):
+            yield b'<playerScores week="1"><playerScore id="13593" sco'
+            yield b're="10.5"/><playerScore id="13594" score="8"/></playerScores>'
+
+        mock_async_iter_content.side_effect = mock_chunks
+        player_scores = [player_score async for player_score in
+                         AsyncScoringAndResultsAPIClient.iter_player_scores(year=self.__TEST_YEAR,
+                                                                            league_id=self.__TEST_LEAGUE_ID,
+                                                                            week=1)]
+
+        self.assertEqual([{"id": "13593", "score": "10.5"}, {"id": "13594", "score": "8"}], player_scores)
+        self.assertEqual("https://api.myfantasyleague.com/2020/export?TYPE=playerScores&L=12345&W=1",
+                         mock_async_iter_content.call_args.args[0])
+
+    @mock.patch.object(AsyncScoringAndResultsAPIClient, "_ID_CHUNK_SIZE", 2)
+    @mock.patch("pymfl.api.aio.AsyncConnectionPool.AsyncConnectionPool.get")
+    async def test_get_player_scores_many_players_fetches_chunks_and_merges_them(self, mock_async_get):
+        async def mock_get(url: str, **kwargs) -> AsyncResponse:
+            player_ids = parse_qs(urlparse(url).query)["PLAYERS"][0].split(",")
+            player_scores = ",".join(f'{{"id": "{player_id}", "score": "1"}}' for player_id in player_ids)
+            return AsyncResponse(status=200,
+                                 content=f'{{"playerScores": {{"week": "1", "playerScore": [{player_scores}]}}}}'
+                                 .encode("utf-8"))
+
+        mock_async_get.side_effect = mock_get
+        response = await AsyncScoringAndResultsAPIClient.get_player_scores(year=self.__TEST_YEAR,
+                                                                           league_id=self.__TEST_LEAGUE_ID,
+                                                                           week=2,
+                                                                           players="201,202,203")
+
+        self.assertEqual(2, mock_async_get.call_count)
+        self.assertEqual("1", response["playerScores"]["week"])
+        self.assertEqual(["201", "202", "203"],
+                         [player_score["id"] for player_score in response["playerScores"]["playerScore"]])
@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from pymfl.api import ScoringAndResultsAPIClient
+from pymfl.api.batch import BatchExecutor, CallSpec
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import Deadline
+from pymfl.exception import MFLAPIClientException, DeadlineExceededException
+from test.helper.helper_classes import MockResponse
+
+
+class TestBatchExecutor(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    @mock.patch("requests.Session.get")
+    def test_run_happy_path(self, mock_requests_get):
+        mock_requests_get.side_effect = [MockResponse({"k": "v1"}, 200), MockResponse({"error": "bad"}, 200)]
+        call_specs = CallSpec.for_each(ScoringAndResultsAPIClient.get_league_standings,
+                                       [(self.__TEST_YEAR, self.__TEST_LEAGUE_ID)] * 2)
+        results = BatchExecutor(max_concurrency=1).run(call_specs)
+
+        self.assertEqual(2, len(results))
+        self.assertTrue(results[call_specs[0]].ok)
+        self.assertEqual({"k": "v1"}, results[call_specs[0]].response)
+        self.assertFalse(results[call_specs[1]].ok)
+        self.assertIsInstance(results[call_specs[1]].exception, MFLAPIClientException)
+
+    def test_stream_reports_exceptions_without_aborting(self):
+        def method(*, year: int, league_id: str, **kwargs):
+            if league_id == "bad":
+                raise ValueError(league_id)
+            return {"year": year, "league_id": league_id, **kwargs}
+
+        call_specs = CallSpec.for_each(method, [(2020, "a"), (2020, "bad"), (2021, "b")], week=1)
+        results = list(BatchExecutor(max_concurrency=2).stream(call_specs))
+
+        self.assertEqual(3, len(results))
+        self.assertEqual({"a", "bad", "b"}, {result.call_spec.league_id for result in results})
+        failed = [result for result in results if not result.ok]
+        self.assertEqual(1, len(failed))
+        self.assertEqual("bad", failed[0].call_spec.league_id)
+        self.assertIsInstance(failed[0].exception, ValueError)
+        self.assertIn({"year": 2021, "league_id": "b", "week": 1}, [result.response for result in results])
+
+    def test_stream_bounds_concurrency(self):
+        lock = threading.Lock()
+        counts = {"in_flight": 0, "max_in_flight": 0}
+
+        def method(*, year: int, league_id: str):
+            with lock:
+                counts["in_flight"] += 1
+                counts["max_in_flight"] = max(counts["max_in_flight"], counts["in_flight"])
+            time.sleep(0.01)
+            with lock:
+                counts["in_flight"] -= 1
+            return league_id
+
+        call_specs = CallSpec.for_each(method, [(2020, str(i)) for i in range(20)])
+        results = BatchExecutor(max_concurrency=4).run(call_specs)
+
+        self.assertEqual(20, len(results))
+        self.assertLessEqual(counts["max_in_flight"], 4)
+
+    def test_max_concurrency_less_than_one_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            BatchExecutor(max_concurrency=0)
+
+    def test_calls_not_finished_by_the_deadline_are_skipped(self):
+        def method(*, year: int, league_id: str, **kwargs):
+            if league_id == "slow":
+                time.sleep(1)
+            return Deadline.get_current()
+
+        call_specs = CallSpec.for_each(method, [(2020, "fast"), (2020, "slow"), (2020, "fast"), (2020, "fast")])
+        start = time.monotonic()
+        with Deadline(0.2) as deadline:
+            results = BatchExecutor(max_concurrency=2).run(call_specs)
+
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(4, len(results))
+        self.assertTrue(results[call_specs[0]].ok)
+        self.assertIs(deadline, results[call_specs[0]].response)
+        self.assertTrue(results[call_specs[1]].skipped)
+        self.assertIsInstance(results[call_specs[1]].exception, DeadlineExceededException)
+        self.assertTrue(results[call_specs[2]].ok)
+        self.assertTrue(results[call_specs[3]].ok)
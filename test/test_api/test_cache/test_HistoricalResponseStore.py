@@ -0,0 +1,92 @@
+import datetime
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pymfl.api import DraftAndAuctionAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import HistoricalResponseStore, ResponseCache
+from pymfl.api.config import APIConfig
+from test.helper.helper_classes import MockResponse
+
+
+class TestHistoricalResponseStore(unittest.TestCase):
+    __TEST_YEAR = 2015
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+    __TEST_URL = "https://api.myfantasyleague.com/2015/export?TYPE=draftResults&L=12345&JSON=1"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.historical_response_store = HistoricalResponseStore(
+            os.path.join(self.temporary_directory.name, "responses.sqlite"))
+
+    def tearDown(self):
+        self.historical_response_store.close()
+        self.temporary_directory.cleanup()
+
+    def test_put_and_get_happy_path(self):
+        self.historical_response_store.put(self.__TEST_URL, b"content", year=self.__TEST_YEAR, context="user")
+
+        self.assertEqual(b"content", self.historical_response_store.get(self.__TEST_URL, context="user"))
+        self.assertIsNone(self.historical_response_store.get(self.__TEST_URL, context="other_user"))
+
+    def test_put_ignores_seasons_in_progress(self):
+        year = datetime.date.today().year
+        self.historical_response_store.put(self.__TEST_URL, b"content", year=year)
+
+        self.assertFalse(HistoricalResponseStore.is_completed_season(year))
+        self.assertIsNone(self.historical_response_store.get(self.__TEST_URL))
+
+    def test_get_report_and_purge(self):
+        self.historical_response_store.put("https://a?TYPE=x", b"12345", year=2015)
+        self.historical_response_store.put("https://b?TYPE=x", b"123", year=2015)
+        self.historical_response_store.put("https://c?TYPE=x", b"1", year=2016)
+        report = self.historical_response_store.get_report()
+
+        self.assertEqual(3, report.entries)
+        self.assertEqual(9, report.content_bytes)
+        self.assertEqual({2015: 2, 2016: 1}, report.entries_by_year)
+        self.assertEqual({2015: 8, 2016: 1}, report.content_bytes_by_year)
+        self.assertGreater(report.file_bytes, 0)
+
+        self.assertEqual(2, self.historical_response_store.purge(year=2015))
+        self.assertEqual({2016: 1}, self.historical_response_store.get_report().entries_by_year)
+        self.assertEqual(1, self.historical_response_store.purge())
+        self.assertEqual(0, self.historical_response_store.get_report().entries)
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_serve_completed_seasons_from_store(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+        original_response_cache = MFLAPIClient.get_response_cache()
+        MFLAPIClient.set_historical_response_store(self.historical_response_store)
+        try:
+            MFLAPIClient.set_response_cache(ResponseCache())
+            response_1 = DraftAndAuctionAPIClient.get_draft_results(year=self.__TEST_YEAR,
+                                                                    league_id=self.__TEST_LEAGUE_ID)
+            # a new process would start with an empty in-memory cache
+            MFLAPIClient.set_response_cache(ResponseCache())
+            response_2 = DraftAndAuctionAPIClient.get_draft_results(year=self.__TEST_YEAR,
+                                                                    league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_historical_response_store(None)
+            MFLAPIClient.set_response_cache(original_response_cache)
+
+        self.assertEqual({"k": "v"}, response_1)
+        self.assertEqual({"k": "v"}, response_2)
+        self.assertEqual(1, mock_requests_get.call_count)
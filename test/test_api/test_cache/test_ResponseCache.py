@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+from pymfl.api import FantasyContentAPIClient, ScoringAndResultsAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache
+from pymfl.api.config import APIConfig
+from test.helper.helper_classes import MockResponse
+
+
+class TestResponseCache(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+    __PLAYERS_URL = "https://api.myfantasyleague.com/2020/export?TYPE=players&JSON=1"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    @mock.patch("time.monotonic")
+    def test_get_respects_ttl_by_type(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        response_cache = ResponseCache(ttl_seconds_by_type={"players": 60})
+        response_cache.put(self.__PLAYERS_URL, {"k": "v"}, context="user")
+
+        mock_monotonic.return_value = 59
+        self.assertEqual({"k": "v"}, response_cache.get(self.__PLAYERS_URL, context="user"))
+        self.assertIsNone(response_cache.get(self.__PLAYERS_URL, context="other_user"))
+        mock_monotonic.return_value = 60
+        self.assertIsNone(response_cache.get(self.__PLAYERS_URL, context="user"))
+
+    def test_put_does_not_cache_types_with_zero_ttl(self):
+        response_cache = ResponseCache()
+        url = "https://api.myfantasyleague.com/2020/export?TYPE=rosters&L=12345&JSON=1"
+        response_cache.put(url, {"k": "v"})
+
+        self.assertIsNone(response_cache.get(url))
+        self.assertEqual(0, response_cache.get_stats().size)
+
+    @mock.patch("time.monotonic")
+    def test_put_caches_types_with_none_ttl_forever(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        response_cache = ResponseCache()
+        url = "https://api.myfantasyleague.com/2020/export?TYPE=nflByeWeeks&JSON=1"
+        response_cache.put(url, {"k": "v"})
+        mock_monotonic.return_value = 10 ** 9
+
+        self.assertEqual({"k": "v"}, response_cache.get(url))
+
+    def test_put_evicts_least_recently_used(self):
+        response_cache = ResponseCache(max_entries=2, default_ttl_seconds=60)
+        response_cache.put("https://a?TYPE=x", 1)
+        response_cache.put("https://b?TYPE=x", 2)
+        response_cache.get("https://a?TYPE=x")
+        response_cache.put("https://c?TYPE=x", 3)
+
+        self.assertEqual(1, response_cache.get("https://a?TYPE=x"))
+        self.assertIsNone(response_cache.get("https://b?TYPE=x"))
+        self.assertEqual(3, response_cache.get("https://c?TYPE=x"))
+        self.assertEqual(1, response_cache.get_stats().evictions)
+
+    def test_get_matches_urls_with_reordered_query(self):
+        response_cache = ResponseCache()
+        response_cache.put(self.__PLAYERS_URL, {"k": "v"})
+
+        self.assertEqual({"k": "v"}, response_cache.get("https://api.myfantasyleague.com/2020/export?JSON=1&TYPE=players"))
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_reuse_cached_responses(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+        original_response_cache = MFLAPIClient.get_response_cache()
+        MFLAPIClient.set_response_cache(ResponseCache())
+        try:
+            response_1 = FantasyContentAPIClient.get_players(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            response_2 = FantasyContentAPIClient.get_players(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            ScoringAndResultsAPIClient.get_league_standings(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            ScoringAndResultsAPIClient.get_league_standings(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_response_cache(original_response_cache)
+
+        self.assertEqual({"k": "v"}, response_1)
+        self.assertIs(response_1, response_2)
+        self.assertEqual(3, mock_requests_get.call_count)
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_return_fresh_results_without_response_cache(self, mock_requests_get):
+        mock_requests_get.side_effect = [MockResponse({"k": ["v"]}, 200), MockResponse({"k": ["v"]}, 200)]
+        original_response_cache = MFLAPIClient.get_response_cache()
+        MFLAPIClient.set_response_cache(None)
+        try:
+            response_1 = FantasyContentAPIClient.get_players(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            response_1["k"].append("mutated")
+            response_2 = FantasyContentAPIClient.get_players(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_response_cache(original_response_cache)
+
+        self.assertEqual({"k": ["v"]}, response_2)
+        self.assertEqual(2, mock_requests_get.call_count)
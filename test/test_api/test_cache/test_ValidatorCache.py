@@ -0,0 +1,107 @@
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient, TransactionsAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ValidatorCache, ValidatedResponse
+from pymfl.api.config import APIConfig
+from test.helper.helper_classes import MockResponse
+
+
+class TestValidatorCache(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.original_validator_cache = MFLAPIClient.get_validator_cache()
+        self.validator_cache = ValidatorCache()
+        MFLAPIClient.set_validator_cache(self.validator_cache)
+
+    def tearDown(self):
+        MFLAPIClient.set_validator_cache(self.original_validator_cache)
+
+    def test_get_conditional_headers(self):
+        validated_response = ValidatedResponse(etag='"abc"', last_modified="Sun, 06 Nov 2022 08:49:37 GMT",
+                                               content_hash=b"", result=dict())
+
+        self.assertEqual(dict(), ValidatorCache.get_conditional_headers(None))
+        self.assertEqual({"If-None-Match": '"abc"', "If-Modified-Since": "Sun, 06 Nov 2022 08:49:37 GMT"},
+                         ValidatorCache.get_conditional_headers(validated_response))
+
+    def test_put_evicts_least_recently_used(self):
+        validator_cache = ValidatorCache(max_entries=1)
+        validated_response = ValidatedResponse(etag=None, last_modified=None, content_hash=b"", result=dict())
+        validator_cache.put("https://a?TYPE=x", validated_response)
+        validator_cache.put("https://b?TYPE=x", validated_response)
+
+        self.assertIsNone(validator_cache.get("https://a?TYPE=x"))
+        self.assertIs(validated_response, validator_cache.get("https://b?TYPE=x"))
+
+    def test_put_evicts_least_recently_used_beyond_max_bytes(self):
+        validator_cache = ValidatorCache(max_bytes=10)
+        validated_response = ValidatedResponse(etag=None, last_modified=None, content_hash=b"", result=dict(),
+                                               size_bytes=6)
+        validator_cache.put("https://a?TYPE=x", validated_response)
+        validator_cache.put("https://b?TYPE=x", validated_response)
+        validator_cache.put("https://c?TYPE=x", ValidatedResponse(etag=None, last_modified=None, content_hash=b"",
+                                                                  result=dict(), size_bytes=11))
+
+        self.assertIsNone(validator_cache.get("https://a?TYPE=x"))
+        self.assertIs(validated_response, validator_cache.get("https://b?TYPE=x"))
+        self.assertIsNone(validator_cache.get("https://c?TYPE=x"))
+        self.assertEqual(6, validator_cache.size_bytes)
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_return_fresh_results_without_validator_cache(self, mock_requests_get):
+        mock_requests_get.side_effect = [MockResponse({"k": ["v"]}, 200, headers={"ETag": '"v1"'}),
+                                         MockResponse({"k": ["v"]}, 200, headers={"ETag": '"v1"'})]
+        MFLAPIClient.set_validator_cache(None)
+        response_1 = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        response_1["k"].append("mutated")
+        response_2 = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertEqual({"k": ["v"]}, response_2)
+        self.assertEqual({"User-Agent": self.__TEST_USER_AGENT_NAME},
+                         mock_requests_get.call_args_list[1].kwargs["headers"])
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_send_conditional_requests_and_reuse_result_on_304(self, mock_requests_get):
+        mock_requests_get.side_effect = [MockResponse({"k": "v"}, 200, headers={"ETag": '"v1"'}),
+                                         MockResponse(dict(), 304, content=b"")]
+        response_1 = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        response_2 = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertEqual({"k": "v"}, response_1)
+        self.assertIs(response_1, response_2)
+        self.assertEqual({"User-Agent": self.__TEST_USER_AGENT_NAME},
+                         mock_requests_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual({"User-Agent": self.__TEST_USER_AGENT_NAME, "If-None-Match": '"v1"'},
+                         mock_requests_get.call_args_list[1].kwargs["headers"])
+        self.assertEqual(1, self.validator_cache.reused_results)
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_reuse_result_when_body_is_unchanged(self, mock_requests_get):
+        mock_requests_get.side_effect = [MockResponse({"k": "v"}, 200), MockResponse({"k": "v"}, 200),
+                                         MockResponse({"k": "v2"}, 200)]
+        response_1 = TransactionsAPIClient.get_pending_trades(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        response_2 = TransactionsAPIClient.get_pending_trades(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        response_3 = TransactionsAPIClient.get_pending_trades(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertIs(response_1, response_2)
+        self.assertEqual({"k": "v2"}, response_3)
+        self.assertEqual(1, self.validator_cache.reused_results)
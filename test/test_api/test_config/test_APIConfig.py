@@ -0,0 +1,88 @@
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache, ValidatorCache
+from pymfl.api.config import APIConfig
+from pymfl.enum import AuthMode
+from test.helper.helper_classes import MockResponse
+
+
+class TestAPIConfig(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_API_KEY_LEAGUE_ID = "54321"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_API_KEY = "test_api_key"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.original_response_cache = MFLAPIClient.get_response_cache()
+        self.original_validator_cache = MFLAPIClient.get_validator_cache()
+        MFLAPIClient.set_response_cache(ResponseCache())
+        MFLAPIClient.set_validator_cache(ValidatorCache())
+
+    def tearDown(self):
+        MFLAPIClient.set_response_cache(self.original_response_cache)
+        MFLAPIClient.set_validator_cache(self.original_validator_cache)
+
+    @mock.patch("requests.Session.post")
+    def test_add_api_key_config_does_not_log_in(self, mock_requests_post):
+        APIConfig.add_api_key_config_for_year_and_league_id(year=self.__TEST_YEAR,
+                                                            league_id=self.__TEST_API_KEY_LEAGUE_ID,
+                                                            api_key=self.__TEST_API_KEY,
+                                                            user_agent_name=self.__TEST_USER_AGENT_NAME)
+        api_config = APIConfig.get_config_by_year_and_league_id(year=self.__TEST_YEAR,
+                                                                league_id=self.__TEST_API_KEY_LEAGUE_ID)
+        login_api_config = APIConfig.get_config_by_year_and_league_id(year=self.__TEST_YEAR,
+                                                                      league_id=self.__TEST_LEAGUE_ID)
+
+        mock_requests_post.assert_not_called()
+        self.assertEqual(AuthMode.API_KEY, api_config.auth_mode)
+        self.assertIsNone(api_config.mfl_user_id)
+        self.assertNotIn(self.__TEST_API_KEY, api_config.user_context)
+        self.assertEqual(AuthMode.LOGIN, login_api_config.auth_mode)
+        self.assertEqual("test_user_id=", login_api_config.user_context)
+
+    @mock.patch("requests.Session.get")
+    def test_api_key_is_sent_instead_of_mfl_user_id(self, mock_requests_get):
+        APIConfig.add_api_key_config_for_year_and_league_id(year=self.__TEST_YEAR,
+                                                            league_id=self.__TEST_API_KEY_LEAGUE_ID,
+                                                            api_key=self.__TEST_API_KEY,
+                                                            user_agent_name=self.__TEST_USER_AGENT_NAME)
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+
+        response = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR,
+                                                         league_id=self.__TEST_API_KEY_LEAGUE_ID)
+
+        self.assertEqual({"k": "v"}, response)
+        self.assertEqual("https://api.myfantasyleague.com/2020/export?TYPE=rosters&L=54321&JSON=1&APIKEY=test_api_key",
+                         mock_requests_get.call_args.args[0])
+        self.assertEqual({"MFL_LAST_LEAGUE_ID": self.__TEST_API_KEY_LEAGUE_ID},
+                         mock_requests_get.call_args.kwargs["cookies"])
+        self.assertEqual({"User-Agent": self.__TEST_USER_AGENT_NAME}, mock_requests_get.call_args.kwargs["headers"])
+
+    @mock.patch("requests.Session.get")
+    def test_user_agent_and_mfl_user_id_are_sent_for_login_configs(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+
+        CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertNotIn("APIKEY", mock_requests_get.call_args.args[0])
+        self.assertEqual({"MFL_LAST_LEAGUE_ID": self.__TEST_LEAGUE_ID, "MFL_USER_ID": "test_user_id="},
+                         mock_requests_get.call_args.kwargs["cookies"])
+        self.assertEqual({"User-Agent": self.__TEST_USER_AGENT_NAME}, mock_requests_get.call_args.kwargs["headers"])
@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+
+from pymfl.api.config import APIConfig, ConfigRegistry, ConfigSpec, LoginSessionCache, YearAPIConfig
+from pymfl.enum import AuthMode
+from pymfl.exception import MissingYearAPIConfigException
+from test.helper.helper_classes import MockResponse
+
+
+class TestConfigRegistry(unittest.TestCase):
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    def setUp(self):
+        self.original_config_registry = APIConfig.get_config_registry()
+        self.original_login_session_cache = APIConfig.get_login_session_cache()
+        APIConfig.set_config_registry(ConfigRegistry())
+        APIConfig.set_login_session_cache(LoginSessionCache())
+
+    def tearDown(self):
+        APIConfig.set_config_registry(self.original_config_registry)
+        APIConfig.set_login_session_cache(self.original_login_session_cache)
+
+    def __build_config(self, *, year: int, league_id: str, username: str = "username") -> YearAPIConfig:
+        return YearAPIConfig(year=year, league_id=league_id, username=username, mfl_user_id=f"{username}_id=",
+                             user_agent_name=self.__TEST_USER_AGENT_NAME)
+
+    def test_keys_do_not_collide(self):
+        config_registry = ConfigRegistry()
+        config_1 = self.__build_config(year=2020, league_id="12345")
+        config_2 = self.__build_config(year=20201, league_id="2345")
+
+        config_registry.put_many((config_1, config_2))
+
+        self.assertEqual(2, len(config_registry))
+        self.assertIs(config_1, config_registry.get(year=2020, league_id="12345"))
+        self.assertIs(config_2, config_registry.get(year=20201, league_id="2345"))
+        self.assertIn((2020, "12345"), config_registry)
+        self.assertNotIn((2020, "2345"), config_registry)
+
+    def test_lookups_by_year_league_and_username(self):
+        config_registry = ConfigRegistry()
+        config_1 = self.__build_config(year=2020, league_id="12345", username="user_1")
+        config_2 = self.__build_config(year=2021, league_id="12345", username="user_1")
+        config_3 = self.__build_config(year=2021, league_id="67890", username="user_2")
+        config_registry.put_many((config_1, config_2, config_3))
+
+        self.assertCountEqual([config_2, config_3], config_registry.get_by_year(2021))
+        self.assertCountEqual([config_1, config_2], config_registry.get_by_league_id("12345"))
+        self.assertCountEqual([config_1, config_2], config_registry.get_by_username("user_1"))
+
+        replacement_config = self.__build_config(year=2021, league_id="12345", username="user_2")
+        config_registry.put(replacement_config)
+        config_registry.remove(year=2020, league_id="12345")
+
+        self.assertEqual(list(), config_registry.get_by_username("user_1"))
+        self.assertCountEqual([replacement_config, config_3], config_registry.get_by_username("user_2"))
+        self.assertEqual([replacement_config], config_registry.get_by_league_id("12345"))
+        self.assertEqual(list(), config_registry.get_by_year(2020))
+
+    @mock.patch("requests.Session.post")
+    def test_register_many_logs_in_once_per_username_and_year(self, mock_requests_post):
+        def login(url, **kwargs):
+            username = url.split("USERNAME=")[1].split("&")[0]
+            if username == "bad_username":
+                return MockResponse(dict(), 200, content="""<error>Invalid login</error>""")
+            return MockResponse(dict(), 200, content=f"""<status MFL_USER_ID="{username}_id=">OK</status>""")
+
+        mock_requests_post.side_effect = login
+        config_specs = [ConfigSpec(year=2020, league_id=str(league_id), user_agent_name=self.__TEST_USER_AGENT_NAME,
+                                   username=f"user_{league_id % 3}", password="password")
+                        for league_id in range(30)]
+        api_key_config_spec = ConfigSpec(year=2020, league_id="api_key_league",
+                                         user_agent_name=self.__TEST_USER_AGENT_NAME, api_key="api_key")
+        bad_config_spec = ConfigSpec(year=2020, league_id="bad_league", user_agent_name=self.__TEST_USER_AGENT_NAME,
+                                     username="bad_username", password="password")
+
+        failures = APIConfig.register_many([*config_specs, api_key_config_spec, bad_config_spec], max_concurrency=8)
+
+        self.assertEqual([bad_config_spec], list(failures.keys()))
+        self.assertEqual(4, mock_requests_post.call_count)
+        self.assertEqual(31, len(APIConfig.get_config_registry()))
+        self.assertEqual("user_2_id=", APIConfig.get_config_by_year_and_league_id(year=2020, league_id="5").mfl_user_id)
+        self.assertEqual(10, len(APIConfig.get_config_registry().get_by_username("user_2")))
+        self.assertEqual(AuthMode.API_KEY,
+                         APIConfig.get_config_by_year_and_league_id(year=2020, league_id="api_key_league").auth_mode)
+        with self.assertRaises(MissingYearAPIConfigException):
+            APIConfig.get_config_by_year_and_league_id(year=2020, league_id="bad_league")
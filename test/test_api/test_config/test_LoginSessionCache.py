@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache, ValidatorCache
+from pymfl.api.config import APIConfig, LoginSessionCache
+from test.helper.helper_classes import MockResponse
+
+
+class TestLoginSessionCache(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_USERNAME = "session_username"
+    __TEST_PASSWORD = "session_password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.original_login_session_cache = APIConfig.get_login_session_cache()
+        APIConfig.set_login_session_cache(LoginSessionCache())
+
+    def tearDown(self):
+        APIConfig.set_login_session_cache(self.original_login_session_cache)
+        self.temporary_directory.cleanup()
+
+    @staticmethod
+    def __get_login_response(mfl_user_id: str) -> MockResponse:
+        return MockResponse(dict(), 200, content=f"""<status MFL_USER_ID="{mfl_user_id}">OK</status>""")
+
+    @mock.patch("requests.Session.post")
+    def test_logins_are_shared_by_username_and_year(self, mock_requests_post):
+        mock_requests_post.return_value = self.__get_login_response("session_user_id=")
+
+        for league_id in ("10001", "10002", "10003"):
+            APIConfig.add_config_for_year_and_league_id(year=self.__TEST_YEAR,
+                                                        league_id=league_id,
+                                                        username=self.__TEST_USERNAME,
+                                                        password=self.__TEST_PASSWORD,
+                                                        user_agent_name=self.__TEST_USER_AGENT_NAME)
+        APIConfig.add_config_for_year_and_league_id(year=self.__TEST_YEAR + 1,
+                                                    league_id="10001",
+                                                    username=self.__TEST_USERNAME,
+                                                    password=self.__TEST_PASSWORD,
+                                                    user_agent_name=self.__TEST_USER_AGENT_NAME)
+
+        self.assertEqual(2, mock_requests_post.call_count)
+        self.assertEqual(2, APIConfig.get_login_session_cache().logins)
+        self.assertEqual("session_user_id=",
+                         APIConfig.get_config_by_year_and_league_id(year=self.__TEST_YEAR,
+                                                                    league_id="10003").mfl_user_id)
+
+    def test_logins_are_persisted_without_passwords(self):
+        path = os.path.join(self.temporary_directory.name, "sessions", "logins.json")
+        login_session_cache = LoginSessionCache(path=path)
+
+        login_session_cache.get_or_login(year=self.__TEST_YEAR, username=self.__TEST_USERNAME,
+                                         login=lambda: "session_user_id=")
+        reloaded_login_session_cache = LoginSessionCache(path=path)
+
+        self.assertEqual("session_user_id=",
+                         reloaded_login_session_cache.get(year=self.__TEST_YEAR, username=self.__TEST_USERNAME))
+        self.assertEqual("session_user_id=",
+                         reloaded_login_session_cache.get_or_login(year=self.__TEST_YEAR,
+                                                                   username=self.__TEST_USERNAME,
+                                                                   login=lambda: self.fail("logged in again")))
+        with open(path, "r", encoding="utf-8") as file:
+            persisted = json.load(file)
+        self.assertNotIn(self.__TEST_PASSWORD, json.dumps(persisted))
+        self.assertEqual(0o600, os.stat(path).st_mode & 0o777)
+
+    def test_expired_logins_are_not_reused(self):
+        login_session_cache = LoginSessionCache(ttl_seconds=0)
+
+        login_session_cache.get_or_login(year=self.__TEST_YEAR, username=self.__TEST_USERNAME,
+                                         login=lambda: "session_user_id=")
+
+        self.assertIsNone(login_session_cache.get(year=self.__TEST_YEAR, username=self.__TEST_USERNAME))
+        self.assertEqual("new_session_user_id=",
+                         login_session_cache.get_or_login(year=self.__TEST_YEAR, username=self.__TEST_USERNAME,
+                                                          login=lambda: "new_session_user_id="))
+
+    @mock.patch("requests.Session.get")
+    @mock.patch("requests.Session.post")
+    def test_auth_error_logs_in_again_and_retries(self, mock_requests_post, mock_requests_get):
+        mock_requests_post.side_effect = [self.__get_login_response("expired_user_id="),
+                                          self.__get_login_response("fresh_user_id=")]
+        for league_id in ("10001", "10002"):
+            APIConfig.add_config_for_year_and_league_id(year=self.__TEST_YEAR,
+                                                        league_id=league_id,
+                                                        username=self.__TEST_USERNAME,
+                                                        password=self.__TEST_PASSWORD,
+                                                        user_agent_name=self.__TEST_USER_AGENT_NAME)
+        mock_requests_get.side_effect = [MockResponse({"error": {"$t": "API requires logged in user"}}, 200),
+                                         MockResponse({"rosters": {"franchise": []}}, 200)]
+        original_response_cache = MFLAPIClient.get_response_cache()
+        original_validator_cache = MFLAPIClient.get_validator_cache()
+        MFLAPIClient.set_response_cache(ResponseCache())
+        MFLAPIClient.set_validator_cache(ValidatorCache())
+        try:
+            response = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id="10001")
+        finally:
+            MFLAPIClient.set_response_cache(original_response_cache)
+            MFLAPIClient.set_validator_cache(original_validator_cache)
+
+        self.assertEqual({"rosters": {"franchise": []}}, response)
+        self.assertEqual("expired_user_id=", mock_requests_get.call_args_list[0].kwargs["cookies"]["MFL_USER_ID"])
+        self.assertEqual("fresh_user_id=", mock_requests_get.call_args_list[1].kwargs["cookies"]["MFL_USER_ID"])
+        # every config of the same username and year gets the new login
+        self.assertEqual("fresh_user_id=",
+                         APIConfig.get_config_by_year_and_league_id(year=self.__TEST_YEAR,
+                                                                    league_id="10002").mfl_user_id)
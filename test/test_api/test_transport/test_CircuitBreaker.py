@@ -0,0 +1,115 @@
+import unittest
+from unittest import mock
+
+from requests import HTTPError
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache, ValidatorCache
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import CircuitBreaker, RetryPolicy, Deadline
+from pymfl.enum import CircuitState
+from pymfl.exception import CircuitOpenException, MFLAPIClientException, DeadlineExceededException
+from test.helper.helper_classes import MockResponse
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+    __TEST_HOST = "api.myfantasyleague.com"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    @mock.patch("time.monotonic")
+    def test_circuit_opens_after_threshold_and_half_opens_after_timeout(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10)
+        circuit_breaker.on_failure(self.__TEST_HOST)
+        circuit_breaker.before_request(self.__TEST_HOST)
+        circuit_breaker.on_failure(self.__TEST_HOST)
+
+        self.assertEqual(CircuitState.OPEN, circuit_breaker.get_state(self.__TEST_HOST))
+        with self.assertRaises(CircuitOpenException):
+            circuit_breaker.before_request(self.__TEST_HOST)
+        circuit_breaker.before_request("other.host")
+
+        mock_monotonic.return_value = 10
+        circuit_breaker.before_request(self.__TEST_HOST)
+        self.assertEqual(CircuitState.HALF_OPEN, circuit_breaker.get_state(self.__TEST_HOST))
+        with self.assertRaises(CircuitOpenException):
+            circuit_breaker.before_request(self.__TEST_HOST)
+
+        circuit_breaker.on_failure(self.__TEST_HOST)
+        self.assertEqual(CircuitState.OPEN, circuit_breaker.get_state(self.__TEST_HOST))
+
+        mock_monotonic.return_value = 20
+        circuit_breaker.before_request(self.__TEST_HOST)
+        circuit_breaker.on_success(self.__TEST_HOST)
+        self.assertEqual(CircuitState.CLOSED, circuit_breaker.get_state(self.__TEST_HOST))
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.get")
+    def test_api_clients_fail_fast_while_circuit_is_open(self, mock_requests_get, mock_sleep):
+        mock_requests_get.return_value = MockResponse(dict(), 503)
+        original_retry_policy = MFLAPIClient.get_retry_policy()
+        original_circuit_breaker = MFLAPIClient.get_circuit_breaker()
+        MFLAPIClient.set_retry_policy(RetryPolicy(max_retries=5))
+        MFLAPIClient.set_circuit_breaker(CircuitBreaker(failure_threshold=3))
+        try:
+            with self.assertRaises(CircuitOpenException):
+                CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            with self.assertRaises(MFLAPIClientException):
+                CommonLeagueInfoAPIClient.get_rules(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_retry_policy(original_retry_policy)
+            MFLAPIClient.set_circuit_breaker(original_circuit_breaker)
+
+        self.assertEqual(3, mock_requests_get.call_count)
+
+    @mock.patch("time.monotonic")
+    @mock.patch("requests.Session.get")
+    def test_half_open_trial_that_is_never_sent_is_released(self, mock_requests_get, mock_monotonic):
+        mock_monotonic.return_value = 0
+        mock_requests_get.return_value = MockResponse(dict(), 500)
+        original_retry_policy = MFLAPIClient.get_retry_policy()
+        original_circuit_breaker = MFLAPIClient.get_circuit_breaker()
+        original_response_cache = MFLAPIClient.get_response_cache()
+        original_validator_cache = MFLAPIClient.get_validator_cache()
+        MFLAPIClient.set_retry_policy(RetryPolicy(max_retries=0))
+        MFLAPIClient.set_circuit_breaker(CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10))
+        MFLAPIClient.set_response_cache(ResponseCache())
+        MFLAPIClient.set_validator_cache(ValidatorCache())
+        try:
+            with self.assertRaises(HTTPError):
+                CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            mock_monotonic.return_value = 10
+            with Deadline(5) as deadline:
+                mock_monotonic.return_value = 20
+                self.assertTrue(deadline.expired)
+                with self.assertRaises(DeadlineExceededException):
+                    CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            self.assertEqual(CircuitState.OPEN, MFLAPIClient.get_circuit_breaker().get_state(self.__TEST_HOST))
+
+            mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+            response = CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_retry_policy(original_retry_policy)
+            MFLAPIClient.set_circuit_breaker(original_circuit_breaker)
+            MFLAPIClient.set_response_cache(original_response_cache)
+            MFLAPIClient.set_validator_cache(original_validator_cache)
+
+        self.assertEqual("v", response["k"])
+        self.assertEqual(CircuitState.CLOSED, MFLAPIClient.get_circuit_breaker().get_state(self.__TEST_HOST))
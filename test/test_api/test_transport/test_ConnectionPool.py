@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import ConnectionPool
+from test.helper.helper_classes import MockResponse
+
+
+class TestConnectionPool(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def test_get_session_reuses_session_per_host(self):
+        connection_pool = ConnectionPool()
+        session_1 = connection_pool.get_session("api.myfantasyleague.com")
+        session_2 = connection_pool.get_session("api.myfantasyleague.com")
+        session_3 = connection_pool.get_session("www43.myfantasyleague.com")
+
+        self.assertIs(session_1, session_2)
+        self.assertIsNot(session_1, session_3)
+
+    def test_get_session_uses_configured_pool_size(self):
+        connection_pool = ConnectionPool(pool_connections=3, pool_maxsize=25, pool_block=True)
+        session = connection_pool.get_session("api.myfantasyleague.com")
+        adapter = session.get_adapter("https://api.myfantasyleague.com")
+
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(25, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_use_connection_pool(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+        original_connection_pool = MFLAPIClient.get_connection_pool()
+        connection_pool = ConnectionPool()
+        MFLAPIClient.set_connection_pool(connection_pool)
+        try:
+            CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+            CommonLeagueInfoAPIClient.get_rules(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_connection_pool(original_connection_pool)
+        stats = connection_pool.get_stats()
+
+        self.assertEqual(2, mock_requests_get.call_count)
+        self.assertEqual(1, len(stats))
+        self.assertEqual(2, stats["api.myfantasyleague.com"].requests_sent)
+        self.assertEqual(0, stats["api.myfantasyleague.com"].connections_opened)
+        self.assertEqual(2, stats["api.myfantasyleague.com"].connections_reused)
+
+    def test_close_closes_sessions(self):
+        connection_pool = ConnectionPool()
+        session = connection_pool.get_session("api.myfantasyleague.com")
+        with mock.patch.object(session, "close") as mock_close:
+            connection_pool.close()
+
+        mock_close.assert_called_once()
+        self.assertEqual(dict(), connection_pool.get_stats())
+        self.assertIsNot(session, connection_pool.get_session("api.myfantasyleague.com"))
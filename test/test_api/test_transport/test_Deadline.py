@@ -0,0 +1,93 @@
+import time
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient, TransactionsAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache, ValidatorCache
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import Deadline, RequestTimeout
+from pymfl.exception import DeadlineExceededException
+from test.helper.helper_classes import MockResponse
+
+
+class TestDeadline(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.original_response_cache = MFLAPIClient.get_response_cache()
+        self.original_validator_cache = MFLAPIClient.get_validator_cache()
+        MFLAPIClient.set_response_cache(ResponseCache())
+        MFLAPIClient.set_validator_cache(ValidatorCache())
+
+    def tearDown(self):
+        MFLAPIClient.set_response_cache(self.original_response_cache)
+        MFLAPIClient.set_validator_cache(self.original_validator_cache)
+
+    def test_nested_deadlines_never_extend_the_outer_one(self):
+        with Deadline(5) as outer_deadline:
+            with Deadline(60) as inner_deadline:
+                self.assertIs(outer_deadline, inner_deadline)
+                self.assertIs(outer_deadline, Deadline.get_current())
+            with Deadline(1) as inner_deadline:
+                self.assertIsNot(outer_deadline, inner_deadline)
+                self.assertLessEqual(inner_deadline.remaining_seconds, 1)
+            self.assertIs(outer_deadline, Deadline.get_current())
+        self.assertIsNone(Deadline.get_current())
+
+    @mock.patch("requests.Session.get")
+    def test_requests_are_sent_with_the_request_timeout(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200)
+
+        CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        self.assertEqual((5.0, 30.0), mock_requests_get.call_args.kwargs["timeout"])
+
+        with MFLAPIClient.request_timeout(RequestTimeout(connect_seconds=1, read_seconds=None)):
+            CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        self.assertEqual((1, None), mock_requests_get.call_args.kwargs["timeout"])
+
+        with Deadline(2):
+            CommonLeagueInfoAPIClient.get_rules(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        connect_seconds, read_seconds = mock_requests_get.call_args.kwargs["timeout"]
+        self.assertTrue(0 < connect_seconds <= 2)
+        self.assertTrue(0 < read_seconds <= 2)
+
+    @mock.patch("requests.Session.get")
+    def test_no_request_is_sent_once_the_deadline_has_passed(self, mock_requests_get):
+        with Deadline(0.01):
+            time.sleep(0.02)
+            with self.assertRaises(DeadlineExceededException):
+                CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        mock_requests_get.assert_not_called()
+
+    @mock.patch("requests.Session.get")
+    def test_streamed_responses_stop_being_read_once_the_deadline_has_passed(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse(dict(), 200, content=b"""<transactions>
+        <transaction type="FREE_AGENT" franchise="0001" timestamp="1600000000"/>
+        <transaction type="TRADE" franchise="0002" timestamp="1600000001"/>
+        </transactions>""")
+
+        with mock.patch.object(MFLAPIClient, "_STREAM_CHUNK_SIZE", 8), Deadline(0.05):
+            transactions = TransactionsAPIClient.iter_transactions(year=self.__TEST_YEAR,
+                                                                   league_id=self.__TEST_LEAGUE_ID)
+            self.assertEqual("0001", next(transactions)["franchise"])
+            time.sleep(0.06)
+            with self.assertRaises(DeadlineExceededException):
+                next(transactions)
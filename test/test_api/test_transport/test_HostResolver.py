@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import HostResolver
+from test.helper.helper_classes import MockResponse
+
+
+class TestHostResolver(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+    __TEST_HOME_HOST = "www43.myfantasyleague.com"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.__original_host_resolver = MFLAPIClient.get_host_resolver()
+        self.__original_response_cache = MFLAPIClient.get_response_cache()
+        MFLAPIClient.set_host_resolver(HostResolver())
+        MFLAPIClient.set_response_cache(ResponseCache())
+
+    def tearDown(self):
+        MFLAPIClient.set_host_resolver(self.__original_host_resolver)
+        MFLAPIClient.set_response_cache(self.__original_response_cache)
+
+    def test_resolve_url_only_rewrites_urls_for_the_league(self):
+        host_resolver = HostResolver()
+        league_url = "https://api.myfantasyleague.com/2020/export?TYPE=rosters&L=12345&JSON=1"
+        players_url = "https://api.myfantasyleague.com/2020/export?TYPE=players&JSON=1"
+        self.assertEqual(league_url, host_resolver.resolve_url(league_url, year=2020, league_id="12345"))
+
+        host_resolver.set_host(year=2020, league_id="12345", host=self.__TEST_HOME_HOST)
+
+        self.assertEqual("https://www43.myfantasyleague.com/2020/export?TYPE=rosters&L=12345&JSON=1",
+                         host_resolver.resolve_url(league_url, year=2020, league_id="12345"))
+        self.assertEqual(players_url, host_resolver.resolve_url(players_url, year=2020, league_id="12345"))
+        self.assertEqual(league_url, host_resolver.resolve_url(league_url, year=2021, league_id="12345"))
+
+    @mock.patch("requests.Session.get")
+    def test_home_host_is_learned_from_redirect(self, mock_requests_get):
+        redirected_url = f"https://{self.__TEST_HOME_HOST}/2020/export?TYPE=rules&L=12345&JSON=1"
+        mock_requests_get.return_value = MockResponse({"k": "v"}, 200, url=redirected_url,
+                                                      history=[MockResponse(dict(), 302)])
+
+        CommonLeagueInfoAPIClient.get_rules(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertEqual(self.__TEST_HOME_HOST,
+                         MFLAPIClient.get_host_resolver().get_host(year=self.__TEST_YEAR,
+                                                                   league_id=self.__TEST_LEAGUE_ID))
+        self.assertEqual("https://api.myfantasyleague.com/2020/export?TYPE=rules&L=12345&JSON=1",
+                         mock_requests_get.call_args_list[0][0][0])
+        self.assertEqual(f"https://{self.__TEST_HOME_HOST}/2020/export?TYPE=rosters&L=12345&JSON=1",
+                         mock_requests_get.call_args_list[1][0][0])
+
+    @mock.patch("requests.Session.get")
+    def test_home_host_is_learned_from_league_base_url(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"league": {"baseURL": f"https://{self.__TEST_HOME_HOST}"}},
+                                                      200)
+
+        CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertEqual(self.__TEST_HOME_HOST,
+                         MFLAPIClient.get_host_resolver().get_host(year=self.__TEST_YEAR,
+                                                                   league_id=self.__TEST_LEAGUE_ID))
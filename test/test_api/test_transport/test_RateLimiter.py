@@ -0,0 +1,142 @@
+import os
+import time
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import RateLimiter, Deadline
+from pymfl.exception import DeadlineExceededException
+from test.helper.helper_classes import MockResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = list()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+    __TEST_HOST = "api.myfantasyleague.com"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.fake_clock = FakeClock()
+        patcher_monotonic = mock.patch("time.monotonic", self.fake_clock.monotonic)
+        patcher_sleep = mock.patch("time.sleep", self.fake_clock.sleep)
+        patcher_monotonic.start()
+        patcher_sleep.start()
+        self.addCleanup(patcher_monotonic.stop)
+        self.addCleanup(patcher_sleep.stop)
+
+    def test_acquire_queues_callers_over_the_rate(self):
+        rate_limiter = RateLimiter(requests_per_second=2)
+        for _ in range(5):
+            rate_limiter.acquire(self.__TEST_HOST, "user")
+
+        self.assertAlmostEqual(2.0, self.fake_clock.now - 1000.0)
+
+    def test_acquire_uses_separate_buckets_per_host_and_user(self):
+        rate_limiter = RateLimiter(requests_per_second=1, requests_per_second_by_host={"other.host": None})
+        rate_limiter.acquire(self.__TEST_HOST, "user_1")
+        rate_limiter.acquire(self.__TEST_HOST, "user_2")
+        for _ in range(10):
+            rate_limiter.acquire("other.host", "user_1")
+
+        self.assertEqual([], self.fake_clock.sleeps)
+        self.assertIsNone(rate_limiter.get_requests_per_second("other.host", "user_1"))
+
+    def test_on_throttled_honors_retry_after_and_adapts_rate(self):
+        rate_limiter = RateLimiter(requests_per_second=8, recovery_step=1)
+        rate_limiter.acquire(self.__TEST_HOST)
+        rate_limiter.on_throttled(self.__TEST_HOST, retry_after_seconds=30)
+
+        self.assertEqual(4, rate_limiter.get_requests_per_second(self.__TEST_HOST))
+        rate_limiter.acquire(self.__TEST_HOST)
+        self.assertAlmostEqual(30.0, self.fake_clock.now - 1000.0)
+
+        for _ in range(10):
+            rate_limiter.on_success(self.__TEST_HOST)
+        self.assertEqual(8, rate_limiter.get_requests_per_second(self.__TEST_HOST))
+
+    def test_acquire_does_not_wait_beyond_the_deadline(self):
+        rate_limiter = RateLimiter()
+        rate_limiter.on_throttled(self.__TEST_HOST, retry_after_seconds=30)
+
+        with Deadline(2):
+            with self.assertRaises(DeadlineExceededException):
+                rate_limiter.acquire(self.__TEST_HOST)
+        self.assertEqual([], self.fake_clock.sleeps)
+
+    def test_on_throttled_limits_unlimited_bucket_to_half_observed_rate(self):
+        rate_limiter = RateLimiter(min_requests_per_second=0.5)
+        for _ in range(11):
+            rate_limiter.acquire(self.__TEST_HOST)
+            self.fake_clock.now += 0.1
+        rate_limiter.on_throttled(self.__TEST_HOST)
+
+        self.assertAlmostEqual(5.0, rate_limiter.get_requests_per_second(self.__TEST_HOST))
+
+    def test_get_retry_after_seconds(self):
+        self.assertIsNone(RateLimiter.get_retry_after_seconds(MockResponse(dict(), 200)))
+        self.assertEqual(1.0, RateLimiter.get_retry_after_seconds(MockResponse(dict(), 429)))
+        self.assertEqual(12.0, RateLimiter.get_retry_after_seconds(
+            MockResponse(dict(), 503, headers={"Retry-After": "12"})))
+
+    @mock.patch("time.time", return_value=1445412470.0)
+    def test_get_retry_after_seconds_treats_dates_without_zone_as_utc(self, _):
+        # a local time zone other than UTC would shift dates without a zone
+        try:
+            with mock.patch.dict(os.environ, {"TZ": "America/New_York"}):
+                time.tzset()
+                self.assertEqual(10.0, RateLimiter.get_retry_after_seconds(
+                    MockResponse(dict(), 429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 -0000"})))
+                self.assertEqual(10.0, RateLimiter.get_retry_after_seconds(
+                    MockResponse(dict(), 429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})))
+        finally:
+            time.tzset()
+
+    def test_get_retry_after_seconds_falls_back_on_malformed_dates(self):
+        self.assertEqual(1.0, RateLimiter.get_retry_after_seconds(
+            MockResponse(dict(), 429, headers={"Retry-After": "not a date"})))
+        self.assertEqual(1.0, RateLimiter.get_retry_after_seconds(
+            MockResponse(dict(), 429, headers={"Retry-After": "Wed, 32 Oct 2015 07:28:00 GMT"})))
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_retry_throttled_requests(self, mock_requests_get):
+        mock_requests_get.side_effect = [MockResponse(dict(), 429, headers={"Retry-After": "5"}),
+                                         MockResponse({"k": "v"}, 200)]
+        original_rate_limiter = MFLAPIClient.get_rate_limiter()
+        MFLAPIClient.set_rate_limiter(RateLimiter())
+        try:
+            response = CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_rate_limiter(original_rate_limiter)
+
+        self.assertEqual({"k": "v"}, response)
+        self.assertEqual(2, mock_requests_get.call_count)
+        self.assertEqual([5.0], self.fake_clock.sleeps)
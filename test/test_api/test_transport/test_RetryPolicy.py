@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+
+from requests import HTTPError
+from requests.exceptions import ConnectionError
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import RetryPolicy, CircuitBreaker
+from test.helper.helper_classes import MockResponse
+
+
+class TestRetryPolicy(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.original_retry_policy = MFLAPIClient.get_retry_policy()
+        self.original_circuit_breaker = MFLAPIClient.get_circuit_breaker()
+        MFLAPIClient.set_retry_policy(RetryPolicy(max_retries=2))
+        MFLAPIClient.set_circuit_breaker(CircuitBreaker())
+
+    def tearDown(self):
+        MFLAPIClient.set_retry_policy(self.original_retry_policy)
+        MFLAPIClient.set_circuit_breaker(self.original_circuit_breaker)
+
+    def test_get_delay_seconds_is_capped_exponential_with_jitter(self):
+        retry_policy = RetryPolicy(base_delay_seconds=1, max_delay_seconds=5)
+
+        with mock.patch("random.uniform", side_effect=lambda low, high: high) as mock_uniform:
+            self.assertEqual([1, 2, 4, 5, 5], [retry_policy.get_delay_seconds(attempt) for attempt in range(5)])
+        self.assertEqual(0, mock_uniform.call_args.args[0])
+        for attempt in range(5):
+            self.assertTrue(0 <= retry_policy.get_delay_seconds(attempt) <= 5)
+
+    def test_is_retryable(self):
+        retry_policy = RetryPolicy()
+
+        self.assertTrue(retry_policy.is_retryable_response(MockResponse(dict(), 503)))
+        self.assertFalse(retry_policy.is_retryable_response(MockResponse(dict(), 404)))
+        self.assertTrue(retry_policy.is_retryable_exception(ConnectionError()))
+        self.assertFalse(retry_policy.is_retryable_exception(ValueError()))
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.get")
+    def test_api_clients_retry_server_errors(self, mock_requests_get, mock_sleep):
+        mock_requests_get.side_effect = [MockResponse(dict(), 502), ConnectionError(), MockResponse({"k": "v"}, 200)]
+        response = CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertEqual({"k": "v"}, response)
+        self.assertEqual(3, mock_requests_get.call_count)
+        self.assertEqual(2, mock_sleep.call_count)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.get")
+    def test_api_clients_raise_after_max_retries(self, mock_requests_get, mock_sleep):
+        mock_requests_get.return_value = MockResponse(dict(), 500)
+
+        with self.assertRaises(HTTPError):
+            CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        self.assertEqual(3, mock_requests_get.call_count)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.get")
+    def test_api_clients_do_not_retry_client_errors(self, mock_requests_get, mock_sleep):
+        mock_requests_get.return_value = MockResponse(dict(), 404)
+
+        with self.assertRaises(HTTPError):
+            CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        self.assertEqual(1, mock_requests_get.call_count)
+        mock_sleep.assert_not_called()
@@ -0,0 +1,122 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.config import APIConfig
+from pymfl.api.transport import SingleFlight, Deadline
+from pymfl.exception import MFLAPIClientException, DeadlineExceededException
+from test.helper.helper_classes import MockResponse
+
+
+class TestSingleFlight(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def test_do_coalesces_identical_concurrent_calls(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = list()
+
+        def function():
+            calls.append(1)
+            release.wait()
+            return {"k": "v"}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(single_flight.do, "key", function) for _ in range(5)]
+            while single_flight.coalesced_calls < 4:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(4, single_flight.coalesced_calls)
+
+    def test_waiting_for_an_identical_call_is_bounded_by_the_deadline(self):
+        single_flight = SingleFlight()
+        entered = threading.Event()
+        release = threading.Event()
+
+        def function():
+            entered.set()
+            release.wait()
+            return {"k": "v"}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(single_flight.do, "key", function)
+            entered.wait()
+            start = time.monotonic()
+            with Deadline(0.05):
+                with self.assertRaises(DeadlineExceededException):
+                    single_flight.do("key", lambda: {"k": "other"})
+            elapsed_seconds = time.monotonic() - start
+            release.set()
+
+            self.assertEqual({"k": "v"}, leader.result())
+        self.assertLess(elapsed_seconds, 1)
+        self.assertEqual(1, single_flight.coalesced_calls)
+
+    def test_do_shares_exception(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def function():
+            release.wait()
+            raise MFLAPIClientException("error")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.do, "key", function) for _ in range(3)]
+            while single_flight.coalesced_calls < 2:
+                time.sleep(0.001)
+            release.set()
+            exceptions = [future.exception() for future in futures]
+
+        self.assertTrue(all(isinstance(exception, MFLAPIClientException) for exception in exceptions))
+
+    def test_do_runs_sequential_calls_separately(self):
+        single_flight = SingleFlight()
+
+        self.assertEqual(1, single_flight.do("key", lambda: 1))
+        self.assertEqual(2, single_flight.do("key", lambda: 2))
+        self.assertEqual(0, single_flight.coalesced_calls)
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_coalesce_identical_requests(self, mock_requests_get):
+        release = threading.Event()
+
+        def get(url, **kwargs):
+            release.wait()
+            return MockResponse({"k": "v"}, 200)
+
+        mock_requests_get.side_effect = get
+        coalesced_calls = MFLAPIClient._SINGLE_FLIGHT.coalesced_calls
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(CommonLeagueInfoAPIClient.get_rosters, year=self.__TEST_YEAR,
+                                       league_id=self.__TEST_LEAGUE_ID, week=3) for _ in range(4)]
+            while MFLAPIClient._SINGLE_FLIGHT.coalesced_calls < coalesced_calls + 3:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(1, mock_requests_get.call_count)
+        self.assertTrue(all(result == {"k": "v"} for result in results))
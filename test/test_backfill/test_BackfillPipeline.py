@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pymfl.api.config import APIConfig
+from pymfl.backfill import BackfillPipeline, BackfillTask, CheckpointJournal
+from pymfl.backfill.sink import NDJSONSink
+from pymfl.exception import MFLAPIClientException
+from test.helper.helper_classes import MockResponse
+
+
+class TestBackfillPipeline(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.ndjson_path = os.path.join(self.temporary_directory.name, "backfill.ndjson")
+        self.journal_path = os.path.join(self.temporary_directory.name, "backfill.journal")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    @staticmethod
+    def __get_response(url: str, **kwargs) -> MockResponse:
+        export_type = url.split("TYPE=")[1].split("&")[0]
+        if "W=2" in url:
+            return MockResponse({"error": "Week not found"}, 200)
+        return MockResponse({export_type: {"url": url}}, 200)
+
+    def test_plan(self):
+        tasks = BackfillPipeline.plan([(2020, "1"), (2021, "2")])
+
+        self.assertEqual(1 + 17 + 2 + 1 + 18 + 2, len(tasks))
+        self.assertEqual(BackfillTask(year=2020, league_id="1", type="league"), tasks[0])
+        self.assertEqual("2020/1/weekly_results/1", tasks[1].key)
+        self.assertEqual("2021/2/weekly_results/18", tasks[-3].key)
+
+    @mock.patch("requests.Session.get")
+    def test_run_writes_responses_checkpoints_and_resumes(self, mock_requests_get):
+        mock_requests_get.side_effect = self.__get_response
+        tasks = BackfillPipeline.plan([(self.__TEST_YEAR, self.__TEST_LEAGUE_ID)], weeks=range(1, 4))
+        progress_updates = list()
+
+        with NDJSONSink(self.ndjson_path) as sink:
+            backfill_pipeline = BackfillPipeline(sink=sink, journal=CheckpointJournal(self.journal_path),
+                                                 max_concurrency=2, checkpoint_interval=2,
+                                                 on_progress=progress_updates.append)
+            report = backfill_pipeline.run(tasks)
+
+        self.assertFalse(report.ok)
+        self.assertEqual(6, report.progress.total_tasks)
+        self.assertEqual(5, report.progress.completed_tasks)
+        self.assertEqual(1, report.progress.failed_tasks)
+        self.assertEqual(0, report.progress.remaining_tasks)
+        failed_task = BackfillTask(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID, type="weekly_results",
+                                   week=2)
+        self.assertIsInstance(report.failures[failed_task], MFLAPIClientException)
+        self.assertEqual(6, len(progress_updates))
+        with open(self.ndjson_path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(5, len(lines))
+        self.assertEqual({"league", "weekly_results", "draft_results", "transactions"},
+                         {line["type"] for line in lines})
+
+        # resuming only retries the failed task
+        mock_requests_get.reset_mock()
+        mock_requests_get.side_effect = None
+        mock_requests_get.return_value = MockResponse({"weeklyResults": {"week": "2"}}, 200)
+        with NDJSONSink(self.ndjson_path) as sink:
+            report = BackfillPipeline(sink=sink, journal=CheckpointJournal(self.journal_path)).run(tasks)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(5, report.progress.skipped_tasks)
+        self.assertEqual(1, report.progress.completed_tasks)
+        self.assertEqual(1, mock_requests_get.call_count)
+        self.assertEqual(6, len(CheckpointJournal(self.journal_path)))
+
+    @mock.patch("requests.Session.get")
+    def test_written_tasks_are_checkpointed_when_interrupted(self, mock_requests_get):
+        mock_requests_get.side_effect = self.__get_response
+        tasks = BackfillPipeline.plan([(self.__TEST_YEAR, self.__TEST_LEAGUE_ID)], weeks=[1])
+
+        def interrupt(progress):
+            if progress.completed_tasks == 2:
+                raise KeyboardInterrupt()
+
+        with NDJSONSink(self.ndjson_path) as sink:
+            backfill_pipeline = BackfillPipeline(sink=sink, journal=CheckpointJournal(self.journal_path),
+                                                 max_concurrency=1, on_progress=interrupt)
+            with self.assertRaises(KeyboardInterrupt):
+                backfill_pipeline.run(tasks)
+
+        self.assertEqual(2, len(CheckpointJournal(self.journal_path)))
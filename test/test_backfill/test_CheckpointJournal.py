@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from pymfl.backfill import CheckpointJournal
+
+
+class TestCheckpointJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temporary_directory.name, "backfill.journal")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_completed_keys_are_persisted(self):
+        checkpoint_journal = CheckpointJournal(self.path)
+        checkpoint_journal.mark_completed(["2020/1/league", "2020/1/weekly_results/1"])
+        checkpoint_journal.mark_completed(["2020/1/league"])
+
+        reloaded_checkpoint_journal = CheckpointJournal(self.path)
+
+        self.assertEqual(2, len(reloaded_checkpoint_journal))
+        self.assertTrue(reloaded_checkpoint_journal.is_completed("2020/1/weekly_results/1"))
+        self.assertFalse(reloaded_checkpoint_journal.is_completed("2020/1/transactions"))
+
+    def test_partial_last_line_is_ignored(self):
+        with open(self.path, "w") as f:
+            f.write("2020/1/league\n2020/1/draft_res")
+
+        checkpoint_journal = CheckpointJournal(self.path)
+        checkpoint_journal.mark_completed(["2020/1/transactions"])
+
+        reloaded_checkpoint_journal = CheckpointJournal(self.path)
+        self.assertTrue(reloaded_checkpoint_journal.is_completed("2020/1/league"))
+        self.assertTrue(reloaded_checkpoint_journal.is_completed("2020/1/transactions"))
+        self.assertFalse(reloaded_checkpoint_journal.is_completed("2020/1/draft_res"))
+        self.assertEqual(2, len(reloaded_checkpoint_journal))
+
+    def test_clear(self):
+        checkpoint_journal = CheckpointJournal(self.path)
+        checkpoint_journal.mark_completed(["2020/1/league"])
+
+        checkpoint_journal.clear()
+
+        self.assertEqual(0, len(checkpoint_journal))
+        self.assertEqual(0, len(CheckpointJournal(self.path)))
@@ -0,0 +1,35 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pyarrow.parquet
+
+from pymfl.backfill import BackfillTask
+from pymfl.backfill.sink import ParquetSink
+
+
+class TestParquetSink(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_every_flush_writes_a_part_file(self):
+        with ParquetSink(self.temporary_directory.name) as parquet_sink:
+            parquet_sink.write(BackfillTask(year=2020, league_id="1", type="league"), {"league": {"id": "1"}})
+            parquet_sink.flush()
+            parquet_sink.flush()
+            parquet_sink.write(BackfillTask(year=2020, league_id="1", type="weekly_results", week=1),
+                               {"weeklyResults": {"week": "1"}})
+
+        part_files = sorted(os.listdir(self.temporary_directory.name))
+        self.assertEqual(2, len(part_files))
+        table = pyarrow.parquet.read_table(self.temporary_directory.name)
+        rows = sorted(table.to_pylist(), key=lambda row: row["type"])
+        self.assertEqual({"year": 2020, "league_id": "1", "type": "league", "week": None}, {
+            k: v for k, v in rows[0].items() if k != "response"})
+        self.assertEqual({"weeklyResults": {"week": "1"}}, json.loads(rows[1]["response"]))
+        self.assertEqual(1, rows[1]["week"])
@@ -0,0 +1,32 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from pymfl.backfill import BackfillTask
+from pymfl.backfill.sink import SQLiteSink
+
+
+class TestSQLiteSink(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temporary_directory.name, "backfill.sqlite")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_rewriting_a_task_replaces_its_row(self):
+        task = BackfillTask(year=2020, league_id="1", type="weekly_results", week=3)
+
+        with SQLiteSink(self.path) as sqlite_sink:
+            sqlite_sink.write(task, {"weeklyResults": {"week": "3"}})
+            sqlite_sink.write(task, {"weeklyResults": {"week": "3", "matchup": []}})
+
+        connection = sqlite3.connect(self.path)
+        rows = connection.execute("SELECT key, year, league_id, type, week, response FROM backfill").fetchall()
+        connection.close()
+        self.assertEqual(1, len(rows))
+        self.assertEqual(("2020/1/weekly_results/3", 2020, "1", "weekly_results", 3), rows[0][:5])
+        self.assertEqual({"weeklyResults": {"week": "3", "matchup": []}}, json.loads(rows[0][5]))
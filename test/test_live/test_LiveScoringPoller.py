@@ -0,0 +1,135 @@
+import threading
+import unittest
+from unittest import mock
+
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache, ValidatorCache
+from pymfl.api.config import APIConfig
+from pymfl.enum import ScoreEventType
+from pymfl.live import LiveScoringPoller, ScoreEvent
+from test.helper.helper_classes import MockResponse
+
+
+class TestLiveScoringPoller(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.original_response_cache = MFLAPIClient.get_response_cache()
+        self.original_validator_cache = MFLAPIClient.get_validator_cache()
+        MFLAPIClient.set_response_cache(ResponseCache())
+        MFLAPIClient.set_validator_cache(ValidatorCache())
+
+    def tearDown(self):
+        MFLAPIClient.set_response_cache(self.original_response_cache)
+        MFLAPIClient.set_validator_cache(self.original_validator_cache)
+
+    @staticmethod
+    def __get_live_scoring(*, score_1: str, score_2: str, player_score: str, players_currently_playing: str,
+                           game_seconds_remaining: str) -> dict:
+        return {"liveScoring": {"week": "3", "matchup": {"franchise": [
+            {"id": "0001", "score": score_1, "gameSecondsRemaining": game_seconds_remaining,
+             "playersCurrentlyPlaying": players_currently_playing,
+             "players": {"player": {"id": "13593", "score": player_score,
+                                    "gameSecondsRemaining": game_seconds_remaining}}},
+            {"id": "0002", "score": score_2, "gameSecondsRemaining": "0", "playersCurrentlyPlaying": "0",
+             "players": {"player": []}}]}}}
+
+    @mock.patch("requests.Session.get")
+    def test_poll_emits_only_changed_scores(self, mock_requests_get):
+        mock_requests_get.side_effect = [
+            MockResponse(self.__get_live_scoring(score_1="10", score_2="20", player_score="5",
+                                                 players_currently_playing="1", game_seconds_remaining="1800"), 200),
+            MockResponse(self.__get_live_scoring(score_1="10", score_2="20", player_score="5",
+                                                 players_currently_playing="1", game_seconds_remaining="1700"), 200),
+            MockResponse(self.__get_live_scoring(score_1="16", score_2="20", player_score="11",
+                                                 players_currently_playing="1", game_seconds_remaining="1600"), 200)
+        ]
+        published_events = list()
+        live_scoring_poller = LiveScoringPoller(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        live_scoring_poller.subscribe(published_events.append)
+
+        first_events = live_scoring_poller.poll()
+        second_events = live_scoring_poller.poll()
+        third_events = live_scoring_poller.poll()
+
+        self.assertEqual(3, len(first_events))
+        self.assertEqual(list(), second_events)
+        self.assertEqual([ScoreEvent(type=ScoreEventType.FRANCHISE, week=3, franchise_id="0001", player_id=None,
+                                     previous_score=10.0, score=16.0, game_seconds_remaining=1600),
+                          ScoreEvent(type=ScoreEventType.PLAYER, week=3, franchise_id="0001", player_id="13593",
+                                     previous_score=5.0, score=11.0, game_seconds_remaining=1600)], third_events)
+        self.assertIsNone(first_events[0].previous_score)
+        # subscribers are not notified of polls without changes
+        self.assertEqual([first_events, third_events], published_events)
+
+    @mock.patch("requests.Session.get")
+    def test_poll_bypasses_response_cache(self, mock_requests_get):
+        mock_requests_get.side_effect = [
+            MockResponse(self.__get_live_scoring(score_1="10", score_2="20", player_score="5",
+                                                 players_currently_playing="1", game_seconds_remaining="1800"), 200),
+            MockResponse(self.__get_live_scoring(score_1="16", score_2="20", player_score="5",
+                                                 players_currently_playing="1", game_seconds_remaining="1700"), 200)
+        ]
+        live_scoring_poller = LiveScoringPoller(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        # both polls are made within the 10 second liveScoring TTL of the ResponseCache
+        live_scoring_poller.poll()
+        second_events = live_scoring_poller.poll()
+
+        self.assertEqual(2, mock_requests_get.call_count)
+        self.assertEqual([16.0], [score_event.score for score_event in second_events])
+
+    @mock.patch("requests.Session.get")
+    def test_next_interval_adapts_to_games_in_progress(self, mock_requests_get):
+        mock_requests_get.side_effect = [
+            MockResponse(self.__get_live_scoring(score_1="10", score_2="20", player_score="5",
+                                                 players_currently_playing="1", game_seconds_remaining="1800"), 200),
+            MockResponse(self.__get_live_scoring(score_1="10", score_2="20", player_score="5",
+                                                 players_currently_playing="0", game_seconds_remaining="3600"), 200),
+            MockResponse(self.__get_live_scoring(score_1="10", score_2="20", player_score="5",
+                                                 players_currently_playing="0", game_seconds_remaining="0"), 200)
+        ]
+        live_scoring_poller = LiveScoringPoller(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID,
+                                                live_interval_seconds=1, waiting_interval_seconds=2,
+                                                idle_interval_seconds=3)
+
+        next_interval_seconds = list()
+        for _ in range(3):
+            live_scoring_poller.poll()
+            next_interval_seconds.append(live_scoring_poller.next_interval_seconds)
+
+        self.assertEqual([1, 2, 3], next_interval_seconds)
+
+    @mock.patch("requests.Session.get")
+    def test_start_polls_in_the_background_until_stopped(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse(
+            self.__get_live_scoring(score_1="10", score_2="20", player_score="5", players_currently_playing="1",
+                                    game_seconds_remaining="1800"), 200)
+        polled = threading.Event()
+        live_scoring_poller = LiveScoringPoller(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID,
+                                                live_interval_seconds=60)
+        live_scoring_poller.subscribe(lambda events: polled.set())
+
+        live_scoring_poller.start()
+        try:
+            self.assertTrue(polled.wait(5))
+        finally:
+            live_scoring_poller.stop(timeout=5)
+
+        self.assertEqual(1, mock_requests_get.call_count)
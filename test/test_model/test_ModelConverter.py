@@ -0,0 +1,99 @@
+import dataclasses
+import unittest
+
+from pymfl.model import ModelConverter, Player, PlayerScore, Roster, RosterPlayer, Transaction, LeagueStanding, \
+    WeeklyResults, Matchup, MatchupFranchise, MatchupPlayer
+
+
+class TestModelConverter(unittest.TestCase):
+
+    def test_to_players(self):
+        players_response = {"players": {"timestamp": "1",
+                                        "player": [{"id": "1", "name": "Doe, Jon", "position": "QB", "team": "BUF"},
+                                                   {"id": "2", "name": "Roe, Ron", "position": "QB", "team": "BUF"}]}}
+
+        players = ModelConverter.to_players(players_response)
+
+        self.assertEqual((Player(id="1", name="Doe, Jon", position="QB", team="BUF"),
+                          Player(id="2", name="Roe, Ron", position="QB", team="BUF")), players)
+        self.assertIs(players[0].team, players[1].team)
+
+    def test_to_rosters_with_single_franchise_and_player_as_objects(self):
+        rosters_response = {"rosters": {"franchise": {"id": "0001", "week": "3",
+                                                      "player": {"id": "13593", "status": "ROSTER", "salary": "12.5",
+                                                                 "contractYear": "", "contractInfo": ""}}}}
+
+        rosters = ModelConverter.to_rosters(rosters_response)
+
+        self.assertEqual((Roster(franchise_id="0001", week=3,
+                                 players=(RosterPlayer(id="13593", status="ROSTER", salary=12.5, contract_year=None,
+                                                       contract_info=None),)),), rosters)
+
+    def test_to_weekly_results(self):
+        franchise = {"id": "0001", "score": "101.5", "result": "W", "isHome": "1", "starters": "13593,13594,",
+                     "players": {"player": [{"id": "13593", "score": "20.25", "status": "starter", "shouldStart": "1"},
+                                            {"id": "13594", "score": "", "status": "starter", "shouldStart": "0"}]}}
+        expected_weekly_results = WeeklyResults(
+            week=1,
+            matchups=(Matchup(franchises=(MatchupFranchise(id="0001", score=101.5, result="W", is_home=True,
+                                                           starters=("13593", "13594"),
+                                                           players=(MatchupPlayer(id="13593", score=20.25,
+                                                                                  status="starter", should_start=True),
+                                                                    MatchupPlayer(id="13594", score=None,
+                                                                                  status="starter",
+                                                                                  should_start=False))),)),),
+            franchises=tuple())
+
+        weekly_results = ModelConverter.to_weekly_results({"weeklyResults": {"week": "1",
+                                                                             "matchup": {"franchise": [franchise]}}})
+        all_weekly_results = ModelConverter.to_weekly_results(
+            {"allWeeklyResults": {"weeklyResults": [{"week": "1", "matchup": [{"franchise": franchise}]},
+                                                    {"week": "2"}]}})
+
+        self.assertEqual((expected_weekly_results,), weekly_results)
+        self.assertEqual(2, len(all_weekly_results))
+        self.assertEqual(expected_weekly_results, all_weekly_results[0])
+        self.assertEqual(WeeklyResults(week=2, matchups=tuple(), franchises=tuple()), all_weekly_results[1])
+
+    def test_to_player_scores(self):
+        player_scores_response = {"playerScores": {"week": "1",
+                                                   "playerScore": [{"id": "1", "score": "10.5", "isAvailable": "0"},
+                                                                   {"id": "2", "score": ""}]}}
+
+        player_scores = ModelConverter.to_player_scores(player_scores_response)
+
+        self.assertEqual((PlayerScore(id="1", score=10.5, is_available=False),
+                          PlayerScore(id="2", score=None, is_available=None)), player_scores)
+
+    def test_to_transactions(self):
+        transactions_response = {"transactions": {"transaction": [
+            {"type": "TRADE", "franchise": "0001", "franchise2": "0002", "franchise1_gave_up": "13593,",
+             "franchise2_gave_up": "13594,", "comments": "", "timestamp": "1600000000"},
+            {"type": "FREE_AGENT", "franchise": "0003", "transaction": "13595,|", "timestamp": "1600000001"}]}}
+
+        transactions = ModelConverter.to_transactions(transactions_response)
+
+        self.assertEqual((Transaction(type="TRADE", franchise_id="0001", timestamp=1600000000, transaction=None,
+                                      franchise2_id="0002", franchise1_gave_up="13593,",
+                                      franchise2_gave_up="13594,", comments=None),
+                          Transaction(type="FREE_AGENT", franchise_id="0003", timestamp=1600000001,
+                                      transaction="13595,|", franchise2_id=None, franchise1_gave_up=None,
+                                      franchise2_gave_up=None, comments=None)), transactions)
+
+    def test_to_league_standings(self):
+        league_standings_response = {"leagueStandings": {"franchise": [
+            {"id": "0001", "h2hw": "5", "h2hl": "3", "h2ht": "0", "all_play_w": "40", "all_play_l": "30",
+             "all_play_t": "2", "pf": "1000.5", "pa": "900", "pp": "1100.25"}]}}
+
+        league_standings = ModelConverter.to_league_standings(league_standings_response)
+
+        self.assertEqual((LeagueStanding(franchise_id="0001", h2h_wins=5, h2h_losses=3, h2h_ties=0, all_play_wins=40,
+                                         all_play_losses=30, all_play_ties=2, points_for=1000.5, points_against=900.0,
+                                         potential_points=1100.25),), league_standings)
+
+    def test_models_are_slotted_and_immutable(self):
+        player_score = PlayerScore(id="1", score=10.5, is_available=False)
+
+        self.assertFalse(hasattr(player_score, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            player_score.score = 11.0
@@ -0,0 +1,72 @@
+import unittest
+
+from pymfl.model import Player
+from pymfl.player import PlayerIndex
+
+
+class TestPlayerIndex(unittest.TestCase):
+    __TEST_RESPONSE = {"players": {"timestamp": "1000", "player": [
+        {"id": "4925", "name": "Brady, Tom", "position": "QB", "team": "TBB"},
+        {"id": "11247", "name": "Brady, Marcus", "position": "QB", "team": "FA"},
+        {"id": "10700", "name": "Kelce, Travis", "position": "TE", "team": "KCC"},
+        {"id": "13116", "name": "Mahomes, Patrick", "position": "QB", "team": "KCC"},
+        {"id": "0501", "name": "Chiefs, Kansas City", "position": "Def", "team": "KCC"}
+    ]}}
+
+    def setUp(self):
+        self.player_index = PlayerIndex.from_response(self.__TEST_RESPONSE)
+
+    def test_get_happy_path(self):
+        entry = self.player_index.get("4925")
+
+        self.assertIsInstance(entry, Player)
+        self.assertEqual("Brady, Tom", entry.name)
+        self.assertEqual("Tom", entry.first_name)
+        self.assertEqual("Brady", entry.last_name)
+        self.assertEqual("QB", entry.position)
+        self.assertEqual("TBB", entry.team)
+        self.assertIsNone(self.player_index.get("missing"))
+        self.assertEqual(5, len(self.player_index))
+        self.assertIn("10700", self.player_index)
+
+    def test_players_are_compact_and_read_only(self):
+        entry = self.player_index.get("4925")
+
+        self.assertFalse(hasattr(entry, "__dict__"))
+        with self.assertRaises(AttributeError):
+            entry.team = "FA"
+
+    def test_from_response_accepts_single_player(self):
+        player_index = PlayerIndex.from_response({"players": {"player": {"id": "1", "name": "Brady, Tom"}}})
+
+        self.assertEqual("Brady, Tom", player_index.get("1").name)
+
+    def test_resolve(self):
+        entries = self.player_index.resolve(["10700", "missing", "4925"])
+
+        self.assertEqual(["Kelce, Travis", None, "Brady, Tom"], [e.name if e else None for e in entries])
+
+    def test_search_prefix(self):
+        self.assertEqual({"4925", "11247"}, {e.id for e in self.player_index.search_prefix("brad")})
+        self.assertEqual(["4925"], [e.id for e in self.player_index.search_prefix("Tom B")])
+        self.assertEqual(["4925"], [e.id for e in self.player_index.search_prefix("brady, t")])
+        self.assertEqual(["0501"], [e.id for e in self.player_index.search_prefix("kansas")])
+        self.assertEqual(1, len(self.player_index.search_prefix("brady", limit=1)))
+        self.assertEqual([], self.player_index.search_prefix("zzz"))
+        self.assertEqual([], self.player_index.search_prefix(""))
+
+    def test_search_fuzzy(self):
+        entries = self.player_index.search_fuzzy("Patrik Mahomse")
+
+        self.assertEqual("13116", entries[0].id)
+        self.assertEqual("10700", self.player_index.search_fuzzy("travis kelcy", limit=1)[0].id)
+        self.assertEqual([], self.player_index.search_fuzzy("zzzzzz"))
+
+    def test_filter(self):
+        self.assertEqual({"4925", "11247", "13116"}, {e.id for e in self.player_index.filter(position="QB")})
+        self.assertEqual({"10700", "13116", "0501"}, {e.id for e in self.player_index.filter(team="KCC")})
+        self.assertEqual(["13116"], [e.id for e in self.player_index.filter(position="QB", team="KCC")])
+        self.assertEqual(5, len(self.player_index.filter()))
+        self.assertEqual([], self.player_index.filter(position="K"))
+        self.assertEqual(["Def", "QB", "TE"], self.player_index.get_positions())
+        self.assertEqual(["FA", "KCC", "TBB"], self.player_index.get_teams())
@@ -0,0 +1,98 @@
+import math
+import unittest
+from unittest import mock
+
+import numpy
+
+from pymfl.api.config import APIConfig
+from pymfl.player import PlayerIndex, PlayerScoreMatrix
+from test.helper.helper_classes import MockResponse
+
+
+class TestPlayerScoreMatrix(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+    __TEST_RESPONSES_BY_WEEK = {
+        1: {"playerScores": {"week": "1", "playerScore": [{"id": "4925", "score": "20"},
+                                                          {"id": "10700", "score": "10"},
+                                                          {"id": "13116", "score": "30"}]}},
+        2: {"playerScores": {"week": "2", "playerScore": [{"id": "4925", "score": "10"},
+                                                          {"id": "10700", "score": ""},
+                                                          {"id": "13116", "score": "30"}]}},
+        3: {"playerScores": {"week": "3", "playerScore": {"id": "4925", "score": "30"}}}
+    }
+    __TEST_PLAYER_INDEX = PlayerIndex.from_response({"players": {"player": [
+        {"id": "4925", "name": "Brady, Tom", "position": "QB", "team": "TBB"},
+        {"id": "10700", "name": "Kelce, Travis", "position": "TE", "team": "KCC"},
+        {"id": "13116", "name": "Mahomes, Patrick", "position": "QB", "team": "KCC"}]}})
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.player_score_matrix = PlayerScoreMatrix.from_responses(self.__TEST_RESPONSES_BY_WEEK,
+                                                                    player_index=self.__TEST_PLAYER_INDEX)
+
+    def test_from_responses(self):
+        self.assertEqual((1, 2, 3), self.player_score_matrix.weeks)
+        self.assertEqual(("4925", "10700", "13116"), self.player_score_matrix.player_ids)
+        self.assertEqual(numpy.float32, self.player_score_matrix.scores.dtype)
+        numpy.testing.assert_array_equal([[20, 10, 30], [10, numpy.nan, 30], [30, numpy.nan, numpy.nan]],
+                                         self.player_score_matrix.scores)
+        numpy.testing.assert_array_equal([20, 10, 30], self.player_score_matrix.get_player_scores("4925"))
+        self.assertEqual(1, self.player_score_matrix.get_week_index(2))
+
+    def test_statistics(self):
+        numpy.testing.assert_array_equal([3, 1, 2], self.player_score_matrix.get_games_played())
+        numpy.testing.assert_array_equal([60, 10, 60], self.player_score_matrix.get_totals())
+        numpy.testing.assert_array_equal([20, 10, 30], self.player_score_matrix.get_averages())
+        numpy.testing.assert_allclose([math.sqrt(200 / 3), 0, 0], self.player_score_matrix.get_standard_deviations())
+        numpy.testing.assert_allclose([math.sqrt(200 / 3) / 20, 0, 0], self.player_score_matrix.get_consistency())
+
+    def test_get_rolling_averages(self):
+        rolling_averages = self.player_score_matrix.get_rolling_averages(2)
+
+        numpy.testing.assert_array_equal([[20, 10, 30], [15, 10, 30], [20, numpy.nan, 30]], rolling_averages)
+        with self.assertRaises(ValueError):
+            self.player_score_matrix.get_rolling_averages(0)
+
+    def test_get_top(self):
+        totals = self.player_score_matrix.get_totals()
+
+        self.assertEqual([("4925", 60.0), ("13116", 60.0)], self.player_score_matrix.get_top(totals, 2))
+        self.assertEqual([("13116", 30.0)],
+                         self.player_score_matrix.get_top(self.player_score_matrix.get_averages(), 1, position="QB"))
+        self.assertEqual([("10700", 10.0)], self.player_score_matrix.get_top(totals, 5, position="TE"))
+        self.assertEqual(list(), self.player_score_matrix.get_top(totals, 5, position="K"))
+
+    @mock.patch("requests.Session.get")
+    def test_build_fetches_every_week(self, mock_requests_get):
+        def get_response(url, **kwargs):
+            week = int(url.split("W=")[1])
+            return MockResponse(self.__TEST_RESPONSES_BY_WEEK[week], 200)
+
+        mock_requests_get.side_effect = get_response
+        player_score_matrix = PlayerScoreMatrix.build(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID,
+                                                      weeks=range(1, 4))
+
+        self.assertEqual(3, mock_requests_get.call_count)
+        numpy.testing.assert_array_equal(self.player_score_matrix.scores, player_score_matrix.scores)
+
+    @mock.patch("requests.Session.get")
+    def test_build_defaults_to_every_week_of_the_season(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse(self.__TEST_RESPONSES_BY_WEEK[3], 200)
+        player_score_matrix = PlayerScoreMatrix.build(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertEqual(tuple(range(1, 18)), player_score_matrix.weeks)
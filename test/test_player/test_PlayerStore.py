@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pymfl.api import FantasyContentAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ResponseCache
+from pymfl.api.config import APIConfig
+from pymfl.player import PlayerStore
+from test.helper.helper_classes import MockResponse
+
+
+class TestPlayerStore(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def setUp(self):
+        self.original_response_cache = MFLAPIClient.get_response_cache()
+        MFLAPIClient.set_response_cache(ResponseCache())
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temporary_directory.name, "players.json")
+
+    def tearDown(self):
+        MFLAPIClient.set_response_cache(self.original_response_cache)
+        self.temporary_directory.cleanup()
+
+    @mock.patch("requests.Session.get")
+    def test_sync_applies_since_deltas(self, mock_requests_get):
+        full_response = {"players": {"timestamp": "1000", "player": [
+            {"id": "1", "name": "Brady, Tom", "position": "QB", "team": "TBB"},
+            {"id": "2", "name": "Kelce, Travis", "position": "TE", "team": "KCC"}]}}
+        delta_response = {"players": {"timestamp": "2000", "player":
+            {"id": "1", "name": "Brady, Tom", "position": "QB", "team": "FA"}}}
+        mock_requests_get.side_effect = [MockResponse(full_response, 200), MockResponse(delta_response, 200)]
+        player_store = PlayerStore(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID, path=self.path)
+
+        self.assertEqual(2, player_store.sync())
+        self.assertEqual(1000, player_store.last_sync_timestamp)
+        self.assertEqual(1, player_store.sync())
+        self.assertEqual(2000, player_store.last_sync_timestamp)
+        self.assertEqual(2, len(player_store))
+        self.assertEqual("FA", player_store.get_player("1")["team"])
+        self.assertEqual("KCC", player_store.get_player("2")["team"])
+        self.assertNotIn("SINCE", mock_requests_get.call_args_list[0].args[0])
+        self.assertIn("SINCE=1000", mock_requests_get.call_args_list[1].args[0])
+
+    @mock.patch("requests.Session.get")
+    def test_sync_never_uses_cached_responses(self, mock_requests_get):
+        cached_response = {"players": {"timestamp": "500", "player": [{"id": "1", "name": "Brady, T."}]}}
+        full_response = {"players": {"timestamp": "1000", "player": [{"id": "1", "name": "Brady, Tom"}]}}
+        delta_response = {"players": {"timestamp": "1000", "player": {"id": "1", "name": "Brady, Thomas"}}}
+        mock_requests_get.side_effect = [MockResponse(cached_response, 200),
+                                         MockResponse(full_response, 200),
+                                         MockResponse({"players": {"timestamp": "1000"}}, 200),
+                                         MockResponse(delta_response, 200)]
+        FantasyContentAPIClient.get_players(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        player_store = PlayerStore(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+
+        self.assertEqual(1, player_store.sync())
+        self.assertEqual(1000, player_store.last_sync_timestamp)
+        # the timestamp does not move until the player database changes, so the same delta url is requested again
+        self.assertEqual(0, player_store.sync())
+        self.assertEqual(1, player_store.sync())
+        self.assertEqual("Brady, Thomas", player_store.get_player("1")["name"])
+        self.assertEqual(4, mock_requests_get.call_count)
+
+    @mock.patch("requests.Session.get")
+    def test_sync_resumes_from_persisted_timestamp(self, mock_requests_get):
+        full_response = {"players": {"timestamp": "1000", "player": [{"id": "1", "name": "Brady, Tom"}]}}
+        mock_requests_get.side_effect = [MockResponse(full_response, 200),
+                                         MockResponse({"players": {"timestamp": "2000"}}, 200)]
+        PlayerStore(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID, path=self.path).sync()
+        player_store = PlayerStore(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID, path=self.path)
+
+        self.assertEqual(1000, player_store.last_sync_timestamp)
+        self.assertEqual("Brady, Tom", player_store.get_player("1")["name"])
+        self.assertEqual(0, player_store.sync())
+        self.assertIn("SINCE=1000", mock_requests_get.call_args_list[1].args[0])
+        self.assertEqual(2000, PlayerStore(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID,
+                                           path=self.path).last_sync_timestamp)
+
+    @mock.patch("requests.Session.get")
+    def test_persisted_store_for_other_details_is_ignored(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"players": {"timestamp": "1000", "player": []}}, 200)
+        PlayerStore(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID, path=self.path).sync()
+        player_store = PlayerStore(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID, path=self.path,
+                                   details=True)
+
+        self.assertIsNone(player_store.last_sync_timestamp)
@@ -0,0 +1,58 @@
+import json
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ValidatorCache
+from pymfl.api.config import APIConfig
+from pymfl.util import JSONDecoder
+from test.helper.helper_classes import MockResponse
+
+
+class TestJSONDecoder(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def test_decode_bytes_matches_stdlib(self):
+        content = json.dumps({"players": {"player": [{"id": "1", "name": "Doe, Jon"}]}}).encode("utf-8")
+
+        self.assertEqual(json.loads(content), JSONDecoder().decode(content))
+        self.assertEqual(json.loads(content), JSONDecoder(json.loads).decode(content))
+
+    def test_falls_back_to_stdlib_when_no_fast_decoder_is_installed(self):
+        with mock.patch.dict("sys.modules", {"orjson": None, "ujson": None}):
+            self.assertIs(json.loads, JSONDecoder.get_fastest_loads())
+            self.assertEqual("json", JSONDecoder().name)
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_decode_with_the_configured_decoder(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse(dict(), 200, content=b'{"k": "v"}')
+        mock_loads = mock.Mock(return_value={"k": "decoded"})
+        original_json_decoder = MFLAPIClient.get_json_decoder()
+        original_validator_cache = MFLAPIClient.get_validator_cache()
+        MFLAPIClient.set_json_decoder(JSONDecoder(mock_loads))
+        MFLAPIClient.set_validator_cache(ValidatorCache())
+        try:
+            response = CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_json_decoder(original_json_decoder)
+            MFLAPIClient.set_validator_cache(original_validator_cache)
+
+        mock_loads.assert_called_once_with(b'{"k": "v"}')
+        self.assertEqual({"k": "decoded"}, response)
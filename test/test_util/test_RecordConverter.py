@@ -0,0 +1,23 @@
+import unittest
+
+from pymfl.util import RecordConverter
+
+
+class TestRecordConverter(unittest.TestCase):
+
+    def test_as_list_normalizes_single_record_and_none(self):
+        records = [{"id": "1"}, {"id": "2"}]
+        self.assertEqual([{"id": "1"}], RecordConverter.as_list({"id": "1"}))
+        self.assertEqual(list(), RecordConverter.as_list(None))
+        self.assertIs(records, RecordConverter.as_list(records))
+
+    def test_to_int_and_to_float_treat_empty_as_none(self):
+        self.assertEqual(12, RecordConverter.to_int("12"))
+        self.assertEqual(12.5, RecordConverter.to_float("12.5"))
+        self.assertIsNone(RecordConverter.to_int(""))
+        self.assertIsNone(RecordConverter.to_float(None))
+
+    def test_to_bool(self):
+        self.assertTrue(RecordConverter.to_bool("1"))
+        self.assertFalse(RecordConverter.to_bool("0"))
+        self.assertIsNone(RecordConverter.to_bool(""))
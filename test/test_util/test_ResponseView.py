@@ -0,0 +1,89 @@
+import json
+import unittest
+from unittest import mock
+
+from pymfl.api import CommonLeagueInfoAPIClient
+from pymfl.api.MFLAPIClient import MFLAPIClient
+from pymfl.api.cache import ValidatorCache
+from pymfl.api.config import APIConfig
+from pymfl.exception import MFLAPIClientException
+from pymfl.util import ResponseView
+from test.helper.helper_classes import MockResponse
+
+
+class TestResponseView(unittest.TestCase):
+    __TEST_YEAR = 2020
+    __TEST_LEAGUE_ID = "12345"
+    __TEST_USERNAME = "username"
+    __TEST_PASSWORD = "password"
+    __TEST_USER_AGENT_NAME = "user_agent_name"
+    __TEST_ROSTERS = {"rosters": {"franchise": [{"id": "0001", "player": {"id": "13593", "status": "ROSTER"}},
+                                                {"id": "0002", "player": [{"id": "13594", "status": "ROSTER"},
+                                                                          {"id": "13595", "status": "IR"}]}]},
+                      "version": "1.0"}
+
+    @classmethod
+    @mock.patch("requests.Session.post")
+    def setUpClass(cls, mock_requests_post):
+        mock_xml = """<status MFL_USER_ID="test_user_id=">OK</status>"""
+        mock_response = MockResponse(dict(), 200, content=mock_xml)
+        mock_requests_post.return_value = mock_response
+        APIConfig.add_config_for_year_and_league_id(year=cls.__TEST_YEAR,
+                                                    league_id=cls.__TEST_LEAGUE_ID,
+                                                    username=cls.__TEST_USERNAME,
+                                                    password=cls.__TEST_PASSWORD,
+                                                    user_agent_name=cls.__TEST_USER_AGENT_NAME)
+
+    def test_view_is_decoded_on_first_access_and_memoized(self):
+        raw = json.dumps(self.__TEST_ROSTERS).encode()
+        response_view = ResponseView(raw)
+
+        self.assertFalse(response_view.is_decoded)
+        self.assertIs(raw, response_view.raw)
+
+        franchises = response_view["rosters"]["franchise"]
+
+        self.assertTrue(response_view.is_decoded)
+        self.assertIs(franchises, response_view["rosters"]["franchise"])
+        self.assertIs(franchises[0], response_view["rosters"]["franchise"][0])
+        self.assertEqual(self.__TEST_ROSTERS, response_view)
+        self.assertEqual(self.__TEST_ROSTERS, response_view.to_dict())
+
+    def test_get_list_and_find(self):
+        response_view = ResponseView(json.dumps(self.__TEST_ROSTERS).encode())
+
+        franchise = response_view["rosters"].find("franchise", id="0001")
+
+        self.assertEqual(2, len(response_view["rosters"].get_list("franchise")))
+        self.assertEqual([{"id": "13593", "status": "ROSTER"}], franchise.get_list("player"))
+        injured_player = response_view["rosters"].find("franchise", id="0002").find("player", status="IR")
+        self.assertEqual("13595", injured_player["id"])
+        self.assertIsNone(response_view["rosters"].find("franchise", id="0003"))
+        self.assertEqual(list(), franchise.get_list("missing"))
+
+    @mock.patch("requests.Session.get")
+    def test_api_clients_return_views_within_lazy_responses(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse(self.__TEST_ROSTERS, 200)
+        original_validator_cache = MFLAPIClient.get_validator_cache()
+        MFLAPIClient.set_validator_cache(ValidatorCache())
+        try:
+            with MFLAPIClient.lazy_responses(), mock.patch.object(MFLAPIClient, "_LAZY_ERROR_CHECK_MAX_BYTES", 0):
+                lazy_response = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR,
+                                                                      league_id=self.__TEST_LEAGUE_ID)
+            response = CommonLeagueInfoAPIClient.get_rosters(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        finally:
+            MFLAPIClient.set_validator_cache(original_validator_cache)
+
+        self.assertIsInstance(lazy_response, ResponseView)
+        self.assertFalse(lazy_response.is_decoded)
+        self.assertEqual(response, lazy_response)
+        self.assertIsInstance(response, dict)
+
+    @mock.patch("requests.Session.get")
+    def test_small_lazy_error_payload_raises_mfl_api_client_exception(self, mock_requests_get):
+        mock_requests_get.return_value = MockResponse({"error": "Invalid league"}, 200)
+
+        with MFLAPIClient.lazy_responses():
+            with self.assertRaises(MFLAPIClientException) as context:
+                CommonLeagueInfoAPIClient.get_league(year=self.__TEST_YEAR, league_id=self.__TEST_LEAGUE_ID)
+        self.assertEqual("Invalid league", str(context.exception))
@@ -0,0 +1,29 @@
+import unittest
+
+from pymfl.exception import MFLAPIClientException
+from pymfl.util import XMLRecordParser
+
+
+class TestXMLRecordParser(unittest.TestCase):
+
+    def test_records_are_returned_as_soon_as_they_are_read(self):
+        xml_parser = XMLRecordParser("player")
+
+        self.assertEqual(list(), xml_parser.feed(b'<players timestamp="1"><player id="1" name="Doe, J'))
+        self.assertEqual([{"id": "1", "name": "Doe, Jon"}], xml_parser.feed(b'on"/><player id="2" '))
+        self.assertEqual([{"id": "2", "name": "Roe, Ron"}], xml_parser.feed(b'name="Roe, Ron"/></players>'))
+        self.assertEqual(list(), xml_parser.close())
+
+    def test_nested_records_are_returned(self):
+        xml_parser = XMLRecordParser("transaction")
+
+        records = xml_parser.feed(b'<transactions><week><transaction type="IR"/></week></transactions>')
+
+        self.assertEqual([{"type": "IR"}], records)
+
+    def test_error_payload_raises_mfl_api_client_exception(self):
+        xml_parser = XMLRecordParser("transaction")
+
+        with self.assertRaises(MFLAPIClientException) as context:
+            xml_parser.feed(b"<error>Invalid league</error>")
+        self.assertEqual("Invalid league", str(context.exception))